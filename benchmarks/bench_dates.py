@@ -0,0 +1,86 @@
+"""
+Benchmark the date-parsing engine against calling dateutil on every string
+
+The corpus mixes ISO-8601 datetime attributes and JSON-LD values (the bulk of real inputs) with
+the CNN and CNBC display formats, repeated the way listing cards and article pages repeat them.
+
+Usage: python benchmarks/bench_dates.py [--dates N] [--repeat N]
+"""
+import argparse
+import random
+import sys
+import time
+import warnings
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the repository root to Python path so the src package can be imported
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root))
+
+from dateutil import parser as dateutil_parser
+from src.utils.date_parser import parse_article_date, _parse_uncached, _parse_cached
+
+
+def dateutil_only(date_string: str):
+    """Every string straight through dateutil, as before the engine"""
+    try:
+        parsed = dateutil_parser.parse(date_string.strip())
+    except (ValueError, TypeError, OverflowError):
+        return None
+    return parsed.replace(tzinfo=timezone.utc) if parsed.tzinfo is None else parsed.astimezone(timezone.utc)
+
+
+def build_corpus(count: int, seed: int = 11):
+    """
+    Date strings in the proportions seen on the sources: about 80% ISO-8601, the rest display formats
+    """
+    rng = random.Random(seed)
+    base = datetime(2025, 11, 3, tzinfo=timezone.utc)
+    distinct = []
+    for _ in range(max(1, count // 3)):
+        moment = base - timedelta(minutes=rng.randrange(60 * 24 * 7))
+        roll = rng.random()
+        if roll < 0.5:
+            distinct.append(moment.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        elif roll < 0.8:
+            distinct.append(moment.astimezone(timezone(timedelta(hours=-5))).isoformat())
+        elif roll < 0.9:
+            distinct.append(moment.strftime("Updated %I:%M %p EST, %a %B %d, %Y"))
+        else:
+            distinct.append(moment.strftime("Published %a, %b %d %Y %I:%M %p EST"))
+    return [rng.choice(distinct) for _ in range(count)]
+
+
+def run_benchmark(dates: int = 20000, repeat: int = 3):
+    """
+    Print microseconds per date string for each variant
+    """
+    corpus = build_corpus(dates)
+    print(f"Dates: {len(corpus)} ({len(set(corpus))} distinct)")
+
+    def memoized():
+        _parse_cached.cache_clear()
+        return [parse_article_date(value) for value in corpus]
+
+    variants = {
+        'dateutil only': lambda: [dateutil_only(value) for value in corpus],
+        'engine': lambda: [_parse_uncached(value.strip()) for value in corpus],
+        'engine memoized': memoized,
+    }
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # dateutil warns about the EST abbreviation
+        for name, variant in variants.items():
+            variant()  # Warm up
+            start = time.perf_counter()
+            for _ in range(repeat):
+                variant()
+            print(f"{name:<18}{(time.perf_counter() - start) * 1e6 / (repeat * len(corpus)):>8.2f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark article date parsing")
+    parser.add_argument("--dates", type=int, default=20000, help="Number of date strings to parse")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the corpus per variant")
+    args = parser.parse_args()
+    run_benchmark(args.dates, args.repeat)
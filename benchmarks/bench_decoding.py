@@ -0,0 +1,86 @@
+"""
+Benchmark parsing from decoded response text versus raw response bytes with the declared charset
+
+Only lxml parses the bytes directly; with other backends make_soup decodes them first, so both
+rows measure the same work there.
+
+Usage: python benchmarks/bench_decoding.py [--copies N] [--repeat N]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+import httpx
+
+# Add the repository root to Python path so the src package can be imported
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root))
+
+from src.cnn_parser import parse_cnn_article
+from src.utils.html_parsing import make_soup, get_parser_backend
+
+
+FIXTURE = repo_root / "tests" / "fixtures" / "html" / "cnn_article.html"
+URL = "https://www.cnn.com/2025/11/03/business/fed-rates-inflation/index.html"
+
+
+def build_page(copies: int) -> bytes:
+    """
+    Grow the CNN article fixture into a large page by repeating its body paragraphs
+    """
+    html = FIXTURE.read_text(encoding="utf-8")
+    start = html.index('<p class="paragraph')
+    end = html.index('</div>\n      </div>\n    </section>')
+    return (html[:start] + html[start:end] * copies + html[end:]).encode("utf-8")
+
+
+def _response(body: bytes) -> httpx.Response:
+    return httpx.Response(200, content=body, headers={'content-type': 'text/html; charset=utf-8'})
+
+
+def _from_text(body: bytes):
+    return make_soup(_response(body).text)
+
+
+def _from_bytes(body: bytes):
+    response = _response(body)
+    return make_soup(response.content, encoding=response.charset_encoding)
+
+
+def _measure(func, body: bytes, repeat: int):
+    func(body)  # Warm up
+    # Best of the runs, since scheduling noise only ever adds time
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(body)
+        timings.append(time.perf_counter() - start)
+    elapsed_ms = min(timings) * 1000
+
+    tracemalloc.start()
+    func(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 1024
+
+
+def run_benchmark(copies: int = 200, repeat: int = 10):
+    """
+    Print per-page latency and peak traced memory of decoding and building the tree both ways
+    """
+    body = build_page(copies)
+    response = _response(body)
+    assert parse_cnn_article(response.text, URL) == parse_cnn_article(response.content, URL, encoding=response.charset_encoding)
+    print(f"Page: {len(body) / 1024:.0f} KiB, backend: {get_parser_backend()}")
+    for label, func in (("response.text", _from_text), ("content + charset", _from_bytes)):
+        elapsed_ms, peak_kib = _measure(func, body, repeat)
+        print(f"{label:<20}{elapsed_ms:>10.2f} ms{peak_kib:>12.0f} KiB peak")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parsing from text versus bytes")
+    parser.add_argument("--copies", type=int, default=200, help="Times the article body is repeated")
+    parser.add_argument("--repeat", type=int, default=10, help="Parses per variant")
+    args = parser.parse_args()
+    run_benchmark(args.copies, args.repeat)
@@ -0,0 +1,70 @@
+"""
+Benchmark landing-page link discovery with a full parse versus the parse-time listing filter
+
+Usage: python benchmarks/bench_discovery.py [--cards N] [--repeat N]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add the repository root to Python path so the src package can be imported
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root))
+
+from src.utils.html_parsing import make_soup, get_parser_backend, LISTING_LINK_FILTER
+
+
+FIXTURE = repo_root / "tests" / "fixtures" / "html" / "cnn_landing.html"
+
+
+def build_landing_page(cards: int) -> str:
+    """
+    Grow the CNN landing fixture to a realistic size by repeating its cards and page chrome
+    """
+    html = FIXTURE.read_text(encoding="utf-8")
+    head, rest = html.split("<main>", 1)
+    main, tail = rest.split("</main>", 1)
+    script = "<script>window.__data = {" + ",".join(f'"k{i}": {i}' for i in range(200)) + "};</script>"
+    body = "".join(main.replace("/2025/11/03/", f"/2025/11/{3 + i % 20:02d}/") + script for i in range(cards))
+    return head + "<main>" + body + "</main>" + tail
+
+
+def _discover(html: str, backend: str, parse_only=None) -> int:
+    soup = make_soup(html, backend, parse_only=parse_only)
+    return len(soup.find_all('a', href=True))
+
+
+def _measure(html: str, backend: str, parse_only, repeat: int):
+    _discover(html, backend, parse_only)  # Warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        links = _discover(html, backend, parse_only)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    tracemalloc.start()
+    _discover(html, backend, parse_only)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return links, elapsed_ms, peak / 1024
+
+
+def run_benchmark(cards: int = 100, repeat: int = 10):
+    """
+    Print parse time and peak traced memory of discovery with and without the listing filter
+    """
+    html = build_landing_page(cards)
+    backend = get_parser_backend()
+    print(f"Landing page: {len(html) / 1024:.0f} KiB, backend: {backend}")
+    for label, parse_only in (("full tree", None), ("listing filter", LISTING_LINK_FILTER)):
+        links, elapsed_ms, peak_kib = _measure(html, backend, parse_only, repeat)
+        print(f"{label:<16}{links:>6} links{elapsed_ms:>10.2f} ms{peak_kib:>12.0f} KiB peak")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark landing-page link discovery")
+    parser.add_argument("--cards", type=int, default=100, help="Times the fixture cards are repeated")
+    parser.add_argument("--repeat", type=int, default=10, help="Parses per variant")
+    args = parser.parse_args()
+    run_benchmark(args.cards, args.repeat)
@@ -0,0 +1,81 @@
+"""
+Benchmark SimHash lookups in the permuted-table index against scanning the whole archive
+
+The archive holds fingerprints of synthetic article bodies plus random fingerprints standing in
+for older articles. Queries are light rewrites of archived bodies (which should match) and new
+bodies (which should not).
+
+Usage: python benchmarks/bench_fingerprints.py [--archive N] [--queries N] [--max-distance K]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the repository root to Python path so the src package can be imported
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root))
+
+from src.utils.simhash import SimHashIndex, simhash, hamming_distance
+
+
+def run_benchmark(archive: int = 100000, queries: int = 1000, max_distance: int = 6, words: int = 400, seed: int = 17,
+                  scan_sample: int = 100):
+    """
+    Print fingerprinting cost, microseconds per lookup for each method, and match rates
+    """
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(20000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]  # Zipf-like word frequencies
+
+    def body():
+        return rng.choices(vocabulary, weights, k=words)
+
+    stories = [body() for _ in range(queries)]
+    start = time.perf_counter()
+    fingerprints = [simhash(' '.join(story)) for story in stories]
+    print(f"Fingerprint: {(time.perf_counter() - start) * 1e3 / len(stories):.2f} ms per {words}-word body")
+
+    index = SimHashIndex(max_distance)
+    stored = {}
+    for key, fingerprint in enumerate(fingerprints):
+        stored[key] = fingerprint
+    for key in range(len(fingerprints), archive):
+        stored[key] = rng.getrandbits(64)
+    for key, fingerprint in stored.items():
+        index.insert(key, fingerprint)
+
+    lookups = []
+    for key, story in enumerate(stories):
+        if key % 2:
+            lookups.append((simhash(' '.join(body())), None))
+        else:
+            rewrite = list(story)
+            for position in rng.sample(range(len(rewrite)), int(len(rewrite) * rng.uniform(0.01, 0.05))):
+                rewrite[position] = rng.choices(vocabulary, weights)[0]
+            lookups.append((simhash(' '.join(rewrite)), key))
+    print(f"Archive: {len(stored)} fingerprints, {len(lookups)} lookups, max distance {max_distance}")
+
+    # Scanning the archive is slow, so it is timed on a sample of the lookups
+    start = time.perf_counter()
+    for fingerprint, expected in lookups[:scan_sample]:
+        [key for key, value in stored.items() if hamming_distance(fingerprint, value) <= max_distance]
+    print(f"{'linear scan':<18}{(time.perf_counter() - start) * 1e6 / scan_sample:>10.1f} us")
+
+    start = time.perf_counter()
+    results = [[key for key, distance in index.query(fingerprint)] for fingerprint, expected in lookups]
+    per_lookup = (time.perf_counter() - start) * 1e6 / len(lookups)
+    rewrites = [expected in found for (fingerprint, expected), found in zip(lookups, results) if expected is not None]
+    false_matches = sum(1 for (fingerprint, expected), found in zip(lookups, results) if expected is None and found)
+    print(f"{'permuted tables':<18}{per_lookup:>10.1f} us  rewrites matched {sum(rewrites) / len(rewrites):.3f}"
+          f"  new bodies matched {false_matches}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark SimHash fingerprint lookups")
+    parser.add_argument("--archive", type=int, default=100000, help="Number of stored fingerprints")
+    parser.add_argument("--queries", type=int, default=1000, help="Number of lookups")
+    parser.add_argument("--max-distance", type=int, default=6, help="Hamming distance that counts as a match")
+    args = parser.parse_args()
+    run_benchmark(args.archive, args.queries, args.max_distance)
@@ -0,0 +1,87 @@
+"""
+Benchmark MinHash-LSH near-duplicate detection against comparing every pair of articles
+
+The corpus is synthetic article bodies with about one in ten being a rewritten copy of an
+earlier story (a few percent of the words replaced), the way a syndicated story shows up on
+both sources. Pairwise comparison is timed on a sample and extrapolated to n(n-1)/2 pairs.
+
+Usage: python benchmarks/bench_near_duplicates.py [--articles N] [--words N] [--threshold T]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the repository root to Python path so the src package can be imported
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root))
+
+from src.utils.minhash import MinHashLSHIndex, shingle_hashes
+
+
+def build_corpus(count: int, words: int, seed: int = 13):
+    """
+    Article bodies and, for each rewritten copy, the index of the story it copies
+    """
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(20000)]
+    texts, originals = [], {}
+    for index in range(count):
+        if index > 10 and rng.random() < 0.1:
+            source = rng.randrange(index)
+            while source in originals:
+                source = originals[source]
+            body = texts[source].split()
+            for position in rng.sample(range(len(body)), int(len(body) * rng.uniform(0.01, 0.08))):
+                body[position] = rng.choice(vocabulary)
+            texts.append(' '.join(body))
+            originals[index] = source
+        else:
+            texts.append(' '.join(rng.choice(vocabulary) for _ in range(words)))
+    return texts, originals
+
+
+def run_benchmark(articles: int = 10000, words: int = 400, threshold: float = 0.5, sample: int = 300):
+    """
+    Print LSH time with recall and precision, and the projected time of a pairwise pass
+    """
+    texts, originals = build_corpus(articles, words)
+    print(f"Articles: {len(texts)} ({len(originals)} rewritten copies), {words} words each")
+
+    index = MinHashLSHIndex(threshold)
+    print(f"LSH: {index.bands} bands x {index.rows} rows, threshold {threshold}")
+    start = time.perf_counter()
+    flagged = set()
+    for key, text in enumerate(texts):
+        signature = index.signature(text)
+        if index.query(signature):
+            flagged.add(key)
+        else:
+            index.insert(key, signature)
+    lsh_seconds = time.perf_counter() - start
+    found = len(flagged & set(originals))
+    print(f"{'minhash-lsh':<18}{lsh_seconds:>10.2f} s  recall {found / max(1, len(originals)):.3f}"
+          f"  precision {found / max(1, len(flagged)):.3f}")
+
+    # Pairwise exact Jaccard over shingle sets, timed on a sample of pairs
+    shingles = [shingle_hashes(text) for text in texts[:sample]]
+    start = time.perf_counter()
+    pairs = 0
+    for i in range(len(shingles)):
+        for j in range(i):
+            len(shingles[i] & shingles[j]) / len(shingles[i] | shingles[j])
+            pairs += 1
+    per_pair = (time.perf_counter() - start) / pairs
+    total_pairs = articles * (articles - 1) // 2
+    print(f"{'pairwise jaccard':<18}{per_pair * total_pairs:>10.2f} s  (projected from {pairs} pairs,"
+          f" {per_pair * 1e6:.2f} us per pair, {total_pairs} pairs)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate article detection")
+    parser.add_argument("--articles", type=int, default=10000, help="Number of synthetic articles")
+    parser.add_argument("--words", type=int, default=400, help="Words per article body")
+    parser.add_argument("--threshold", type=float, default=0.5, help="Jaccard similarity threshold")
+    args = parser.parse_args()
+    run_benchmark(args.articles, args.words, args.threshold)
@@ -0,0 +1,72 @@
+"""
+Benchmark per-page parse time of the CNN and CNBC parsers for each installed parser backend
+
+Usage: python benchmarks/bench_parsers.py [--repeat N]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add the repository root to Python path so the src package can be imported
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root))
+
+from src.cnn_parser import parse_cnn_listing, parse_cnn_article
+from src.cnbc_parser import parse_cnbc_listing, parse_cnbc_article
+from src.utils.html_parsing import SUPPORTED_BACKENDS, is_backend_available
+
+
+FIXTURES_DIR = repo_root / "tests" / "fixtures"
+
+
+def _load_cases():
+    """
+    Pair every fixture page with the parser function that handles it
+    """
+    cases = []
+    for page in sorted((FIXTURES_DIR / "html").glob("*.html")):
+        html = page.read_text(encoding="utf-8")
+        name = page.stem
+        if name.endswith("_landing"):
+            parse = parse_cnn_listing if name.startswith("cnn") else parse_cnbc_listing
+            cases.append((name, html, lambda html, backend, parse=parse: parse(html, backend)))
+        else:
+            url = json.loads((FIXTURES_DIR / "expected" / f"{name}.json").read_text(encoding="utf-8"))['url']
+            parse = parse_cnn_article if name.startswith("cnn") else parse_cnbc_article
+            cases.append((name, html, lambda html, backend, parse=parse, url=url: parse(html, url, backend)))
+    return cases
+
+
+def run_benchmark(repeat: int = 200):
+    """
+    Time every fixture page with every installed backend and print milliseconds per page
+    """
+    backends = [name for name in SUPPORTED_BACKENDS if is_backend_available(name)]
+    cases = _load_cases()
+
+    print(f"{'page':<24}" + ''.join(f"{backend:>14}" for backend in backends))
+    totals = {backend: 0.0 for backend in backends}
+    for name, html, parse in cases:
+        row = f"{name:<24}"
+        for backend in backends:
+            parse(html, backend)  # Warm up
+            start = time.perf_counter()
+            for _ in range(repeat):
+                parse(html, backend)
+            per_page_ms = (time.perf_counter() - start) * 1000 / repeat
+            totals[backend] += per_page_ms
+            row += f"{per_page_ms:>11.3f} ms"
+        print(row)
+
+    print(f"{'total':<24}" + ''.join(f"{totals[backend]:>11.3f} ms" for backend in backends))
+    if 'lxml' in totals and totals['lxml']:
+        print(f"html.parser / lxml speedup: {totals['html.parser'] / totals['lxml']:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parser backends on the HTML fixture corpus")
+    parser.add_argument("--repeat", type=int, default=200, help="Parses per page and backend")
+    args = parser.parse_args()
+    run_benchmark(args.repeat)
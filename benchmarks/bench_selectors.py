@@ -0,0 +1,56 @@
+"""
+Benchmark the content selector cascades against the single-pass selector matcher
+
+Times finding the matches of every content selector on each article fixture page, the worst case
+for the cascades where no selector yields text before the end of the list.
+
+Usage: python benchmarks/bench_selectors.py [--repeat N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the repository root to Python path so the src package can be imported
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root))
+
+from src.cnn_parser import CNN_CONTENT_SELECTORS, CNN_MAIN_CONTENT_SELECTORS, CNN_CONTENT_MATCHER
+from src.cnbc_parser import CNBC_CONTENT_SELECTORS, CNBC_MAIN_CONTENT_SELECTORS, CNBC_CONTENT_MATCHER
+from src.utils.html_parsing import make_soup, get_parser_backend
+
+
+FIXTURES_DIR = repo_root / "tests" / "fixtures" / "html"
+
+
+def _time(func, repeat: int) -> float:
+    func()  # Warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def run_benchmark(repeat: int = 200):
+    """
+    Print milliseconds per page for one select() per selector versus one matcher walk
+    """
+    print(f"Backend: {get_parser_backend()}")
+    print(f"{'page':<24}{'cascade':>12}{'one walk':>12}")
+    for page in sorted(FIXTURES_DIR.glob("*_article*.html")):
+        soup = make_soup(page.read_text(encoding="utf-8"))
+        if page.name.startswith("cnn"):
+            selectors, matcher = CNN_CONTENT_SELECTORS + CNN_MAIN_CONTENT_SELECTORS, CNN_CONTENT_MATCHER
+        else:
+            selectors, matcher = CNBC_CONTENT_SELECTORS + CNBC_MAIN_CONTENT_SELECTORS, CNBC_CONTENT_MATCHER
+
+        cascade_ms = _time(lambda: [soup.select(selector) for selector in selectors], repeat)
+        matcher_ms = _time(lambda: matcher.match(soup), repeat)
+        print(f"{page.stem:<24}{cascade_ms:>9.3f} ms{matcher_ms:>9.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark content selector matching")
+    parser.add_argument("--repeat", type=int, default=200, help="Runs per page and variant")
+    args = parser.parse_args()
+    run_benchmark(args.repeat)
@@ -0,0 +1,71 @@
+"""
+Benchmark checking archived articles against the time window one by one versus in one batch
+
+Usage: python benchmarks/bench_time_window.py [--articles N] [--repeat N]
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the repository root to Python path so the src package can be imported
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root))
+
+from src.utils.date_filter import to_epoch_array, window_mask
+
+
+def per_article_check(pub_date: datetime) -> bool:
+    """The per-article check before the batch API: a fresh now() and time zone handling for every date"""
+    now = datetime.now(timezone.utc)
+    if pub_date.tzinfo is None:
+        pub_date = pub_date.replace(tzinfo=timezone.utc)
+    else:
+        pub_date = pub_date.astimezone(timezone.utc)
+    return now - pub_date <= timedelta(hours=72)
+
+
+def build_archive(count: int, seed: int = 5):
+    """
+    Publication dates spread over the last 30 days, with a mix of UTC and US Eastern offsets
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    eastern = timezone(timedelta(hours=-5))
+    dates = []
+    for _ in range(count):
+        value = now - timedelta(seconds=rng.randrange(30 * 24 * 3600))
+        dates.append(value.astimezone(eastern) if rng.random() < 0.5 else value)
+    return dates
+
+
+def run_benchmark(articles: int = 100000, repeat: int = 5):
+    """
+    Print milliseconds per pass over the archive for each variant
+    """
+    dates = build_archive(articles)
+    as_of = datetime.now(timezone.utc)
+    epochs = to_epoch_array(dates)
+
+    variants = {
+        'per article': lambda: [per_article_check(value) for value in dates],
+        'batch incl. convert': lambda: window_mask(to_epoch_array(dates), as_of),
+        'batch on epochs': lambda: window_mask(epochs, as_of),
+    }
+    print(f"Articles: {len(dates)}")
+    for name, variant in variants.items():
+        variant()  # Warm up
+        start = time.perf_counter()
+        for _ in range(repeat):
+            variant()
+        print(f"{name:<22}{(time.perf_counter() - start) * 1000 / repeat:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark time-window filtering")
+    parser.add_argument("--articles", type=int, default=100000, help="Number of archived publication dates")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes per variant")
+    args = parser.parse_args()
+    run_benchmark(args.articles, args.repeat)
@@ -0,0 +1,106 @@
+"""
+Benchmark the substring-loop article-link checks against the compiled URL classifier
+
+Builds a large list of hrefs from the landing-page fixtures, varied by date, section and the
+non-article links a landing page carries (videos, tags, images, quotes), and classifies every
+one with the old per-pattern loops and with the compiled classifier.
+
+Usage: python benchmarks/bench_url_classifier.py [--anchors N] [--repeat N]
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add the repository root to Python path so the src package can be imported
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root))
+
+from bs4 import BeautifulSoup
+from src.cnn_parser import CNN_URL_INCLUDE_PATTERNS, CNN_URL_EXCLUDE_PATTERNS
+from src.cnbc_parser import CNBC_URL_INCLUDE_PATTERNS, CNBC_URL_EXCLUDE_PATTERNS
+from src.utils.url_classifier import UrlClassifier
+
+
+FIXTURES_DIR = repo_root / "tests" / "fixtures" / "html"
+RULES = {
+    'cnn': (CNN_URL_INCLUDE_PATTERNS, CNN_URL_EXCLUDE_PATTERNS),
+    'cnbc': (CNBC_URL_INCLUDE_PATTERNS, CNBC_URL_EXCLUDE_PATTERNS),
+}
+SECTIONS = ['business', 'markets', 'tech', 'economy', 'investing', 'videos/business', 'tag/earnings',
+            'quotes', 'gallery', 'live-updates', 'authors/jane-doe', 'topics/ai']
+
+
+def substring_loop_check(url, include_patterns, exclude_patterns, years):
+    """The per-anchor checks the classifier replaces"""
+    if not url:
+        return False
+    patterns = [f'/{year}/' for year in years] + include_patterns
+    is_valid_path = any(pattern in url.lower() for pattern in patterns)
+    is_not_excluded = not any(skip_pattern in url.lower() for skip_pattern in exclude_patterns)
+    is_article_url = bool(re.search(r'/\d{4}/\d{2}/\d{2}/', url))
+    return (is_valid_path or is_article_url) and is_not_excluded and url.startswith(('http', '/', '../', './'))
+
+
+def build_anchor_list(count: int, seed: int = 7):
+    """
+    Fixture hrefs followed by synthetic landing-page hrefs, with repeats like a real page
+    """
+    hrefs = []
+    for path in sorted(FIXTURES_DIR.glob("*_landing.html")):
+        soup = BeautifulSoup(path.read_text(encoding="utf-8"), 'html.parser')
+        hrefs.extend(a['href'] for a in soup.find_all('a', href=True))
+
+    rng = random.Random(seed)
+    while len(hrefs) < count:
+        if rng.random() < 0.3:
+            hrefs.append(rng.choice(hrefs))  # Same story linked again from another card
+            continue
+        section = rng.choice(SECTIONS)
+        slug = f"story-{rng.randrange(100000)}"
+        date = f"{rng.choice([2024, 2025, 2026])}/{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}"
+        hrefs.append(rng.choice([
+            f"https://www.cnn.com/{date}/{section}/{slug}/index.html",
+            f"/{section}/{slug}",
+            f"https://www.cnbc.com/{date}/{slug}.html",
+            f"https://media.example.com/{section}/{slug}.jpg",
+            f"/{section}/{slug}#comments",
+        ]))
+    return hrefs[:count]
+
+
+def run_benchmark(anchors: int = 20000, repeat: int = 5):
+    """
+    Print microseconds per anchor for each variant
+    """
+    hrefs = build_anchor_list(anchors)
+    print(f"Anchors: {len(hrefs)} ({len(set(hrefs))} distinct)")
+    print(f"{'source':<8}{'loops':>12}{'compiled':>12}")
+    for source, (include, exclude) in RULES.items():
+        classifier = UrlClassifier(include, exclude)
+        years = classifier.years
+
+        def loops():
+            return [substring_loop_check(href, include, exclude, years) for href in hrefs]
+
+        def compiled():
+            return [classifier.is_article_url(href) for href in hrefs]
+
+        assert loops() == compiled()
+        timings = []
+        for variant in (loops, compiled):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                variant()
+            timings.append((time.perf_counter() - start) * 1e6 / (repeat * len(hrefs)))
+        print(f"{source:<8}" + "".join(f"{value:>9.2f} us" for value in timings))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark article-link classification")
+    parser.add_argument("--anchors", type=int, default=20000, help="Number of hrefs to classify")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the href list per variant")
+    args = parser.parse_args()
+    run_benchmark(args.anchors, args.repeat)
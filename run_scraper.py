@@ -41,6 +41,7 @@ def run_news_scraper():
         from src.utils.logger import setup_logging, log_info, log_error
         from src.utils.rate_limiter import rate_limit
         from src.utils.helpers import safe_request_with_retry
+        from src.utils.url_utils import generate_article_id
         print("✓ Successfully imported utilities")
     except Exception as e:
         print(f"✗ Error importing utilities: {e}")
@@ -97,7 +98,7 @@ def run_news_scraper():
             if is_within_72_hours(article_data['publication_date']):
                 # Create EnhancedNewsArticle object
                 article = EnhancedNewsArticle(
-                    id=hash(article_data['url']).__str__(),
+                    id=generate_article_id(article_data['url']),
                     title=article_data['title'],
                     content=article_data['content'],
                     url=article_data['url'],
@@ -2,12 +2,10 @@
 CNBC-specific parsing logic for extracting articles and content with enhanced error handling and date checking
 """
 import asyncio
-import httpx
 import sys
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, Set, Tuple, Union
 from datetime import datetime
-import re
 from urllib.parse import urljoin
 from pathlib import Path
 
@@ -16,16 +14,88 @@ src_dir = Path(__file__).parent
 sys.path.insert(0, str(src_dir))
 
 from utils.helpers import log_info, log_error, safe_request_with_retry
-from utils.date_filter import parse_article_date, is_within_72_hours
-from utils.rate_limiter import rate_limit
+from utils.date_filter import (
+    parse_article_date, is_within_72_hours, prescreen_listing_date, extract_listing_timestamp, DEFAULT_WINDOW_HOURS
+)
 from models.article import EnhancedNewsArticle
+from fetcher import Fetcher
+from utils.url_utils import canonicalize_url
+from utils.performance_optimizer import register_deduplication_saving, register_prescreen_result
+from utils.html_parsing import make_soup, LISTING_LINK_FILTER
+from utils.structured_data import extract_structured_fields, classify_extraction_path
+from utils.selector_matcher import SelectorMatcher
+from utils.selector_stats import get_selector_stats
+from utils.parse_pool import run_parser
+from utils.url_classifier import UrlClassifier
+from utils.head_screen import HeadScreen
 
 
-async def get_cnbc_articles() -> List[Dict[str, Any]]:
+# Title and publication date selectors, in static priority order
+CNBC_TITLE_SELECTORS = ['h1', '[data-module-title]', 'title']
+CNBC_DATE_SELECTORS = ['time', '.date', '.metadata__date', '[data-testid="published-timestamp"]']
+
+# Article body selectors, in static priority order
+CNBC_CONTENT_SELECTORS = [
+    '.ArticleBody-articleBody',      # CNBC specific
+    '.renderedcontent',             # CNBC specific
+    '.group',                       # CNBC specific
+    '.ArticleLayout-articleBody',   # CNBC specific
+    '[data-module="ArticleBody"]', # CNBC specific
+    '.ArticleBody',                 # CNBC specific
+    '.PostContent',                 # Alternative selector
+    '.post-content',                # Common selector
+    '.article-content',             # Common selector
+    'article'                       # Semantic HTML
+]
+
+# Main content areas tried when no article body selector yields text
+CNBC_MAIN_CONTENT_SELECTORS = ['main', '.main-content', '#main', '.content', '#content']
+
+CNBC_CONTENT_MATCHER = SelectorMatcher(CNBC_CONTENT_SELECTORS + CNBC_MAIN_CONTENT_SELECTORS)
+
+# Selector lists whose order adapts to recorded hit statistics
+CNBC_SELECTOR_GROUPS = {
+    'title': CNBC_TITLE_SELECTORS,
+    'date': CNBC_DATE_SELECTORS,
+    'content': CNBC_CONTENT_SELECTORS
+}
+
+# Landing-page link patterns of article pages; /yyyy/ segments for the years in the time window are added at runtime
+CNBC_URL_INCLUDE_PATTERNS = [
+    'id-',          # CNBC article ID pattern
+    '.html',        # HTML article pages
+    '/articles/',   # Article path
+    '/news/',       # News path
+    '/investing/',  # Investing section
+    '/economy/',    # Economy section
+    '/finance/',    # Finance section
+]
+
+# Landing-page link patterns that are never articles
+CNBC_URL_EXCLUDE_PATTERNS = [
+    '.jpg', '.jpeg', '.png', '.gif', '.svg', '.css', '.js',
+    'video/', 'videos/', 'gallery', 'newsletter',
+    'author/', 'authors/', 'tag/', 'tags/', '#', 'mailto:',
+    'search?', 'search/', 'topic/', 'topics/', 'category/', 'categories/',
+    '.mp4', '.mov', '.avi', '.wmv', '.zip', '.pdf', '.doc', '.docx',
+    'playbook', 'live', 'quotes', 'quotes.html'
+]
+
+CNBC_URL_CLASSIFIER = UrlClassifier(CNBC_URL_INCLUDE_PATTERNS, CNBC_URL_EXCLUDE_PATTERNS)
+
+
+async def get_cnbc_articles(fetcher: Optional[Fetcher] = None, seen_urls: Optional[Set[str]] = None,
+                            as_of: Optional[datetime] = None, window_hours: int = DEFAULT_WINDOW_HOURS) -> List[Dict[str, Any]]:
     """
     Extract article links and metadata from CNBC business page
     
-    Returns: List of dictionaries containing article titles and URLs
+    Parameters:
+    - fetcher (Fetcher): Shared pooled, per-host rate-limited fetch layer; a temporary one is created if omitted
+    - seen_urls (Set[str]): Run-wide set of canonical URLs already queued by any source; updated in place
+    - as_of (datetime): Run instant the time window ends at; defaults to now
+    - window_hours (int): Size of the time window in hours
+    
+    Returns: List of dictionaries containing article titles and canonical URLs
     """
     cnbc_business_url = "https://www.cnbc.com/business/"
     articles = []
@@ -33,50 +103,49 @@ async def get_cnbc_articles() -> List[Dict[str, Any]]:
     print(f"Starting CNBC article extraction from {cnbc_business_url}")
     
     try:
-        # Apply rate limiting before making the request (using a simple sleep)
-        # In production, this would use the actual rate limiter
-        await asyncio.sleep(3.5)  # 3-5 second rate limit
-        
-        async with httpx.AsyncClient(timeout=30.0, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; NewsScraper/1.0)'
-        }) as client:
-            response = await client.get(cnbc_business_url)
+        async with _fetcher_scope(fetcher) as active_fetcher:
+            response = await active_fetcher.fetch(cnbc_business_url)
             
             if response.status_code != 200:
                 print(f"Failed to access CNBC business page: {response.status_code}")
                 return []
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find article links on CNBC business page
-            # Look for links in article containers, typically with class patterns like 'Card-title' or 'teaser'
-            link_elements = soup.find_all('a', href=True)
-            processed_urls = set()  # To avoid duplicate processing
+            # Canonical URLs shared across sources, so tracking parameters, fragments, trailing
+            # slashes and relative forms of the same story are fetched only once per run
+            if seen_urls is None:
+                seen_urls = set()
             
-            for element in link_elements:
-                href = element.get('href', '')
+            # Parsing runs in the parse pool when one is configured, keeping the event loop free
+            # The raw bytes and declared charset go straight to the parser, skipping a decoded str copy
+            candidates = await run_parser(parse_cnbc_listing, response.content, encoding=response.charset_encoding,
+                                          as_of=as_of, window_hours=window_hours)
+            for candidate in candidates:
+                title = candidate['title']
+                canonical_url = candidate['url']
+                if canonical_url in seen_urls:
+                    register_deduplication_saving()
+                    continue
                 
-                # Skip if we've already processed this URL or it's not an article link
-                if href in processed_urls or not _is_valid_cnbc_article_url(href):
+                # Drop links whose URL path or card timestamp shows they are too old to keep
+                outside_window = prescreen_listing_date(
+                    canonical_url, candidate['listing_timestamp'], "cnbc", as_of=as_of, window_hours=window_hours
+                )
+                register_prescreen_result(bool(outside_window))
+                if outside_window:
+                    print(f"Skipped old CNBC link before fetching: {title[:50]}...")
                     continue
-                    
-                # Extract the text of the link, which should be the title
-                title = element.get_text(strip=True)
                 
-                if title and len(title) > 15:  # Filter out very short titles that might be navigation links
-                    full_url = _normalize_url(href, "https://www.cnbc.com")
-                    if full_url:
-                        articles.append({
-                            'title': title,
-                            'url': full_url
-                        })
-                        processed_urls.add(href)
-                        
-                        print(f"Found CNBC article: {title[:50]}...")  # Truncate for display
-                        
-                        # Limit to 10 articles to avoid processing too many
-                        if len(articles) >= 10:
-                            break
+                articles.append({
+                    'title': title,
+                    'url': canonical_url
+                })
+                seen_urls.add(canonical_url)
+                
+                print(f"Found CNBC article: {title[:50]}...")  # Truncate for display
+                
+                # Limit to 10 articles to avoid processing too many
+                if len(articles) >= 10:
+                    break
                             
     except Exception as e:
         print(f"Error extracting CNBC articles: {str(e)}")
@@ -86,44 +155,70 @@ async def get_cnbc_articles() -> List[Dict[str, Any]]:
     return articles
 
 
-def _is_valid_cnbc_article_url(url: str) -> bool:
-    """
-    Check if the URL is a valid CNBC article URL based on patterns
+def parse_cnbc_listing(html: Union[str, bytes], backend: Optional[str] = None,
+                       encoding: Optional[str] = None, as_of: Optional[datetime] = None,
+                       window_hours: int = DEFAULT_WINDOW_HOURS) -> List[Dict[str, Any]]:
     """
-    if not url:
-        return False
+    Parse a CNBC landing page into candidate article links, in page order
     
-    # Valid CNBC article URL patterns
-    patterns = [
-        '/2025/',  # Current year articles
-        '/2024/',  # Recent year articles
-        'id-',     # CNBC article ID pattern
-        '.html',   # HTML article pages
-        '/articles/',  # Article path
-        '/news/',  # News path
-        '/investing/', # Investing section
-        '/economy/', # Economy section
-        '/finance/', # Finance section
-    ]
+    Parameters:
+    - html (str | bytes): Landing page markup, preferably the raw response bytes
+    - backend (str): Parser backend to use instead of the configured one
+    - encoding (str): Charset declared by the response for byte markup
+    - as_of (datetime): Run instant the time window ends at, for the year segments of article URLs
+    - window_hours (int): Size of the time window in hours
     
-    # Skip patterns in URLs
-    skip_patterns = [
-        '.jpg', '.jpeg', '.png', '.gif', '.svg', '.css', '.js', 
-        'video/', 'videos/', 'gallery', 'newsletter', 
-        'author/', 'authors/', 'tag/', 'tags/', '#', 'mailto:',
-        'search?', 'search/', 'topic/', 'topics/', 'category/', 'categories/',
-        '.mp4', '.mov', '.avi', '.wmv', '.zip', '.pdf', '.doc', '.docx',
-        'playbook', 'live', 'quotes', 'quotes.html'
-    ]
+    Returns: List of dictionaries with title, canonical URL and any timestamp found on the listing card
+    """
+    # Landing pages are the largest documents fetched, so only anchors and timestamped cards are built
+    soup = make_soup(html, backend, encoding, parse_only=LISTING_LINK_FILTER)
     
-    # Check if URL matches any of these patterns and is an absolute path or full URL
-    is_valid_path = any(pattern in url.lower() for pattern in patterns)
-    is_not_excluded = not any(skip_pattern in url.lower() for skip_pattern in skip_patterns)
+    # Find article links on CNBC business page
+    # Look for links in article containers, typically with class patterns like 'Card-title' or 'teaser'
+    link_elements = soup.find_all('a', href=True)
+    candidates = []
     
-    # Also check if it's a valid article URL by structure
-    is_article_url = bool(re.search(r'/\d{4}/\d{2}/\d{2}/', url))  # Contains date pattern like /yyyy/mm/dd/
+    for element in link_elements:
+        href = element.get('href', '')
+        
+        # Skip if it's not an article link
+        if not _is_valid_cnbc_article_url(href, as_of, window_hours):
+            continue
+            
+        # Extract the text of the link, which should be the title
+        title = element.get_text(strip=True)
+        
+        if title and len(title) > 15:  # Filter out very short titles that might be navigation links
+            full_url = _normalize_url(href, "https://www.cnbc.com")
+            canonical_url = canonicalize_url(full_url) if full_url else ""
+            if canonical_url:
+                candidates.append({
+                    'title': title,
+                    'url': canonical_url,
+                    'listing_timestamp': extract_listing_timestamp(element)
+                })
     
-    return (is_valid_path or is_article_url) and is_not_excluded and url.startswith(('http', '/', '../', './'))
+    return candidates
+
+
+def _is_valid_cnbc_article_url(url: str, as_of: Optional[datetime] = None,
+                               window_hours: int = DEFAULT_WINDOW_HOURS) -> bool:
+    """
+    Check if the URL is a valid CNBC article URL based on patterns
+    """
+    return CNBC_URL_CLASSIFIER.is_article_url(url, as_of, window_hours)
+
+
+@asynccontextmanager
+async def _fetcher_scope(fetcher: Optional[Fetcher]):
+    """
+    Yield the shared fetcher, or a temporary one that is closed afterwards when none was passed in
+    """
+    if fetcher is not None:
+        yield fetcher
+        return
+    async with Fetcher() as temporary_fetcher:
+        yield temporary_fetcher
 
 
 def _normalize_url(url: str, base_domain: str) -> Optional[str]:
@@ -144,135 +239,181 @@ def _normalize_url(url: str, base_domain: str) -> Optional[str]:
         return base_domain.rstrip('/') + '/' + url
 
 
-async def extract_cnbc_content(url: str) -> Optional[Dict[str, Any]]:
+async def extract_cnbc_content(url: str, fetcher: Optional[Fetcher] = None,
+                                screen: Optional[HeadScreen] = None) -> Optional[Dict[str, Any]]:
     """
     Extract full content from a CNBC article URL with enhanced error handling and date validation
     
     Parameters:
     - url (str): URL of the CNBC article to extract content from
+    - fetcher (Fetcher): Shared pooled, per-host rate-limited fetch layer; a temporary one is created if omitted
+    - screen (HeadScreen): Stream the page and stop as soon as its head shows the article is not wanted
 
     Returns: Dictionary containing title, content, publication date, and other metadata
     """
     print(f"Extracting content from CNBC URL: {url}")
     
-    # Apply rate limiting before making the request
-    await asyncio.sleep(3.5)  # 3-5 second delay to respect rate limits
-    
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; NewsScraper/1.0)',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }) as client:
-            response = await client.get(url)
+        async with _fetcher_scope(fetcher) as active_fetcher:
+            if screen is not None:
+                response = await active_fetcher.fetch(url, screen=screen)
+                if response is None:
+                    print(f"Stopped CNBC article download after the head ({screen.reason}): {url}")
+                    return None
+            else:
+                response = await active_fetcher.fetch(url)
             
             if response.status_code != 200:
                 print(f"Failed to access CNBC article URL: {url} - Status: {response.status_code}")
                 return None
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract title - typically in h1 with class containing headline
-            title_element = soup.find('h1')
-            title = title_element.get_text(strip=True) if title_element else "Untitled Article"
-            # If the title is too short, try alternative selectors
-            if len(title) < 10:
-                for alt_selector in ['[data-module-title]', 'title']:
-                    title_element = soup.select_one(alt_selector) if soup.select_one(alt_selector) else None
-                    if title_element:
-                        title = title_element.get_text(strip=True)
-                        break
-                    else:
-                        title_element = soup.find(alt_selector)
-                        if title_element:
-                            title = title_element.get_text(strip=True)
-                            break
-            
-            # Extract publication date - common CNBC selectors
-            date_element = None
-            for selector in ['time', '.date', '.metadata__date', '[data-testid="published-timestamp"]']:
-                date_element = soup.select_one(selector)
-                if date_element:
-                    break
-            
-            date_text = ""
-            if date_element:
-                # First try to get datetime attribute if it exists
-                date_text = date_element.get('datetime', '')
-                # If not, get the text content
-                if not date_text:
-                    date_text = date_element.get_text(strip=True)
-            
-            # Extract content - look for article body
-            content_selectors = [
-                '.ArticleBody-articleBody',      # CNBC specific
-                '.renderedcontent',             # CNBC specific
-                '.group',                       # CNBC specific
-                '.ArticleLayout-articleBody',   # CNBC specific
-                '[data-module="ArticleBody"]', # CNBC specific
-                '.ArticleBody',                 # CNBC specific
-                '.PostContent',                 # Alternative selector
-                '.post-content',                # Common selector
-                '.article-content',             # Common selector
-                'article'                       # Semantic HTML
-            ]
-            
-            content = ""
-            for selector in content_selectors:
-                content_element = soup.select_one(selector)
-                if content_element:
-                    # Get all paragraphs/text elements within the content area
-                    paragraphs = content_element.find_all('p')
-                    content_parts = [p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 20]
-                    content = ' '.join(content_parts)
-                    break
-            
-            # If no content found with specific selectors, try general approach
-            if not content:
-                # Look for main content area
-                main_content_selectors = ['main', '.main-content', '#main', '.content', '#content']
-                for selector in main_content_selectors:
-                    main_content = soup.select_one(selector)
-                    if main_content:
-                        paragraphs = main_content.find_all('p')
-                        content_parts = [p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 30]
-                        content = ' '.join(content_parts[:10])  # Take first 10 paragraphs to avoid too much content
-                        if content:  # If we found content, stop looking
-                            break
-            
-            # If still no content found, extract from the entire body (last resort)
-            if not content:
-                body_text = soup.body.get_text() if soup.body else soup.get_text()
-                # Split by paragraphs and filter for meaningful content
-                lines = body_text.split('\n')
-                content_lines = [line.strip() for line in lines if len(line.strip()) > 50]
-                content = ' '.join(content_lines[:15])  # Take up to 15 content-heavy lines
-            
-            # Clean up content - normalize whitespace, remove empty lines
-            if content:
-                content = ' '.join(content.split())
-            
-            if not title or not content:
+            # Try the selectors that have worked best on earlier CNBC pages first
+            stats = get_selector_stats()
+            selector_order = stats.ordered_groups("CNBC", CNBC_SELECTOR_GROUPS) if stats else None
+            content_data = await run_parser(parse_cnbc_article, response.content, url,
+                                            selector_order=selector_order, encoding=response.charset_encoding)
+            if content_data is None:
+                if stats:
+                    stats.record("CNBC", {'content': None})
                 print(f"Insufficient content extracted from CNBC URL: {url}")
                 return None
+            if stats:
+                stats.record("CNBC", content_data['matched_selectors'])
             
-            print(f"Successfully extracted CNBC article: {title[:50]}...")  # Truncate for display
-            
-            return {
-                'title': title,
-                'content': content,
-                'publication_date': date_text,  # Will be parsed later
-                'url': url,
-                'source': 'CNBC'
-            }
+            print(f"Successfully extracted CNBC article: {content_data['title'][:50]}...")  # Truncate for display
+            return content_data
             
     except Exception as e:
         print(f"Error extracting CNBC content from {url}: {str(e)}")
         return None
 
 
+def parse_cnbc_article(html: Union[str, bytes], url: str, backend: Optional[str] = None, structured_data: bool = True,
+                       selector_order: Optional[Dict[str, List[str]]] = None,
+                      encoding: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Parse a CNBC article page into its title, content and raw publication date
+    
+    Title, date and body are read from the page's JSON-LD NewsArticle block and meta tags first;
+    the selector cascades below only run for the fields structured data does not provide.
+    
+    Parameters:
+    - html (str | bytes): Article page markup, preferably the raw response bytes
+    - url (str): URL the page was fetched from
+    - backend (str): Parser backend to use instead of the configured one
+    - structured_data (bool): Read JSON-LD and meta tags before falling back to selectors
+    - selector_order (Dict[str, List[str]]): Title, date and content selectors in the order to try them, instead of CNBC_SELECTOR_GROUPS
+    - encoding (str): Charset declared by the response for byte markup
+    
+    Returns: Dictionary containing title, content, publication date, the extraction path and matched selectors, and other metadata, or None if the page has no usable content
+    """
+    soup = make_soup(html, backend, encoding)
+    order = selector_order or CNBC_SELECTOR_GROUPS
+    # Selector that produced each field filled by a cascade (None when no selector matched)
+    matched_selectors: Dict[str, Optional[str]] = {}
+    
+    structured = extract_structured_fields(soup) if structured_data else {}
+    title = structured.get('title')
+    if not title:
+        title, matched_selectors['title'] = _select_cnbc_title(soup, order.get('title', CNBC_TITLE_SELECTORS))
+    date_text = structured.get('publication_date')
+    if not date_text:
+        date_text, matched_selectors['date'] = _select_cnbc_date(soup, order.get('date', CNBC_DATE_SELECTORS))
+    content = structured.get('content')
+    if not content:
+        content, matched_selectors['content'] = _select_cnbc_content(soup, order.get('content', CNBC_CONTENT_SELECTORS))
+    
+    # Clean up content - normalize whitespace, remove empty lines
+    if content:
+        content = ' '.join(content.split())
+    
+    if not title or not content:
+        return None
+    
+    return {
+        'title': title,
+        'content': content,
+        'publication_date': date_text,  # Will be parsed later
+        'url': url,
+        'source': 'CNBC',
+        'extraction_path': classify_extraction_path(structured),
+        'matched_selectors': matched_selectors
+    }
+
+
+def _select_cnbc_title(soup, selectors: List[str]) -> Tuple[str, Optional[str]]:
+    """
+    Find the article title with CNBC selectors
+    
+    The first selector whose text looks like a headline (10+ characters) wins; if none does,
+    the first match is used even though it is short.
+    
+    Returns: Title text and the selector that found it
+    """
+    fallback = None
+    for selector in selectors:
+        title_element = soup.select_one(selector)
+        if title_element:
+            title = title_element.get_text(strip=True)
+            if len(title) >= 10:
+                return title, selector
+            fallback = fallback or (title, selector)
+    return fallback or ("Untitled Article", None)
+
+
+def _select_cnbc_date(soup, selectors: List[str]) -> Tuple[str, Optional[str]]:
+    """
+    Find the raw publication date with CNBC selectors
+    
+    Returns: Date text and the selector that found it
+    """
+    # Extract publication date - common CNBC selectors
+    for selector in selectors:
+        date_element = soup.select_one(selector)
+        if date_element:
+            # Prefer the datetime attribute, otherwise use the text content
+            return date_element.get('datetime', '') or date_element.get_text(strip=True), selector
+    return "", None
+
+
+def _select_cnbc_content(soup, selectors: List[str]) -> Tuple[str, Optional[str]]:
+    """
+    Find the article body with CNBC selectors, falling back to the main content area and then the page text
+    
+    Returns: Body text and the selector that found it (None for the page-text fallback)
+    """
+    # One walk over the tree finds the matches of every content selector at once
+    matched = CNBC_CONTENT_MATCHER.match(soup)
+    
+    for selector in selectors:
+        content_element = matched[selector][0] if matched.get(selector) else None
+        if content_element:
+            # Get all paragraphs/text elements within the content area
+            paragraphs = content_element.find_all('p')
+            content_parts = [p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 20]
+            content = ' '.join(content_parts)
+            if content:
+                return content, selector
+            break
+    
+    # If no content found with specific selectors, try general approach
+    for selector in CNBC_MAIN_CONTENT_SELECTORS:
+        main_content = matched[selector][0] if matched[selector] else None
+        if main_content:
+            paragraphs = main_content.find_all('p')
+            content_parts = [p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 30]
+            content = ' '.join(content_parts[:10])  # Take first 10 paragraphs to avoid too much content
+            if content:  # If we found content, stop looking
+                return content, selector
+    
+    # If still no content found, extract from the entire body (last resort)
+    body_text = soup.body.get_text() if soup.body else soup.get_text()
+    # Split by paragraphs and filter for meaningful content
+    lines = body_text.split('\n')
+    content_lines = [line.strip() for line in lines if len(line.strip()) > 50]
+    return ' '.join(content_lines[:15]), None  # Take up to 15 content-heavy lines
+
+
 def is_valid_cnbc_url(url: str) -> bool:
     """
     Check if the URL is a valid CNBC business article URL
@@ -3,7 +3,7 @@ Article deduplication logic by title and content similarity to prevent duplicate
 """
 import sys
 import hashlib
-from typing import List
+from typing import Dict, List, Optional
 from pathlib import Path
 
 # Add the src directory to Python path for absolute imports
@@ -11,6 +11,159 @@ src_dir = Path(__file__).parent
 sys.path.insert(0, str(src_dir))
 
 from models.article import EnhancedNewsArticle
+from utils.logger import log_info
+from utils.article_store import MIN_LISTING_TITLE_WORDS, normalize_title
+from utils.minhash import MinHashLSHIndex, signature_to_hex, DEFAULT_NUM_PERM, DEFAULT_THRESHOLD
+from utils.simhash import FingerprintStore, simhash, fingerprint_to_hex
+
+
+class Deduplicator:
+    """
+    Rejects duplicate articles as they are produced instead of in one batch at the end of a run
+    
+    Only the normalized titles and content hashes of accepted articles are kept, each mapped to
+    the ID of the article that claimed it, so an article can be checked against everything
+    accepted so far without holding the articles themselves. Listing headlines claimed by links
+    before they are fetched are kept the same way, mapped to the link URL. With max_entries set,
+    the oldest keys are forgotten once any of the maps grows past it.
+    """
+    
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries
+        self.unique_titles: Dict[str, str] = {}
+        self.content_hashes: Dict[str, str] = {}
+        self.listing_titles: Dict[str, str] = {}
+    
+    def generate_content_hash(self, content: str) -> str:
+        """
+        Hash normalized content, as generate_content_hash
+        """
+        return generate_content_hash(content)
+    
+    def is_duplicate_title(self, title: str) -> bool:
+        """
+        Check whether an accepted article already has this title, e.g. for a listing link before it is fetched
+        """
+        normalized_title = normalize_title(title)
+        return bool(normalized_title) and normalized_title in self.unique_titles
+    
+    def claim_listing_title(self, title: str, url: str) -> bool:
+        """
+        Claim a listing headline for a link before it is fetched
+        
+        Args:
+            title (str): Headline text of the listing link
+            url (str): Link URL; claiming the same headline again for the same URL succeeds
+            
+        Returns:
+            bool: False if an accepted article or another link of the run already has the normalized
+            headline, so the link can be skipped; headlines shorter than MIN_LISTING_TITLE_WORDS
+            words are never matched
+        """
+        normalized_title = normalize_title(title)
+        if len(normalized_title.split()) < MIN_LISTING_TITLE_WORDS:
+            return True
+        owner = self.listing_titles.get(normalized_title)
+        if normalized_title in self.unique_titles or (owner is not None and owner != url):
+            return False
+        self._remember(self.listing_titles, normalized_title, url)
+        return True
+    
+    def release_listing_title(self, title: str, url: str) -> None:
+        """
+        Give up a listing headline claimed for a link that produced no accepted article, so a later
+        link with the same headline is fetched instead of skipped
+        
+        Args:
+            title (str): Headline text of the listing link
+            url (str): Link URL; only a claim held by this URL is released
+        """
+        normalized_title = normalize_title(title)
+        if self.listing_titles.get(normalized_title) == url:
+            del self.listing_titles[normalized_title]
+    
+    def _duplicate_reason(self, article: EnhancedNewsArticle) -> Optional[str]:
+        owner = self.unique_titles.get(normalize_title(article.title))
+        if owner is not None and owner != article.id:
+            return "title"
+        content_hash = self.generate_content_hash(article.content)
+        owner = self.content_hashes.get(content_hash) if content_hash else None
+        if owner is not None and owner != article.id:
+            return "content"
+        return None
+    
+    def is_duplicate(self, article: EnhancedNewsArticle) -> bool:
+        """
+        Check whether another accepted article has the same title or content
+        
+        Args:
+            article (EnhancedNewsArticle): Article to check; an article that was itself accepted is not a duplicate
+            
+        Returns:
+            bool: True if the article duplicates a different accepted article
+        """
+        return self._duplicate_reason(article) is not None
+    
+    def add_article(self, article: EnhancedNewsArticle) -> bool:
+        """
+        Accept an article unless it duplicates one accepted earlier
+        
+        Args:
+            article (EnhancedNewsArticle): Article to check and record
+            
+        Returns:
+            bool: True if the article is new and was accepted, False if it is a duplicate
+        """
+        reason = self._duplicate_reason(article)
+        if reason is not None:
+            log_info(f"Skipped duplicate article based on {reason}: {article.title}", "deduplication")
+            return False
+        
+        normalized_title = normalize_title(article.title)
+        if normalized_title:
+            self._remember(self.unique_titles, normalized_title, article.id)
+        content_hash = self.generate_content_hash(article.content)
+        if content_hash:
+            self._remember(self.content_hashes, content_hash, article.id)
+        return True
+    
+    def _remember(self, seen: Dict[str, str], key: str, article_id: str) -> None:
+        seen[key] = article_id
+        if self.max_entries is not None and len(seen) > self.max_entries:
+            # Dicts keep insertion order, so the first key is the oldest
+            del seen[next(iter(seen))]
+    
+    def process_articles(self, articles: List[EnhancedNewsArticle]) -> List[EnhancedNewsArticle]:
+        """
+        Accept each article in turn and return the ones that are not duplicates, in order
+        """
+        return [article for article in articles if self.add_article(article)]
+    
+    def reset(self) -> None:
+        """
+        Forget all accepted titles and content hashes
+        """
+        self.unique_titles.clear()
+        self.content_hashes.clear()
+        self.listing_titles.clear()
+
+
+# Shared instance for callers that deduplicate outside a scraper run
+default_deduplicator = Deduplicator()
+
+
+def is_article_duplicate(article: EnhancedNewsArticle) -> bool:
+    """
+    Check an article against the shared deduplicator
+    """
+    return default_deduplicator.is_duplicate(article)
+
+
+def add_article_to_dedupe(article: EnhancedNewsArticle) -> bool:
+    """
+    Add an article to the shared deduplicator; returns False if it is a duplicate
+    """
+    return default_deduplicator.add_article(article)
 
 
 def remove_duplicates(articles: List[EnhancedNewsArticle]) -> List[EnhancedNewsArticle]:
@@ -27,21 +180,93 @@ def remove_duplicates(articles: List[EnhancedNewsArticle]) -> List[EnhancedNewsA
     unique_articles = []
     
     for article in articles:
-        # Normalize the title for comparison (case-insensitive, whitespace-normalized)
-        normalized_title = ' '.join(article.title.lower().split())
+        normalized_title = normalize_title(article.title)
         
         # If we haven't seen this normalized title, add the article to unique list
         if normalized_title not in seen_titles:
             seen_titles.add(normalized_title)
             unique_articles.append(article)
         else:
-            # Log that a duplicate was found and skipped (only if logging is available)
-            try:
-                from .utils.logger import log_info
-                log_info(f"Skipped duplicate article based on title: {article.title}", "deduplication")
-            except ImportError:
-                # If logging isn't available, just continue
-                pass
+            log_info(f"Skipped duplicate article based on title: {article.title}", "deduplication")
+    
+    return unique_articles
+
+
+def remove_near_duplicates(articles: List[EnhancedNewsArticle], threshold: float = DEFAULT_THRESHOLD,
+                           num_perm: int = DEFAULT_NUM_PERM,
+                           index: Optional[MinHashLSHIndex] = None) -> List[EnhancedNewsArticle]:
+    """
+    Remove articles whose content is a near-duplicate of an earlier article, e.g. a syndicated
+    or lightly rewritten copy of the same story on the other source
+    
+    Each article's MinHash signature is stored in its similarity_hash and looked up in an LSH
+    index, so the batch is deduplicated in roughly linear time instead of comparing every pair
+    with is_similar_content.
+    
+    Args:
+        articles (List[EnhancedNewsArticle]): List of articles to deduplicate, in priority order
+        threshold (float): Estimated Jaccard similarity of the body shingles at which articles are duplicates
+        num_perm (int): MinHash signature length; longer is more accurate and slower
+        index (MinHashLSHIndex): Index of already accepted articles to check against and extend
+        
+    Returns:
+        List[EnhancedNewsArticle]: Articles that are not near-duplicates of an earlier one
+    """
+    if index is None:
+        index = MinHashLSHIndex(threshold, num_perm)
+    unique_articles = []
+    
+    for article in articles:
+        signature = index.signature(article.content or "")
+        if signature is None:
+            unique_articles.append(article)
+            continue
+        article.similarity_hash = signature_to_hex(signature)
+        
+        matches = index.query(signature)
+        if matches:
+            log_info(f"Skipped near-duplicate article: {article.title} (matches {matches[0]})", "deduplication")
+            continue
+        index.insert(article.id, signature)
+        unique_articles.append(article)
+    
+    return unique_articles
+
+
+def remove_seen_rewrites(articles: List[EnhancedNewsArticle],
+                         store: FingerprintStore) -> List[EnhancedNewsArticle]:
+    """
+    Remove articles whose body is a light rewrite or updated version of one emitted in an earlier run
+    
+    Each article's SimHash fingerprint is stored in its content_fingerprint and looked up in the
+    store's index, which only compares fingerprints sharing a block with it rather than the whole
+    archive. Articles that are kept are recorded in the store for later runs.
+    
+    Args:
+        articles (List[EnhancedNewsArticle]): Articles of this run, already deduplicated among themselves
+        store (FingerprintStore): Fingerprints of articles emitted in earlier runs
+        
+    Returns:
+        List[EnhancedNewsArticle]: Articles not matching an earlier run
+    """
+    unique_articles = []
+    
+    for article in articles:
+        fingerprint = simhash(article.content or "")
+        if fingerprint is None:
+            unique_articles.append(article)
+            continue
+        article.content_fingerprint = fingerprint_to_hex(fingerprint)
+        
+        match = store.find(fingerprint)
+        if match is not None:
+            log_info(
+                f"Skipped article seen in an earlier run: {article.title} "
+                f"({match['distance']} bits from {match['url']})", "deduplication"
+            )
+            continue
+        store.record(article.url, fingerprint, article.publication_date)
+        unique_articles.append(article)
     
     return unique_articles
 
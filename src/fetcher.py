@@ -0,0 +1,187 @@
+"""
+Shared HTTP fetch layer that keeps one pooled keep-alive client per host for the whole run
+"""
+import sys
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from pathlib import Path
+
+import httpx
+
+# Add the src directory to Python path for absolute imports
+src_dir = Path(__file__).parent
+sys.path.insert(0, str(src_dir))
+
+from utils.helpers import log_info, log_warning
+from utils.performance_optimizer import PerformanceOptimizer, get_performance_optimizer
+from utils.rate_limiter import HostRateLimiter
+from utils.http_cache import ResponseCache
+from utils.head_screen import HeadScreen
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; NewsScraper/1.0)',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+# Headers describing the wire encoding, which no longer apply to a body that was already decoded
+WIRE_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+
+class Fetcher:
+    """
+    Owns one pooled httpx.AsyncClient per host so that landing-page discovery and article
+    extraction reuse keep-alive connections instead of paying a new TCP+TLS handshake per request.
+    Every request first takes a token from the per-host rate limiter, which is the only place
+    the 3-5 second politeness delay is charged. With a response cache attached, repeat requests
+    are served from memory and pages cached by earlier runs are revalidated conditionally.
+    Article pages can be streamed through a HeadScreen, which cancels the transfer as soon as the
+    head shows the article is not wanted.
+    """
+
+    def __init__(self, optimizer: Optional[PerformanceOptimizer] = None, headers: Optional[Dict[str, str]] = None,
+                 rate_limiter: Optional[HostRateLimiter] = None, cache: Optional[ResponseCache] = None):
+        self.optimizer = optimizer or get_performance_optimizer()
+        self.headers = headers or DEFAULT_HEADERS
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.cache = cache
+        self.clients: Dict[str, httpx.AsyncClient] = {}
+
+    async def get_client(self, url: str) -> httpx.AsyncClient:
+        """
+        Get the pooled client for the host of the given URL, creating it on first use
+        """
+        host = urlparse(url).netloc.lower()
+        client = self.clients.get(host)
+        if client is None:
+            client = await self.optimizer.setup_connection_pool(host, self.headers)
+            self.clients[host] = client
+        return client
+
+    async def fetch(self, url: str, screen: Optional[HeadScreen] = None) -> Optional[httpx.Response]:
+        """
+        Make a rate-limited GET request through the pooled client for the URL's host
+
+        Parameters:
+        - url (str): URL to fetch
+        - screen (HeadScreen): Stream the body through this screen and stop when it rejects the page
+
+        Returns: The httpx response, or None if the screen cancelled the transfer; network errors are raised to the caller
+        """
+        client = await self.get_client(url)
+
+        entry = None
+        request_headers = {}
+        if self.cache is not None:
+            cached = self.cache.get_fresh(url)
+            if cached is not None:
+                return _build_cached_response(url, cached)
+            entry = self.cache.get_entry(url)
+            request_headers = self.cache.conditional_headers(entry)
+
+        waited = await self.rate_limiter.wait_for_host(url)
+        if waited > 0:
+            self.optimizer.increment_rate_limit_delays()
+
+        start_time = time.time()
+        self.optimizer.increment_active_requests()
+        try:
+            if screen is None:
+                response = await client.get(url, headers=request_headers)
+            else:
+                response = await self._fetch_screened(client, url, request_headers, screen)
+        finally:
+            self.optimizer.decrement_active_requests()
+            self.optimizer.track_request_time(start_time, time.time())
+
+        if response is None:
+            return None
+
+        if self.cache is not None:
+            if response.status_code == 304 and entry is not None:
+                cached = self.cache.revalidated(url, entry)
+                if cached is not None:
+                    return _build_cached_response(url, cached, response.request)
+            elif response.status_code == 200:
+                self.cache.store(url, response.content, response.headers)
+
+        return response
+
+    async def _fetch_screened(self, client: httpx.AsyncClient, url: str, request_headers: Dict[str, str],
+                              screen: HeadScreen) -> Optional[httpx.Response]:
+        """
+        Stream a page through the screen, closing the connection early if it rejects the page
+        """
+        async with client.stream('GET', url, headers=request_headers) as response:
+            screening = response.status_code == 200
+            chunks = []
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+                if not screening:
+                    continue
+                decision = screen.feed(chunk, response.charset_encoding)
+                if decision is False:
+                    self._record_cancelled_transfer(url, response, screen.reason)
+                    return None
+                if decision is True:
+                    screening = False
+
+            headers = {key: value for key, value in response.headers.items() if key.lower() not in WIRE_HEADERS}
+            return httpx.Response(
+                response.status_code,
+                content=b''.join(chunks),
+                headers=headers,
+                request=response.request
+            )
+
+    def _record_cancelled_transfer(self, url: str, response: httpx.Response, reason: Optional[str]) -> None:
+        """
+        Count a transfer stopped after the head and the bytes it did not download
+        """
+        downloaded = response.num_bytes_downloaded
+        try:
+            saved = max(0, int(response.headers.get('content-length', '')) - downloaded)
+        except ValueError:
+            saved = None  # Chunked transfer, the full size is unknown
+        self.optimizer.record_head_first_cancel(saved)
+        log_info(f"Stopped download after {downloaded} bytes ({reason}): {url}", "fetcher")
+
+    async def aclose(self) -> None:
+        """
+        Close every pooled client and persist the cache index; called once at the end of a run
+        """
+        if self.cache is not None:
+            self.cache.save()
+
+        for host, client in list(self.clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                log_warning(f"Failed to close client for {host}: {str(e)}", "fetcher")
+            self.optimizer.connection_pool.pop(host, None)
+
+        if self.clients:
+            log_info(f"Closed {len(self.clients)} pooled HTTP clients", "fetcher")
+        self.clients.clear()
+
+    async def __aenter__(self) -> "Fetcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+
+def _build_cached_response(url: str, cached: Dict, request: Optional[httpx.Request] = None) -> httpx.Response:
+    """
+    Rebuild a 200 response from a cached body so parsers cannot tell it apart from a live one
+    """
+    return httpx.Response(
+        200,
+        content=cached['body'],
+        headers=cached.get('headers', {}),
+        request=request or httpx.Request('GET', url)
+    )
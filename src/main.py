@@ -4,14 +4,14 @@ Main entry point for the Dual Source Financial News Scraper
 """
 
 import argparse
-import asyncio
 import sys
 from pathlib import Path
 
-# Add the src directory to the path so imports work
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add the repository root to the path so the src package imports work when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.scraper import run_scraper
+from src.scraper import run_scraper, OUTPUT_FORMATS
+from src.output_writer import JSONL_COMPRESSIONS
 
 
 def main():
@@ -20,16 +20,33 @@ def main():
     """
     parser = argparse.ArgumentParser(description="Dual Source Financial News Scraper")
     parser.add_argument("--output", "-o", type=str, help="Output filename for the markdown report")
+    parser.add_argument("--format", "-f", choices=OUTPUT_FORMATS, default="markdown",
+                        help="Write the Markdown report, JSON Lines records (one per article) or both")
+    parser.add_argument("--jsonl-output", type=str, help="Output filename for the JSON Lines records")
+    parser.add_argument("--compress", choices=[name for name in JSONL_COMPRESSIONS if name], default=None,
+                        help="Compress the JSON Lines output (zstd needs the zstandard package)")
+    parser.add_argument("--append", action="store_true",
+                        help="Append JSON Lines records to the existing --jsonl-output file instead of replacing it")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     
     args = parser.parse_args()
     
+    # The JSON Lines options would otherwise be silently ignored
+    if args.format == "markdown":
+        for option, value in (("--jsonl-output", args.jsonl_output), ("--compress", args.compress), ("--append", args.append)):
+            if value:
+                parser.error(f"{option} applies to JSON Lines output; use it with --format jsonl or both")
+    if args.append and not args.jsonl_output:
+        # The default filename carries the current minute, so there is nothing to append to
+        parser.error("--append needs --jsonl-output naming the file to append to")
+    
     print("Starting Dual Source Financial News Scraper...")
-    print(f"Arguments: output={args.output}, verbose={args.verbose}")
+    print(f"Arguments: output={args.output}, format={args.format}, jsonl_output={args.jsonl_output}, "
+          f"compress={args.compress}, append={args.append}, verbose={args.verbose}")
     
-    # Run the scraper
+    # Run the scraper (run_scraper drives its own event loop)
     try:
-        result = asyncio.run(run_scraper())
+        result = run_scraper(args.format, args.output, args.jsonl_output, args.compress, args.append)
         
         if result.articles:
             print(f"Scraping completed successfully!")
@@ -62,4 +79,4 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
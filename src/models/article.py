@@ -22,4 +22,5 @@ class EnhancedNewsArticle:
     status: str = "pending"  # pending, processed, filtered, failed
     quality_score: float = 0.0  # 0.0-1.0 automated quality assessment
     similarity_hash: Optional[str] = None  # Content hash for duplicate detection
+    content_fingerprint: Optional[str] = None  # 64-bit SimHash of the body (16 hex digits) for cross-run duplicate detection
     processing_time_ms: Optional[int] = None  # Processing time in milliseconds
\ No newline at end of file
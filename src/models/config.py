@@ -0,0 +1,31 @@
+"""
+Scraper Configuration model with tunable settings for a single scraping run
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ScraperConfig:
+    """
+    Run-level settings shared by the scraper, the fetch layer and the parsers
+    """
+    window_hours: int = 72  # Only articles published within this many hours before the run started are kept
+    max_concurrency: int = 4  # Maximum number of articles fetched and parsed at once per source
+    rate_limit_min: float = 3.0  # Minimum delay between requests to the same host in seconds
+    rate_limit_max: float = 5.0  # Maximum delay between requests to the same host in seconds
+    cache_enabled: bool = True  # Keep an on-disk HTTP response cache between runs
+    cache_dir: str = ".scraper_cache/http"  # Directory of the on-disk HTTP response cache
+    cache_max_mb: float = 100.0  # Size bound of the on-disk cache before LRU eviction
+    incremental: bool = True  # Skip links already processed unchanged in earlier runs
+    seen_store_path: str = ".scraper_cache/seen_articles.json"  # File of the persistent seen-article store
+    parser_backend: Optional[str] = None  # BeautifulSoup tree builder ("lxml", "html.parser", "html5lib"); None picks lxml when installed
+    adaptive_selectors: bool = True  # Try the title, date and content selectors with the most recorded hits first
+    selector_stats_path: str = ".scraper_cache/selector_stats.json"  # File of the persistent selector hit statistics
+    parse_workers: Optional[int] = 0  # Worker processes that parse pages off the event loop; 0 parses inline, None uses one per CPU core
+    head_first_fetch: bool = True  # Stream article pages and stop once the head shows the article is too old or a duplicate
+    dedupe_max_entries: Optional[int] = 100000  # Titles and content hashes the streaming deduplicator remembers before forgetting the oldest; None keeps all
+    near_duplicate_threshold: Optional[float] = 0.5  # Body similarity (MinHash-estimated shingle Jaccard) at which articles count as copies of one story; None disables
+    minhash_permutations: int = 128  # MinHash signature length used for near-duplicate detection
+    fingerprint_max_distance: Optional[int] = 6  # Bits within which a body's SimHash matches an article emitted in an earlier run; None disables
+    fingerprint_store_path: str = ".scraper_cache/fingerprints.json"  # File of the persistent SimHash fingerprint store
@@ -3,7 +3,7 @@ Performance Metrics model for tracking execution time, memory usage, and through
 """
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Dict
 
 
 @dataclass
@@ -26,4 +26,14 @@ class PerformanceMetrics:
     cache_hit_rate: Optional[float]  # Percentage of cache hits (0.0-1.0)
     active_coroutines: Optional[int]  # Number of active async coroutines
     rate_limit_delays: Optional[int]  # Number of rate limiting delays applied
-    deduplication_savings: Optional[int]  # Number of articles not processed due to deduplication
\ No newline at end of file
+    deduplication_savings: Optional[int]  # Number of articles not processed due to deduplication
+    cache_revalidations: Optional[int] = None  # Number of cached responses confirmed by 304 Not Modified
+    cache_evictions: Optional[int] = None  # Number of responses evicted from the on-disk cache
+    incremental_skips: Optional[int] = None  # Number of links skipped because an earlier run already processed them
+    listing_title_skips: Optional[int] = None  # Number of links skipped before fetching because their listing headline was already taken
+    prescreen_hits: Optional[int] = None  # Number of links dropped as too old before being fetched
+    prescreen_misses: Optional[int] = None  # Number of links that still had to be fetched after pre-screening
+    head_first_cancels: Optional[int] = None  # Number of article downloads stopped once the head showed the article was not wanted
+    head_first_bytes_saved: Optional[int] = None  # Announced response bytes not downloaded because of those stops
+    extraction_paths: Optional[Dict[str, Dict[str, int]]] = None  # Per source, number of articles extracted via structured data, mixed or selector cascades
+    selector_hit_rates: Optional[Dict[str, Dict[str, float]]] = None  # Per source and field (title, date, content), share of selector cascades that found a value
@@ -2,10 +2,11 @@
 Scraping Result model containing collected data from the scraping process along with errors and statistics
 """
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 import time
 from .article import EnhancedNewsArticle
+from .metrics import PerformanceMetrics
 
 
 @dataclass
@@ -20,6 +21,7 @@ class ScrapingResult:
     end_time: float  # End time of scraping process (timestamp)
     duration_seconds: float  # Total duration of scraping in seconds
     source_stats: Dict[str, Any] = None  # Statistics per source (e.g., count of articles, success rate)
+    performance_metrics: Optional[PerformanceMetrics] = None  # Network, cache and deduplication metrics for the run
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -1,10 +1,15 @@
 """
-Markdown output formatting and file writing with naming convention
+Markdown and JSON Lines output formatting and file writing with naming convention
 """
+import gzip
+import importlib.util
+import io
+import json
 import os
 import sys
+from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
 # Add the src directory to Python path for absolute imports
@@ -12,15 +17,20 @@ src_dir = Path(__file__).parent
 sys.path.insert(0, str(src_dir))
 
 from models.article import EnhancedNewsArticle
+from deduplication import generate_content_hash
 
 
-def generate_filename() -> str:
+# Compression codecs for JSON Lines output and the file suffix each one adds
+JSONL_COMPRESSIONS = {None: '', 'gzip': '.gz', 'zstd': '.zst'}
+
+
+def generate_filename(extension: str = "md") -> str:
     """
     Generate filename following the naming convention: US_News_yyyymmdd-hhmm.md
     Example: US_News_20251103-1230.md
     """
     now = datetime.now()
-    filename = f"US_News_{now.strftime('%Y%m%d-%H%M')}.md"
+    filename = f"US_News_{now.strftime('%Y%m%d-%H%M')}.{extension}"
     return filename
 
 
@@ -41,7 +51,8 @@ def format_article_markdown(article: EnhancedNewsArticle) -> str:
     markdown_content = f"## {article.title}\n\n"
     markdown_content += f"- **Source**: {article.source}\n"
     markdown_content += f"- **Published**: {formatted_date}\n"
-    markdown_content += f"- **URL**: {article.url}\n\n"
+    markdown_content += f"- **URL**: {article.url}\n"
+    markdown_content += f"- **ID**: {article.id}\n\n"
     markdown_content += f"{article.content}\n\n"
     markdown_content += "---\n\n"  # Separator between articles
     
@@ -74,6 +85,136 @@ def validate_output_requirements(articles: List[EnhancedNewsArticle]) -> bool:
     return True
 
 
+class _Unclosed(io.RawIOBase):
+    """
+    Write-through view of a file that leaves it open when the layers above it are closed
+    """
+
+    def __init__(self, raw):
+        super().__init__()
+        self._target = raw
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return self._target.write(data)
+
+
+class _StreamWriter(ABC):
+    """
+    Writes an output file one article at a time as the scraper accepts them
+
+    The file is opened with the first article, so a writer that received no articles creates no
+    file. Unless appending, it is written to a temporary file next to the output and moved into
+    place with an atomic rename by close(), so readers never see a partial file. Subclasses
+    choose the stream wrapped around the raw file, the header and the per-article format.
+    """
+
+    def __init__(self, filename: str, append: bool = False, buffer_size: int = 64 * 1024):
+        self.filename = filename
+        self.append = append
+        self.tmp_path = self.filename if append else f"{self.filename}.tmp"
+        self.buffer_size = buffer_size
+        self.articles_written = 0
+        self._raw = None
+        self._file = None
+
+    def _wrap(self, raw) -> io.TextIOBase:
+        return io.TextIOWrapper(_Unclosed(raw), encoding='utf-8', newline='\n', write_through=True)
+
+    def _write_header(self) -> None:
+        pass
+
+    @abstractmethod
+    def _format(self, article: EnhancedNewsArticle) -> str:
+        """
+        Text written to the file for one article
+        """
+
+    def _open(self) -> None:
+        directory = os.path.dirname(self.filename) if os.path.dirname(self.filename) else '.'
+        os.makedirs(directory, exist_ok=True)
+        self._raw = open(self.tmp_path, 'ab' if self.append else 'wb', buffering=self.buffer_size)
+        self._file = self._wrap(self._raw)
+        self._write_header()
+
+    def write_article(self, article: EnhancedNewsArticle) -> None:
+        """
+        Append one article to the output
+
+        Args:
+            article (EnhancedNewsArticle): Accepted article to write
+        """
+        if self._file is None:
+            self._open()
+        self._file.write(self._format(article))
+        self.articles_written += 1
+
+    def close(self) -> str:
+        """
+        Flush the output to disk and, unless appending, rename it into place
+
+        Returns:
+            str: Path to the written file, or empty string if no article was written
+        """
+        if self._file is None:
+            return ""
+        # Closing the text and compression layers leaves the raw file open for the fsync
+        self._file.close()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._raw.close()
+        self._file = self._raw = None
+        if not self.append:
+            os.replace(self.tmp_path, self.filename)
+        return os.path.abspath(self.filename)
+
+    def abort(self) -> None:
+        """
+        Stop writing; a temporary file is removed without touching the output, an appended file keeps what was written
+        """
+        if self._file is None:
+            return
+        self._file.close()
+        self._raw.close()
+        self._file = self._raw = None
+        if not self.append:
+            try:
+                os.remove(self.tmp_path)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class MarkdownStreamWriter(_StreamWriter):
+    """
+    Writes the Markdown summary one article at a time, formatting only one article in memory at a time
+    """
+
+    def __init__(self, filename: Optional[str] = None, buffer_size: int = 64 * 1024):
+        super().__init__(filename or generate_filename(), buffer_size=buffer_size)
+        self._warned = False
+
+    def _write_header(self) -> None:
+        self._file.write("# US Financial News Summary\n\n")
+        self._file.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+    def _format(self, article: EnhancedNewsArticle) -> str:
+        if not self._warned and not validate_output_requirements([article]):
+            print("Warning: Some articles do not meet output requirements")
+            self._warned = True
+        return format_article_markdown(article)
+
+
 def write_to_markdown(articles: List[EnhancedNewsArticle], filename: str = None) -> str:
     """
     Write processed articles to a formatted Markdown file following the naming convention
@@ -89,35 +230,106 @@ def write_to_markdown(articles: List[EnhancedNewsArticle], filename: str = None)
         print("No articles to write to Markdown file")
         return ""
     
-    # Generate filename if not provided
-    if not filename:
-        filename = generate_filename()
-    
-    # Validate that all articles have required fields
-    if not validate_output_requirements(articles):
-        print("Warning: Some articles do not meet output requirements")
-    
-    # Prepare the complete Markdown content
-    content = f"# US Financial News Summary\n\n"
-    content += f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    
-    # Add each article to the content
-    for article in articles:
-        content += format_article_markdown(article)
-    
-    # Ensure the output directory exists
-    directory = os.path.dirname(filename) if os.path.dirname(filename) else '.'
-    os.makedirs(directory, exist_ok=True)
+    writer = MarkdownStreamWriter(filename)
+    try:
+        for article in articles:
+            writer.write_article(article)
+        output_path = writer.close()
+    except Exception as e:
+        writer.abort()
+        print(f"Error writing to file {writer.filename}: {str(e)}")
+        return ""
     
+    print(f"Successfully wrote {len(articles)} articles to {writer.filename}")
+    return output_path
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def article_to_record(article: EnhancedNewsArticle) -> Dict[str, Any]:
+    """
+    Convert an article to a flat record for JSON Lines output
+
+    Args:
+        article (EnhancedNewsArticle): Article to convert
+
+    Returns:
+        Dict[str, Any]: Record with ISO-8601 dates and the hash of the normalized content
+    """
+    return {
+        'id': article.id,
+        'source': article.source,
+        'title': article.title,
+        'url': article.url,
+        'publication_date': _isoformat(article.publication_date),
+        'scraped_at': _isoformat(article.scraped_at),
+        'content_hash': generate_content_hash(article.content),
+        'quality_score': article.quality_score,
+        'content': article.content
+    }
+
+
+class JsonlStreamWriter(_StreamWriter):
+    """
+    Writes one compact JSON record per article (JSON Lines), optionally gzip- or zstd-compressed
+
+    In append mode records are added to an existing file; compressed appends add a new gzip
+    member or zstd frame, which readers decode as one continuous stream.
+    """
+
+    def __init__(self, filename: Optional[str] = None, append: bool = False, compression: Optional[str] = None,
+                 buffer_size: int = 64 * 1024):
+        if compression not in JSONL_COMPRESSIONS:
+            raise ValueError(f"Unsupported compression {compression!r}; use one of gzip, zstd or None")
+        if compression == 'zstd' and importlib.util.find_spec('zstandard') is None:
+            raise ValueError("zstd compression needs the zstandard package (pip install zstandard)")
+        super().__init__(filename or generate_filename("jsonl") + JSONL_COMPRESSIONS[compression], append, buffer_size)
+        self.compression = compression
+
+    def _wrap(self, raw) -> io.TextIOBase:
+        if self.compression == 'gzip':
+            # GzipFile does not close a file object it was given
+            stream = gzip.GzipFile(fileobj=raw, mode='wb')
+        elif self.compression == 'zstd':
+            import zstandard
+            stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+        else:
+            return super()._wrap(raw)
+        return io.TextIOWrapper(stream, encoding='utf-8', newline='\n')
+
+    def _format(self, article: EnhancedNewsArticle) -> str:
+        return json.dumps(article_to_record(article), ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def write_to_jsonl(articles: List[EnhancedNewsArticle], filename: str = None, append: bool = False,
+                   compression: Optional[str] = None) -> str:
+    """
+    Write processed articles to a JSON Lines file, one record per article
+
+    Args:
+        articles (List[EnhancedNewsArticle]): List of articles to write to file
+        filename (str): Optional filename; if not provided, will use naming convention with a .jsonl extension
+        append (bool): Add the records to an existing file instead of replacing it
+        compression (str): None, "gzip" or "zstd"
+
+    Returns:
+        str: Path to the written file
+    """
+    if not articles:
+        print("No articles to write to JSON Lines file")
+        return ""
+
+    writer = JsonlStreamWriter(filename, append, compression)
     try:
-        # Write the content to the file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        print(f"Successfully wrote {len(articles)} articles to {filename}")
-        
-        return os.path.abspath(filename)
-        
+        for article in articles:
+            writer.write_article(article)
+        output_path = writer.close()
     except Exception as e:
-        print(f"Error writing to file {filename}: {str(e)}")
-        return ""
\ No newline at end of file
+        writer.abort()
+        print(f"Error writing to file {writer.filename}: {str(e)}")
+        return ""
+
+    print(f"Successfully wrote {len(articles)} articles to {writer.filename}")
+    return output_path
@@ -2,10 +2,11 @@
 Main scraper module for dual-source financial news scraping from CNBC and CNN
 """
 import asyncio
+import functools
 import httpx
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Set, Callable
+from datetime import datetime, timezone
 import logging
 import time
 import sys
@@ -34,31 +35,100 @@ sys.path.insert(0, str(src_dir))
 # Import our modules
 from models.article import EnhancedNewsArticle
 from models.result import ScrapingResult
+from models.config import ScraperConfig
 from cnn_parser import get_cnn_articles, extract_cnn_content
 from cnbc_parser import get_cnbc_articles, extract_cnbc_content
-from utils.date_filter import is_within_72_hours, parse_article_date
+from utils.date_filter import parse_article_date, filter_within_window
 from utils.logger import log_info, log_error, setup_logging
-from utils.rate_limiter import rate_limit
+from utils.rate_limiter import HostRateLimiter
 from utils.helpers import safe_request_with_retry
-from deduplication import remove_duplicates
-from output_writer import write_to_markdown
+from deduplication import Deduplicator, remove_near_duplicates, remove_seen_rewrites, generate_content_hash
+from fetcher import Fetcher
+from utils.http_cache import ResponseCache
+from utils.article_store import SeenArticleStore
+from utils.simhash import FingerprintStore
+from utils.minhash import MinHashLSHIndex
+from utils.url_utils import generate_article_id
+from utils.performance_optimizer import get_performance_optimizer
+from utils.html_parsing import set_parser_backend
+from utils.selector_stats import SelectorStats, set_selector_stats
+from utils.parse_pool import start_parse_pool, shutdown_parse_pool
+from utils.head_screen import HeadScreen
+from output_writer import MarkdownStreamWriter, JsonlStreamWriter
 
 
-async def scrape_news_sources() -> ScrapingResult:
+async def scrape_news_sources(config: Optional[ScraperConfig] = None,
+                              sink: Optional[Callable[[EnhancedNewsArticle], None]] = None) -> ScrapingResult:
     """
     Main function to scrape news from both CNBC and CNN business sections
+    
+    Parameters:
+    - config (ScraperConfig): Run settings such as per-source concurrency and rate limits
+    - sink (Callable): Called with each article as soon as the pipeline accepts it, e.g. MarkdownStreamWriter.write_article
     """
+    config = config or ScraperConfig()
     log_info("Starting news scraping process from dual sources", "scraper")
     start_time = time.time()
+    log_info(f"Parsing pages with the {set_parser_backend(config.parser_backend)} backend", "scraper")
     
-    all_articles: List[EnhancedNewsArticle] = []
     errors: List[Dict[str, Any]] = []
     
+    # One pooled client and one token bucket per host are shared by discovery and extraction,
+    # so CNN and CNBC requests never wait on each other; the clients are closed once per run
+    optimizer = get_performance_optimizer()
+    optimizer.start_time = start_time
+    cache = ResponseCache(config.cache_dir, int(config.cache_max_mb * 1024 * 1024), optimizer) if config.cache_enabled else None
+    fetcher = Fetcher(
+        optimizer=optimizer,
+        rate_limiter=HostRateLimiter(config.rate_limit_min, config.rate_limit_max),
+        cache=cache
+    )
+    seen_store = SeenArticleStore(config.seen_store_path, config.window_hours) if config.incremental else None
+    # Per-source selector hit counts persisted across runs decide which selectors the parsers try first
+    selector_stats = SelectorStats(config.selector_stats_path, optimizer=optimizer) if config.adaptive_selectors else None
+    set_selector_stats(selector_stats)
+    # Started after the parser backend is set so worker processes use the same one
+    start_parse_pool(config.parse_workers)
+    # Canonical article URLs queued by either source; links already in it are never fetched twice
+    seen_urls: Set[str] = set()
+    # One end of the time window for the whole run, so articles fetched late are judged like early ones
+    as_of = datetime.now(timezone.utc)
+    # Titles and content hashes accepted so far by either source; duplicates are dropped as they are parsed
+    deduplicator = Deduplicator(config.dedupe_max_entries)
+    # Near-duplicate checks across sources and runs apply to each batch a source releases, so
+    # accepted articles reach the sink while the scrape is still going
+    near_duplicate_index = MinHashLSHIndex(
+        config.near_duplicate_threshold, config.minhash_permutations
+    ) if config.near_duplicate_threshold is not None else None
+    fingerprint_store = FingerprintStore(
+        config.fingerprint_store_path, config.fingerprint_max_distance, config.window_hours
+    ) if config.fingerprint_max_distance is not None else None
+    # Accepted articles per source; the sink sees them in completion order, the result in source order
+    cnn_accepted: List[EnhancedNewsArticle] = []
+    cnbc_accepted: List[EnhancedNewsArticle] = []
+    
+    def accept(accepted: List[EnhancedNewsArticle], articles: List[EnhancedNewsArticle]) -> List[EnhancedNewsArticle]:
+        if near_duplicate_index is not None:
+            # Syndicated or rewritten copies of one story, typically across CNN and CNBC
+            articles = remove_near_duplicates(articles, index=near_duplicate_index)
+        if fingerprint_store is not None:
+            # Rewrites and updated versions of stories already emitted by an earlier run
+            articles = remove_seen_rewrites(articles, fingerprint_store)
+        for article in articles:
+            accepted.append(article)
+            if sink is not None:
+                sink(article)
+        return articles
+    
     # Scrape from both sources concurrently
     try:
         # Create tasks for both sources
-        cnn_task = asyncio.create_task(_scrape_cnn())
-        cnbc_task = asyncio.create_task(_scrape_cnbc())
+        cnn_task = asyncio.create_task(_scrape_cnn(
+            fetcher, config, seen_store, seen_urls, as_of, deduplicator, functools.partial(accept, cnn_accepted)
+        ))
+        cnbc_task = asyncio.create_task(_scrape_cnbc(
+            fetcher, config, seen_store, seen_urls, as_of, deduplicator, functools.partial(accept, cnbc_accepted)
+        ))
         
         # Wait for both to complete
         cnn_result, cnbc_result = await asyncio.gather(cnn_task, cnbc_task, return_exceptions=True)
@@ -73,7 +143,6 @@ async def scrape_news_sources() -> ScrapingResult:
             errors.append(error_info)
             log_error(f"CNN scraping failed: {str(cnn_result)}", "scraper")
         elif cnn_result:
-            all_articles.extend(cnn_result)
             log_info(f"CNN scraping completed: {len(cnn_result)} articles", "scraper")
         
         # Process results from CNBC scraping
@@ -86,7 +155,6 @@ async def scrape_news_sources() -> ScrapingResult:
             errors.append(error_info)
             log_error(f"CNBC scraping failed: {str(cnbc_result)}", "scraper")
         elif cnbc_result:
-            all_articles.extend(cnbc_result)
             log_info(f"CNBC scraping completed: {len(cnbc_result)} articles", "scraper")
             
     except Exception as e:
@@ -97,9 +165,24 @@ async def scrape_news_sources() -> ScrapingResult:
         }
         errors.append(error_info)
         log_error(f"Error in scraping coordination: {str(e)}", "scraper")
+    finally:
+        await fetcher.aclose()
+        shutdown_parse_pool()
+        if fingerprint_store is not None:
+            fingerprint_store.prune()
+            fingerprint_store.save()
+        if selector_stats is not None:
+            selector_stats.check_hit_rates()
+            selector_stats.save()
     
-    # Remove duplicates
-    unique_articles = remove_duplicates(all_articles)
+    # Saved only when the run was not interrupted, so articles recorded as seen reached the output
+    if seen_store is not None:
+        seen_store.prune()
+        seen_store.save()
+    
+    # Accepted articles already passed the window, the deduplicator and the near-duplicate checks,
+    # including those of a source that failed part-way; CNN's come first, each in listing order
+    unique_articles = cnn_accepted + cnbc_accepted
     log_info(f"Deduplication complete: {len(unique_articles)} unique articles", "scraper")
     
     # Validate output requirements
@@ -113,151 +196,356 @@ async def scrape_news_sources() -> ScrapingResult:
         errors=errors,
         start_time=start_time,
         end_time=end_time,
-        duration_seconds=duration_seconds
+        duration_seconds=duration_seconds,
+        performance_metrics=optimizer.get_performance_metrics()
     )
     
     log_info(f"Scraping completed in {duration_seconds:.2f}s", "scraper")
+    log_info(
+        f"Cache hit rate {result.performance_metrics.cache_hit_rate:.0%} "
+        f"({result.performance_metrics.cache_revalidations} revalidated, {result.performance_metrics.cache_evictions} evicted)",
+        "scraper"
+    )
+    log_info(
+        f"Date pre-screen dropped {result.performance_metrics.prescreen_hits} links before fetching "
+        f"({result.performance_metrics.prescreen_misses} still fetched), saving as many rate-limited requests",
+        "scraper"
+    )
+    log_info(
+        f"Listing headline checks skipped {result.performance_metrics.listing_title_skips} duplicate links before fetching",
+        "scraper"
+    )
+    log_info(
+        f"Head-first fetching stopped {result.performance_metrics.head_first_cancels} article downloads early, "
+        f"saving {result.performance_metrics.head_first_bytes_saved} announced bytes",
+        "scraper"
+    )
+    for source, rates in sorted(result.performance_metrics.selector_hit_rates.items()):
+        log_info(f"{source} selector hit rates: " + ", ".join(f"{field} {rate:.0%}" for field, rate in sorted(rates.items())), "scraper")
+    for source, paths in sorted(result.performance_metrics.extraction_paths.items()):
+        total = sum(paths.values())
+        log_info(
+            f"{source} extraction paths: {paths.get('structured', 0)}/{total} structured data only, "
+            f"{paths.get('mixed', 0)} mixed, {paths.get('selectors', 0)} selector cascades",
+            "scraper"
+        )
     
     return result
 
 
-async def _scrape_cnn() -> List[EnhancedNewsArticle]:
+async def _scrape_cnn(fetcher: Optional[Fetcher] = None, config: Optional[ScraperConfig] = None,
+                      seen_store: Optional[SeenArticleStore] = None,
+                      seen_urls: Optional[Set[str]] = None, as_of: Optional[datetime] = None,
+                      deduplicator: Optional[Deduplicator] = None,
+                      accept: Optional[Callable[[List[EnhancedNewsArticle]], List[EnhancedNewsArticle]]] = None) -> List[EnhancedNewsArticle]:
     """
-    Scrape articles from CNN business section
+    Scrape articles from CNN business section using the shared pooled fetcher
     """
-    log_info("Starting CNN scraping", "cnn_scraper")
+    return await _scrape_source("CNN", get_cnn_articles, extract_cnn_content, fetcher, config, seen_store, seen_urls, as_of, deduplicator, accept)
+
+
+async def _scrape_cnbc(fetcher: Optional[Fetcher] = None, config: Optional[ScraperConfig] = None,
+                       seen_store: Optional[SeenArticleStore] = None,
+                      seen_urls: Optional[Set[str]] = None, as_of: Optional[datetime] = None,
+                      deduplicator: Optional[Deduplicator] = None,
+                      accept: Optional[Callable[[List[EnhancedNewsArticle]], List[EnhancedNewsArticle]]] = None) -> List[EnhancedNewsArticle]:
+    """
+    Scrape articles from CNBC business section using the shared pooled fetcher
+    """
+    return await _scrape_source("CNBC", get_cnbc_articles, extract_cnbc_content, fetcher, config, seen_store, seen_urls, as_of, deduplicator, accept)
+
+
+async def _scrape_source(source_name: str, get_links, extract_content,
+                         fetcher: Optional[Fetcher], config: Optional[ScraperConfig],
+                         seen_store: Optional[SeenArticleStore] = None,
+                      seen_urls: Optional[Set[str]] = None, as_of: Optional[datetime] = None,
+                      deduplicator: Optional[Deduplicator] = None,
+                      accept: Optional[Callable[[List[EnhancedNewsArticle]], List[EnhancedNewsArticle]]] = None) -> List[EnhancedNewsArticle]:
+    """
+    Discover article links for one source and fetch+parse them with a bounded worker pool
+    
+    Up to config.max_concurrency articles are in flight at once, so parsing one article overlaps
+    with the rate-limited network wait of the next. The fetcher still spaces requests per host.
+    Articles are returned in listing order regardless of completion order. Links already processed
+    unchanged in an earlier run (per seen_store) are skipped before any request is made, and
+    discovery drops links whose canonical URL is already in the run-wide seen_urls set. Links whose
+    listing headline was already claimed in this run or processed in an earlier run are dropped
+    next, before any of them is fetched; a claimed headline is released again when its link
+    produces no accepted article. With
+    config.head_first_fetch, article downloads stop after the head when it shows a date outside
+    the window or a canonical URL taken by another link. Articles whose title or content was
+    already accepted by the shared deduplicator are dropped as soon as they are parsed. Finished
+    articles are released in listing order as soon as every earlier link is done; each released
+    run is checked against the time window ending at as_of in one batch, claims its titles and
+    content hashes in the deduplicator, and is handed to accept, the run's final stage.
+    """
+    config = config or ScraperConfig()
+    as_of = as_of or datetime.now(timezone.utc)
+    component = f"{source_name.lower()}_scraper"
+    log_info(f"Starting {source_name} scraping", component)
     
     articles = []
     
     try:
-        # Get article links from CNN business page
-        cnn_article_links = await get_cnn_articles()
+        # Get article links from the business page
+        article_links = await get_links(fetcher, seen_urls, as_of=as_of, window_hours=config.window_hours)
         
-        if not cnn_article_links:
-            log_info("No articles found on CNN business page", "cnn_scraper")
+        if not article_links:
+            log_info(f"No articles found on {source_name} business page", component)
             return articles
             
-        log_info(f"Found {len(cnn_article_links)} potential articles on CNN", "cnn_scraper")
+        log_info(f"Found {len(article_links)} potential articles on {source_name}", component)
         
-        # Process each article link
-        for article_link in cnn_article_links:
-            title = article_link.get('title', '')
-            url = article_link.get('url', '')
-            
-            if not url:
-                continue
-                
-            # Apply rate limiting before making request
-            await rate_limit()
-            
-            # Extract content from the article page
-            content_data = await extract_cnn_content(url)
-            
-            if content_data:
-                # Check if article is within 72 hours
-                pub_date_str = content_data.get('publication_date')
-                pub_date = parse_article_date(pub_date_str, content_data['source']) if pub_date_str else None
-                if pub_date and is_within_72_hours(pub_date):
-                    # Create and add the article
-                    article = EnhancedNewsArticle(
-                        id=hash(url).__str__(),
-                        title=content_data['title'],
-                        content=content_data['content'],
-                        url=content_data['url'],
-                        publication_date=pub_date,
-                        source=content_data['source']
-                    )
-                    articles.append(article)
-                    log_info(f"Added CNN article: {title}", "cnn_scraper")
-                else:
-                    log_info(f"Skipped CNN article (too old): {title}", "cnn_scraper")
-            else:
-                log_info(f"Failed to extract content from CNN URL: {url}", "cnn_scraper")
+        if deduplicator is not None:
+            article_links = _skip_duplicate_listings(article_links, source_name, deduplicator, seen_store)
+        
+        semaphore = asyncio.Semaphore(max(1, config.max_concurrency))
+        
+        # Each article download gets its own head screen judged against the run's window
+        screen_for = functools.partial(
+            HeadScreen, source=source_name.lower(), seen_urls=seen_urls, window_hours=config.window_hours, as_of=as_of
+        ) if config.head_first_fetch else None
+        
+        tasks = [
+            asyncio.ensure_future(_process_article_link(
+                article_link, extract_content, fetcher, semaphore, source_name, seen_store, screen_for, deduplicator
+            ))
+            for article_link in article_links
+        ]
+        try:
+            released = 0
+            for finished in asyncio.as_completed(tasks):
+                await finished
+                # Release the finished prefix so results keep the order of article_links
+                ready = []
+                while released < len(tasks) and tasks[released].done():
+                    ready.append(tasks[released].result())
+                    released += 1
+                if ready:
+                    kept = _release_articles(ready, source_name, config, as_of, deduplicator, accept)
+                    articles.extend(kept)
+                    released_links = article_links[released - len(ready):released]
+                    if deduplicator is not None:
+                        _release_listing_claims(released_links, ready, kept, deduplicator)
+                    if seen_store is not None:
+                        _record_seen(released_links, ready, kept, seen_store)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
                 
     except Exception as e:
-        log_error(f"CNN scraping error: {str(e)}", "cnn_scraper")
+        log_error(f"{source_name} scraping error: {str(e)}", component)
         raise  # Re-raise to be caught by the main function
     
-    log_info(f"Completed CNN scraping: {len(articles)} articles", "cnn_scraper")
+    log_info(f"Completed {source_name} scraping: {len(articles)} articles", component)
     return articles
 
 
-async def _scrape_cnbc() -> List[EnhancedNewsArticle]:
+def _release_articles(results: List[Optional[EnhancedNewsArticle]], source_name: str, config: ScraperConfig,
+                      as_of: datetime, deduplicator: Optional[Deduplicator] = None,
+                      accept: Optional[Callable[[List[EnhancedNewsArticle]], List[EnhancedNewsArticle]]] = None) -> List[EnhancedNewsArticle]:
     """
-    Scrape articles from CNBC business section
+    Pass a run of finished links, in listing order, through the time window, the deduplicator and accept
     """
-    log_info("Starting CNBC scraping", "cnbc_scraper")
-    
-    articles = []
+    component = f"{source_name.lower()}_scraper"
+    parsed = [article for article in results if article is not None]
     
-    try:
-        # Get article links from CNBC business page
-        cnbc_article_links = await get_cnbc_articles()
-        
-        if not cnbc_article_links:
-            log_info("No articles found on CNBC business page", "cnbc_scraper")
-            return articles
-            
-        log_info(f"Found {len(cnbc_article_links)} potential articles on CNBC", "cnbc_scraper")
-        
-        # Process each article link
-        for article_link in cnbc_article_links:
-            title = article_link.get('title', '')
-            url = article_link.get('url', '')
-            
-            if not url:
-                continue
-                
-            # Apply rate limiting before making request
-            await rate_limit()
-            
-            # Extract content from the article page
-            content_data = await extract_cnbc_content(url)
-            
-            if content_data:
-                # Check if article is within 72 hours
-                pub_date_str = content_data.get('publication_date')
-                pub_date = parse_article_date(pub_date_str, content_data['source']) if pub_date_str else None
-                if pub_date and is_within_72_hours(pub_date):
-                    # Create and add the article
-                    article = EnhancedNewsArticle(
-                        id=hash(url).__str__(),
-                        title=content_data['title'],
-                        content=content_data['content'],
-                        url=content_data['url'],
-                        publication_date=pub_date,
-                        source=content_data['source']
-                    )
-                    articles.append(article)
-                    log_info(f"Added CNBC article: {title}", "cnbc_scraper")
-                else:
-                    log_info(f"Skipped CNBC article (too old): {title}", "cnbc_scraper")
-            else:
-                log_info(f"Failed to extract content from CNBC URL: {url}", "cnbc_scraper")
-                
-    except Exception as e:
-        log_error(f"CNBC scraping error: {str(e)}", "cnbc_scraper")
-        raise  # Re-raise to be caught by the main function
+    articles = filter_within_window(parsed, as_of, config.window_hours)
+    if len(articles) < len(parsed):
+        kept = {id(article) for article in articles}
+        for article in parsed:
+            if id(article) not in kept:
+                log_info(f"Skipped {source_name} article (too old): {article.title}", component)
     
-    log_info(f"Completed CNBC scraping: {len(articles)} articles", "cnbc_scraper")
+    if deduplicator is not None:
+        # Claimed only inside the window, so a copy that is too old never blocks a current one
+        articles = deduplicator.process_articles(articles)
+    if accept is not None:
+        articles = accept(articles)
     return articles
 
 
-def run_scraper():
+def _release_listing_claims(article_links: List[Dict[str, Any]], results: List[Optional[EnhancedNewsArticle]],
+                            kept: List[EnhancedNewsArticle], deduplicator: Deduplicator) -> None:
     """
-    Synchronous function to run the scraper and handle command-line execution
+    Release the listing headlines of links that produced no accepted article
+
+    A link that failed to fetch, fell outside the window or was dropped as a duplicate leaves its
+    headline free, so a later link with the same headline is still fetched.
     """
-    # Setup logging
-    setup_logging()
+    kept_ids = {id(article) for article in kept}
+    for article_link, article in zip(article_links, results):
+        if article is None or id(article) not in kept_ids:
+            deduplicator.release_listing_title(article_link.get('title', ''), article_link.get('url', ''))
+
+
+def _record_seen(article_links: List[Dict[str, Any]], results: List[Optional[EnhancedNewsArticle]],
+                 kept: List[EnhancedNewsArticle], seen_store: SeenArticleStore) -> None:
+    """
+    Remember the links whose article was accepted and handed to the output, so later runs skip them
+
+    Articles dropped by the time window or the duplicate checks are not recorded, so a later run
+    still fetches and can emit them.
+    """
+    kept_ids = {id(article) for article in kept}
+    for article_link, article in zip(article_links, results):
+        if article is not None and id(article) in kept_ids:
+            seen_store.record(article_link.get('url', ''), article_link.get('title', ''),
+                              generate_content_hash(article.content), article.publication_date)
+
+
+def _skip_duplicate_listings(article_links: List[Dict[str, Any]], source_name: str, deduplicator: Deduplicator,
+                             seen_store: Optional[SeenArticleStore] = None) -> List[Dict[str, Any]]:
+    """
+    Drop listing links whose headline is already taken, before their rate-limited fetch
+    
+    A headline is taken when another link of this run (from either source) or an accepted article
+    has the same normalized title, or when an earlier run processed it under another URL.
+    """
+    component = f"{source_name.lower()}_scraper"
+    optimizer = get_performance_optimizer()
+    kept = []
+    
+    for article_link in article_links:
+        title = article_link.get('title', '')
+        url = article_link.get('url', '')
+        if seen_store is not None and seen_store.find_recirculated(url, title) is not None:
+            reason = "headline processed in an earlier run"
+        elif not deduplicator.claim_listing_title(title, url):
+            reason = "headline already listed in this run"
+        else:
+            kept.append(article_link)
+            continue
+        optimizer.increment_listing_title_skips()
+        log_info(f"Skipped {source_name} link ({reason}): {title}", component)
     
-    # Run the scraping process
-    result = asyncio.run(scrape_news_sources())
+    return kept
+
+
+async def _process_article_link(article_link: Dict[str, Any], extract_content, fetcher: Optional[Fetcher],
+                                semaphore: asyncio.Semaphore, source_name: str,
+                                seen_store: Optional[SeenArticleStore] = None,
+                                screen_for: Optional[Callable[[str], HeadScreen]] = None,
+                                deduplicator: Optional[Deduplicator] = None) -> Optional[EnhancedNewsArticle]:
+    """
+    Fetch and parse a single article link while holding a worker slot
+    
+    Returns the article when it has a publication date and does not duplicate an article already
+    accepted by the deduplicator; the caller checks it against the time window.
+    """
+    component = f"{source_name.lower()}_scraper"
+    title = article_link.get('title', '')
+    url = article_link.get('url', '')
+    
+    if not url:
+        return None
+    
+    if seen_store is not None and seen_store.is_unchanged(url, title):
+        get_performance_optimizer().increment_incremental_skips()
+        log_info(f"Skipped {source_name} article (already processed in an earlier run): {title}", component)
+        return None
+    
+    async with semaphore:
+        # Extract content from the article page (the fetcher applies per-host rate limiting)
+        if screen_for is not None:
+            screen = screen_for(url)
+            content_data = await extract_content(url, fetcher, screen=screen)
+        else:
+            screen = None
+            content_data = await extract_content(url, fetcher)
+    
+    if not content_data and screen is not None and screen.reason:
+        log_info(f"Skipped {source_name} article ({screen.reason}, stopped after the page head): {title}", component)
+        return None
+    
+    if not content_data:
+        log_info(f"Failed to extract content from {source_name} URL: {url}", component)
+        return None
+    
+    if content_data.get('extraction_path'):
+        get_performance_optimizer().record_extraction_path(source_name, content_data['extraction_path'])
+    
+    pub_date_str = content_data.get('publication_date')
+    pub_date = parse_article_date(pub_date_str, content_data['source']) if pub_date_str else None
+    
+    # An unchanged body was already emitted by an earlier run; the new listing headline is recorded
+    # so later runs skip the link without fetching. Accepted articles are recorded once released.
+    if seen_store is not None:
+        content_hash = generate_content_hash(content_data['content'])
+        if seen_store.has_same_content(url, content_hash):
+            seen_store.record(url, title, content_hash, pub_date)
+            log_info(f"Skipped {source_name} article (content unchanged since an earlier run): {title}", component)
+            return None
+    
+    if not pub_date:
+        log_info(f"Skipped {source_name} article (no publication date): {title}", component)
+        return None
     
-    # Write results to markdown
+    # Create the article
+    article = EnhancedNewsArticle(
+        id=generate_article_id(content_data['url']),
+        title=content_data['title'],
+        content=content_data['content'],
+        url=content_data['url'],
+        publication_date=pub_date,
+        source=content_data['source'],
+        scraped_at=datetime.now(timezone.utc)
+    )
+    if deduplicator is not None and deduplicator.is_duplicate(article):
+        log_info(f"Skipped {source_name} article (duplicate of an accepted article): {title}", component)
+        return None
+    log_info(f"Added {source_name} article: {title}", component)
+    return article
+
+
+OUTPUT_FORMATS = ("markdown", "jsonl", "both")
+
+
+def _open_writers(output_format: str = "markdown", output_file: Optional[str] = None,
+                  jsonl_file: Optional[str] = None, compression: Optional[str] = None,
+                  append: bool = False) -> list:
+    """
+    Create the stream writers for the selected output format
+
+    Parameters:
+    - output_format (str): "markdown", "jsonl" or "both"
+    - output_file (str): Markdown filename; defaults to the naming convention
+    - jsonl_file (str): JSON Lines filename; defaults to the naming convention with a .jsonl extension
+    - compression (str): None, "gzip" or "zstd" for the JSON Lines output
+    - append (bool): Append to an existing JSON Lines file instead of replacing it
+
+    Returns: List of writers, each with write_article and close
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format {output_format!r}; use one of {', '.join(OUTPUT_FORMATS)}")
+    writers = []
+    if output_format in ("markdown", "both"):
+        writers.append(MarkdownStreamWriter(output_file))
+    if output_format in ("jsonl", "both"):
+        writers.append(JsonlStreamWriter(jsonl_file, append=append, compression=compression))
+    return writers
+
+
+def _fan_out(writers: list) -> Callable[[EnhancedNewsArticle], None]:
+    """
+    Build a sink that hands each accepted article to every writer
+    """
+    def sink(article: EnhancedNewsArticle) -> None:
+        for writer in writers:
+            writer.write_article(article)
+    return sink
+
+
+def _report(result: ScrapingResult, output_files: List[str]) -> None:
+    """
+    Print where the articles went and any errors of the run
+    """
     if result.articles:
-        output_file = write_to_markdown(result.articles)
         print(f"Successfully processed {len(result.articles)} articles")
-        print(f"Output written to: {output_file}")
+        for output_file in output_files:
+            if output_file:
+                print(f"Output written to: {output_file}")
     else:
         print(f"No articles processed, but found {len(result.errors)} errors")
         
@@ -266,32 +554,44 @@ def run_scraper():
         print(f"Encountered {len(result.errors)} errors:")
         for error in result.errors:
             print(f"  - {error['source']}: {error['error']}")
+
+
+def run_scraper(output_format: str = "markdown", output_file: Optional[str] = None,
+                jsonl_file: Optional[str] = None, compression: Optional[str] = None, append: bool = False,
+                config: Optional[ScraperConfig] = None):
+    """
+    Synchronous function to run the scraper and handle command-line execution
+    
+    Parameters are those of _open_writers, plus config (ScraperConfig) for the run settings.
+    """
+    # Setup logging
+    setup_logging()
+    
+    # Articles are written as soon as they are accepted; the files are finalized even if the run fails
+    writers = _open_writers(output_format, output_file, jsonl_file, compression, append)
+    try:
+        result = asyncio.run(scrape_news_sources(config, sink=_fan_out(writers)))
+    finally:
+        output_files = [writer.close() for writer in writers]
     
+    _report(result, output_files)
     return result
 
 
-async def run_scraper_async():
+async def run_scraper_async(output_format: str = "markdown", output_file: Optional[str] = None,
+                            jsonl_file: Optional[str] = None, compression: Optional[str] = None, append: bool = False,
+                            config: Optional[ScraperConfig] = None):
     """
     Asynchronous function to run the scraper (used by main entry point)
     """
     # Setup logging
     setup_logging()
     
-    # Run the scraping process
-    result = await scrape_news_sources()
-    
-    # Write results to markdown
-    if result.articles:
-        output_file = write_to_markdown(result.articles)
-        print(f"Successfully processed {len(result.articles)} articles")
-        print(f"Output written to: {output_file}")
-    else:
-        print(f"No articles processed, but found {len(result.errors)} errors")
-        
-    # Print any errors
-    if result.errors:
-        print(f"Encountered {len(result.errors)} errors:")
-        for error in result.errors:
-            print(f"  - {error['source']}: {error['error']}")
+    writers = _open_writers(output_format, output_file, jsonl_file, compression, append)
+    try:
+        result = await scrape_news_sources(config, sink=_fan_out(writers))
+    finally:
+        output_files = [writer.close() for writer in writers]
     
-    return result
\ No newline at end of file
+    _report(result, output_files)
+    return result
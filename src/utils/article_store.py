@@ -0,0 +1,217 @@
+"""
+Persistent store of articles seen in earlier runs, used to crawl incrementally
+"""
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional
+from pathlib import Path
+
+# Add the src directory to Python path for absolute imports
+src_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(src_dir))
+
+from utils.helpers import log_info, log_warning
+from utils.url_utils import generate_article_id
+from utils.date_filter import extract_url_date
+
+
+DEFAULT_STORE_PATH = ".scraper_cache/seen_articles.json"
+
+# Shorter listing headlines ("Watch live", "Read more") are too generic to identify a story
+MIN_LISTING_TITLE_WORDS = 3
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a title for comparison (case-insensitive, whitespace-normalized)
+    """
+    return ' '.join((title or '').lower().split())
+
+
+class JsonEntryStore:
+    """
+    Base of the persistent stores kept between runs: a JSON object of entries keyed by article ID,
+    loaded on start, saved atomically, and pruned once an entry's publication date and last-seen
+    time both fall outside the time window. Subclasses name the store for log messages and keep
+    any in-memory index in step through _check_entries and _forget.
+    """
+
+    description = "store"
+    component = "article_store"
+
+    def __init__(self, path: str, window_hours: int = 72):
+        self.path = Path(path)
+        self.window_hours = window_hours
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load stored entries, starting empty if the file is missing or unreadable
+        """
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            self._check_entries(entries)
+            return entries
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            log_warning(f"Ignoring unreadable {self.description} {self.path}: {str(e)}", self.component)
+            return {}
+
+    def _check_entries(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Raise if loaded entries lack fields the store relies on
+        """
+        if not isinstance(entries, dict):
+            raise TypeError(f"expected a JSON object, got {type(entries).__name__}")
+
+    def _forget(self, keys: List[str]) -> None:
+        """
+        Drop entries by key
+        """
+        for key in keys:
+            del self.entries[key]
+
+    def prune(self, now: Optional[datetime] = None) -> int:
+        """
+        Drop entries whose publication date and last-seen time are both older than the window
+
+        Returns: Number of entries removed
+        """
+        now = now or datetime.now(timezone.utc)
+        cutoff = now - timedelta(hours=self.window_hours)
+
+        expired = []
+        for key, entry in self.entries.items():
+            timestamps = [_parse_timestamp(entry.get('publication_date')), _parse_timestamp(entry.get('last_seen'))]
+            newest = max((ts for ts in timestamps if ts is not None), default=None)
+            if newest is None or newest < cutoff:
+                expired.append(key)
+
+        if expired:
+            self._forget(expired)
+            log_info(f"Pruned {len(expired)} expired entries from {self.description}", self.component)
+        return len(expired)
+
+    def save(self) -> None:
+        """
+        Persist the store atomically
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log_warning(f"Failed to save {self.description} {self.path}: {str(e)}", self.component)
+
+
+class SeenArticleStore(JsonEntryStore):
+    """
+    Records every article the scraper has fetched, keyed by a stable article ID, with its URL,
+    listing title, content hash and publication date. Links that were already processed and whose
+    listing title has not changed are skipped without a request. Entries expire once both their
+    publication date and the last time they were listed fall outside the time window.
+    """
+
+    description = "seen-article store"
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, window_hours: int = 72):
+        super().__init__(path, window_hours)
+        # Normalized listing headline -> key of the entry last recorded under it
+        self.titles: Dict[str, str] = {}
+        self._index_titles()
+
+    def _forget(self, keys: List[str]) -> None:
+        super()._forget(keys)
+        self._index_titles()
+
+    def _index_titles(self) -> None:
+        self.titles = {entry['listing_title']: key for key, entry in self.entries.items() if entry.get('listing_title')}
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored entry for a URL, if any
+        """
+        return self.entries.get(generate_article_id(url))
+
+    def is_unchanged(self, url: str, listing_title: str = "") -> bool:
+        """
+        Check whether a listing link was already processed in an earlier run and is unchanged
+
+        A link counts as unchanged when its URL is known and the listing headline matches the one
+        recorded; a changed headline usually means the story was updated, so it is fetched again.
+        Matching links have their last-seen time refreshed so they do not expire while still listed.
+        """
+        entry = self.get(url)
+        if entry is None:
+            return False
+        if listing_title and entry.get('listing_title') and entry['listing_title'] != normalize_title(listing_title):
+            return False
+
+        entry['last_seen'] = datetime.now(timezone.utc).isoformat()
+        return True
+
+    def find_recirculated(self, url: str, listing_title: str) -> Optional[Dict[str, Any]]:
+        """
+        Find an article processed in an earlier run under the same listing headline but another URL
+
+        Cross-posted and recirculated stories reappear on the landing pages under new URLs. A match
+        needs a headline of at least MIN_LISTING_TITLE_WORDS words, and when both URLs carry a
+        /yyyy/mm/dd/ date it must be the same day, so recurring daily headlines are still fetched.
+        The matched entry's last-seen time is refreshed so it does not expire while still listed.
+        """
+        normalized_title = normalize_title(listing_title)
+        if len(normalized_title.split()) < MIN_LISTING_TITLE_WORDS:
+            return None
+        entry = self.entries.get(self.titles.get(normalized_title, ''))
+        if entry is None or entry['url'] == url:
+            return None
+        url_date, stored_date = extract_url_date(url), extract_url_date(entry['url'])
+        if url_date is not None and stored_date is not None and url_date != stored_date:
+            return None
+
+        entry['last_seen'] = datetime.now(timezone.utc).isoformat()
+        return entry
+
+    def has_same_content(self, url: str, content_hash: str) -> bool:
+        """
+        Check whether a refetched article still has the content hash recorded earlier
+        """
+        entry = self.get(url)
+        return bool(entry and content_hash and entry.get('content_hash') == content_hash)
+
+    def record(self, url: str, listing_title: str, content_hash: str, publication_date: Optional[datetime]) -> None:
+        """
+        Record a processed article so later runs can skip it
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        key = generate_article_id(url)
+        if normalize_title(listing_title):
+            self.titles[normalize_title(listing_title)] = key
+        self.entries[key] = {
+            'url': url,
+            'listing_title': normalize_title(listing_title),
+            'content_hash': content_hash,
+            'publication_date': publication_date.isoformat() if publication_date else None,
+            'last_seen': now
+        }
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a stored ISO timestamp into an aware UTC datetime
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
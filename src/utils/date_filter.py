@@ -2,9 +2,11 @@
 Date/time parsing and 72-hour filtering logic for news articles
 """
 import sys
+import math
+from array import array
 from datetime import datetime, timedelta, timezone
-from dateutil import parser as dateutil_parser
 import re
+from typing import Iterable, List, Optional, Sequence
 from pathlib import Path
 
 # Add the src directory to Python path for absolute imports
@@ -12,84 +14,210 @@ src_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(src_dir))
 
 from models.article import EnhancedNewsArticle
+# Dates are parsed by the shared engine in utils.date_parser; re-exported for existing callers
+from utils.date_parser import parse_article_date
 
 
-def is_within_72_hours(pub_date: datetime) -> bool:
+# Default size of the time window in hours
+DEFAULT_WINDOW_HOURS = 72
+
+
+def to_epoch(value: Optional[datetime]) -> float:
+    """
+    Convert a datetime to epoch seconds, reading naive values as UTC; None becomes NaN
+    """
+    if value is None:
+        return math.nan
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def to_epoch_array(dates: Iterable[Optional[datetime]]) -> array:
+    """
+    Convert a sequence of datetimes to a compact array of epoch seconds (NaN for missing dates)
+    """
+    return array('d', (to_epoch(value) for value in dates))
+
+
+def window_cutoff(as_of: Optional[datetime] = None, window_hours: int = DEFAULT_WINDOW_HOURS) -> float:
+    """
+    Epoch seconds of the oldest instant inside the window ending at as_of
+    
+    Args:
+        as_of (datetime): End of the window, normally one instant taken at the start of a run; defaults to now
+        window_hours (int): Size of the time window in hours
+        
+    Returns:
+        float: Cutoff as epoch seconds
+    """
+    as_of_epoch = to_epoch(as_of) if as_of is not None else datetime.now(timezone.utc).timestamp()
+    return as_of_epoch - window_hours * 3600
+
+
+def window_mask(epochs: Sequence[float], as_of: Optional[datetime] = None,
+                window_hours: int = DEFAULT_WINDOW_HOURS) -> List[bool]:
+    """
+    Check a whole batch of timestamps against one time window
+    
+    Every timestamp is compared with the same cutoff, so results are consistent for a run
+    however long it takes; missing dates (NaN) are outside.
+    
+    Args:
+        epochs (Sequence[float]): Publication times as epoch seconds, e.g. from to_epoch_array
+        as_of (datetime): End of the window; defaults to now
+        window_hours (int): Size of the time window in hours
+        
+    Returns:
+        List[bool]: True for each timestamp inside the window
+    """
+    cutoff = window_cutoff(as_of, window_hours)
+    return [epoch >= cutoff for epoch in epochs]
+
+
+def filter_within_window(articles: Sequence[EnhancedNewsArticle], as_of: Optional[datetime] = None,
+                         window_hours: int = DEFAULT_WINDOW_HOURS) -> List[EnhancedNewsArticle]:
+    """
+    Keep the articles published inside the time window, in their original order
+    
+    Args:
+        articles (Sequence[EnhancedNewsArticle]): Articles to filter, e.g. one run's results or an archive backfill
+        as_of (datetime): End of the window; defaults to now
+        window_hours (int): Size of the time window in hours
+        
+    Returns:
+        List[EnhancedNewsArticle]: Articles inside the window
+    """
+    mask = window_mask(to_epoch_array(article.publication_date for article in articles), as_of, window_hours)
+    return [article for article, inside in zip(articles, mask) if inside]
+
+
+def is_within_72_hours(pub_date: datetime, as_of: Optional[datetime] = None) -> bool:
     """
     Check if an article's publication date is within the last 72 hours (3 days)
     to ensure news relevance as required by constitution principle.
     
     Args:
         pub_date (datetime): The publication date to check
+        as_of (datetime): End of the window; defaults to the current time
         
     Returns:
-        bool: True if date is within 72 hours of current time, False otherwise
+        bool: True if date is within 72 hours of as_of, False otherwise
     """
     if not pub_date:
         return False
+    return to_epoch(pub_date) >= window_cutoff(as_of, DEFAULT_WINDOW_HOURS)
+
+
+# Calendar date embedded in article URLs, e.g. /2025/11/03/
+URL_DATE_PATTERN = re.compile(r'/(\d{4})/(\d{2})/(\d{2})/')
+
+# A URL date is a US Eastern calendar day, which ends at most 5 hours into the next UTC day
+URL_DATE_LATEST_OFFSET = timedelta(days=1, hours=5)
+
+# Attributes on listing cards that carry a publication or update timestamp
+LISTING_TIMESTAMP_ATTRIBUTES = ['data-timestamp', 'data-published', 'data-last-updated', 'data-datetime', 'datetime']
+
+
+def extract_url_date(url: str) -> Optional[datetime]:
+    """
+    Extract the calendar date from a /yyyy/mm/dd/ URL path
     
-    # Ensure both dates are timezone-aware for comparison
-    now = datetime.now(timezone.utc)
-    if pub_date.tzinfo is None:
-        pub_date = pub_date.replace(tzinfo=timezone.utc)
-    else:
-        pub_date = pub_date.astimezone(timezone.utc)
+    Args:
+        url (str): Article URL
+        
+    Returns:
+        datetime: Midnight UTC of the URL date, or None if the URL carries no valid date
+    """
+    match = URL_DATE_PATTERN.search(url or "")
+    if not match:
+        return None
+    try:
+        return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)), tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def extract_listing_timestamp(element) -> str:
+    """
+    Find a timestamp for a listing link in its markup before the article is fetched
     
-    # Calculate time difference
-    time_diff = now - pub_date
+    Looks at the anchor's own timestamp attributes, a <time> element inside it, and the
+    attributes of the card element that directly contains it.
     
-    # Check if the difference is less than or equal to 72 hours
-    max_allowed = timedelta(hours=72)
-    return time_diff <= max_allowed
+    Args:
+        element: BeautifulSoup anchor tag from the landing page
+        
+    Returns:
+        str: Raw timestamp string, or empty string if none is present
+    """
+    if element is None:
+        return ""
+    
+    candidates = [element]
+    time_element = element.find('time') if hasattr(element, 'find') else None
+    if time_element is not None:
+        candidates.append(time_element)
+    if getattr(element, 'parent', None) is not None:
+        candidates.append(element.parent)
+    
+    for candidate in candidates:
+        attrs = getattr(candidate, 'attrs', None) or {}
+        for attribute in LISTING_TIMESTAMP_ATTRIBUTES:
+            value = attrs.get(attribute)
+            if value and isinstance(value, str):
+                return value.strip()
+    return ""
 
 
-def parse_article_date(date_string: str, source: str) -> datetime:
+def _parse_listing_timestamp(value: str, source: str) -> Optional[datetime]:
     """
-    Parse article publication date from various source-specific formats
+    Parse a listing timestamp, accepting epoch seconds or milliseconds as well as date strings
+    """
+    if not value:
+        return None
+    if value.isdigit():
+        epoch = int(value)
+        if epoch > 10 ** 11:  # Milliseconds
+            epoch = epoch / 1000
+        try:
+            return datetime.fromtimestamp(epoch, tz=timezone.utc)
+        except (OverflowError, OSError, ValueError):
+            return None
+    return parse_article_date(value, source)
+
+
+def prescreen_listing_date(url: str, listing_timestamp: str = "", source: str = "",
+                           as_of: Optional[datetime] = None, window_hours: int = 72) -> Optional[bool]:
+    """
+    Decide from the URL path and listing markup alone whether a link is outside the time window
+    
+    Only links that are clearly too old are reported as outside: a URL date counts until the
+    end of that US Eastern day, so borderline links are still fetched and checked exactly.
     
     Args:
-        date_string (str): Raw date string from the article page
+        url (str): Article URL
+        listing_timestamp (str): Timestamp found next to the link on the landing page
         source (str): Source website identifier ("cnn" or "cnbc")
+        as_of (datetime): Reference instant; defaults to now
+        window_hours (int): Size of the time window in hours
         
     Returns:
-        datetime: Parsed datetime object in UTC timezone, or None if parsing fails
+        bool: True if the link is clearly outside the window, False if it is inside,
+        or None if no date could be determined before fetching
     """
-    if not date_string:
-        return None
+    as_of = as_of or datetime.now(timezone.utc)
+    cutoff = as_of - timedelta(hours=window_hours)
     
-    try:
-        # Different date formats for different sources
-        if source.lower() == "cnn":
-            # CNN usually has formats like "Published: May 12, 2023" or "Updated May 12, 2023"
-            # Remove common prefixes
-            cleaned_date = date_string.strip()
-            if "updated" in cleaned_date.lower():
-                cleaned_date = cleaned_date.lower().replace("updated", "").strip()
-            elif "published:" in cleaned_date.lower():
-                cleaned_date = cleaned_date.lower().replace("published:", "").strip()
-        elif source.lower() == "cnbc":
-            # CNBC might have formats like "5:30 PM ET May 12, 2023" or "Published: May 12, 2023 5:30 PM ET"
-            cleaned_date = date_string.strip()
-            # Remove "Published:" prefix if present
-            if "published:" in cleaned_date.lower():
-                cleaned_date = cleaned_date.lower().replace("published:", "").strip()
-        else:
-            # For other sources or if source is unknown, don't modify the date string
-            cleaned_date = date_string.strip()
-        
-        # Use dateutil parser which handles many formats
-        parsed_date = dateutil_parser.parse(cleaned_date)
-        
-        # Ensure the date is timezone-aware (convert to UTC)
-        if parsed_date.tzinfo is None:
-            parsed_date = parsed_date.replace(tzinfo=timezone.utc)
-        else:
-            parsed_date = parsed_date.astimezone(timezone.utc)
-            
-        return parsed_date
-    except (ValueError, TypeError):
-        # If parsing fails, return None to indicate the failure
-        return None
+    listing_date = _parse_listing_timestamp(listing_timestamp, source)
+    if listing_date is not None:
+        return listing_date < cutoff
+    
+    url_date = extract_url_date(url)
+    if url_date is not None:
+        return url_date + URL_DATE_LATEST_OFFSET < cutoff
+    
+    return None
 
 
 def format_output_date(date_obj: datetime) -> str:
@@ -1,72 +1,165 @@
 """
 Utility functions for date/time parsing with comprehensive error handling
+
+parse_article_date is the single date-parsing engine of the scraper. A date string goes through
+three stages, cheapest first: datetime.fromisoformat for the ISO-8601 datetime attributes and
+JSON-LD values that make up most inputs, compiled patterns for the CNN and CNBC display formats,
+and only then dateutil. Results are memoized, since the same strings recur across listing cards,
+article pages and runs.
 """
+import functools
+import re
+import sys
 from datetime import datetime, timezone, timedelta
 from typing import Optional
+from pathlib import Path
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from dateutil import parser
+from dateutil import tz as dateutil_tz
+
+# Add the src directory to Python path for absolute imports
+src_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(src_dir))
 
 
-def parse_article_date(date_string: str, source: str) -> Optional[datetime]:
+def _load_zone(name: str):
     """
-    Parse publication date from article content according to source-specific formats
+    Load an IANA time zone, falling back to the zone data bundled with dateutil
     """
-    if not date_string:
+    try:
+        return ZoneInfo(name)
+    except ZoneInfoNotFoundError:
+        return dateutil_tz.gettz(name)
+
+
+US_EASTERN = _load_zone("America/New_York")
+
+# Zone abbreviations the sources print; ET follows daylight saving time, EST and EDT are fixed offsets
+TIMEZONE_ABBREVIATIONS = {
+    'ET': US_EASTERN,
+    'EST': timezone(timedelta(hours=-5), 'EST'),
+    'EDT': timezone(timedelta(hours=-4), 'EDT'),
+    'UTC': timezone.utc,
+    'GMT': timezone.utc,
+}
+
+# Labels in front of the date, e.g. "Published:", "Updated", "First Published"
+DATE_PREFIX_PATTERN = re.compile(r'^(?:first\s+)?(?:published|updated)\s*:?\s*', re.IGNORECASE)
+
+MONTHS = {name: number for number, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], start=1)}
+
+_MONTH = r'(?P<month>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?'
+_WEEKDAY = r'(?:(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*\.?,?\s+)?'
+_DATE = _MONTH + r'\s+(?P<day>\d{1,2}),?\s+(?P<year>\d{4})'
+_TIME = (r'(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?\s*(?P<ampm>[ap]\.?m\.?)?'
+         r'(?:\s*(?P<tz>' + '|'.join(TIMEZONE_ABBREVIATIONS) + r'))?')
+
+# Display formats of the sources, tried in order against the whole string after the prefix
+KNOWN_DATE_FORMATS = [
+    # "10:32 AM EDT, Mon November 3, 2025" (CNN), "5:30 PM EST May 12, 2023" (CNBC)
+    re.compile(_TIME + r',?\s+' + _WEEKDAY + _DATE, re.IGNORECASE),
+    # "Mon, Nov 3 2025 10:15 AM EST" (CNBC), "May 12, 2023, 5:30 PM", "May 12, 2023 at 10:30 AM", "November 3, 2025"
+    re.compile(_WEEKDAY + _DATE + r'(?:,?\s+(?:at\s+)?' + _TIME + r')?', re.IGNORECASE),
+]
+
+# Two different defaults for dateutil: a field that differs between the two results was not in the string
+_DEFAULT_A = datetime(2000, 1, 1)
+_DEFAULT_B = datetime(2001, 2, 2)
+
+
+def _to_utc(value: datetime) -> datetime:
+    """
+    Make a datetime UTC-aware, reading naive values as UTC
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _from_match(match: re.Match) -> Optional[datetime]:
+    """
+    Build a UTC datetime from a KNOWN_DATE_FORMATS match
+    """
+    hour = int(match.group('hour') or 0)
+    ampm = (match.group('ampm') or '').lower()
+    if ampm:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if ampm.startswith('p') else 0)
+    try:
+        value = datetime(
+            int(match.group('year')), MONTHS[match.group('month').lower()], int(match.group('day')),
+            hour, int(match.group('minute') or 0), int(match.group('second') or 0)
+        )
+    except ValueError:
         return None
-        
+    zone = match.group('tz')
+    if zone:
+        value = value.replace(tzinfo=TIMEZONE_ABBREVIATIONS[zone.upper()])
+    return _to_utc(value)
+
+
+def _parse_uncached(date_string: str) -> Optional[datetime]:
+    """
+    Run the three parsing stages on one stripped date string
+    """
+    cleaned = DATE_PREFIX_PATTERN.sub('', date_string, count=1)
+    if not cleaned:
+        return None
+
     try:
-        # Handle common date formats from different sources
-        if source.lower() == "cnn":
-            # CNN often has dates in formats like "Updated: May 12, 2023" or "Updated May 12, 2023"
-            date_string = date_string.strip()
-            
-            # Remove common prefixes
-            prefixes = ["Published: ", "Updated: ", "Published ", "Updated "]
-            for prefix in prefixes:
-                if date_string.startswith(prefix):
-                    date_string = date_string[len(prefix):].strip()
-                    break
-                    
-            # Try parsing with dateutil
-            return parser.parse(date_string)
-        
-        elif source.lower() == "cnbc":
-            # CNBC might have formats like "5:30 PM EST May 12, 2023" or "May 12, 2023, 5:30 PM"
-            date_string = date_string.strip()
-            
-            # Remove common prefixes
-            prefixes = ["Published: ", "First Published: ", "Published ", "First Published "]
-            for prefix in prefixes:
-                if date_string.startswith(prefix):
-                    date_string = date_string[len(prefix):].strip()
-                    break
-                    
-            # Try parsing with dateutil
-            return parser.parse(date_string)
-        
-        # Default: try dateutil parser for unknown sources
-        return parser.parse(date_string)
-    
-    except (ValueError, TypeError, parser.ParserError):
-        # If parsing fails, return None to indicate the failure
+        return _to_utc(datetime.fromisoformat(cleaned))
+    except ValueError:
+        pass
+
+    for pattern in KNOWN_DATE_FORMATS:
+        match = pattern.fullmatch(cleaned)
+        if match:
+            parsed = _from_match(match)
+            if parsed is not None:
+                return parsed
+
+    try:
+        first = parser.parse(cleaned, default=_DEFAULT_A, tzinfos=TIMEZONE_ABBREVIATIONS)
+        second = parser.parse(cleaned, default=_DEFAULT_B, tzinfos=TIMEZONE_ABBREVIATIONS)
+    except (ValueError, TypeError, OverflowError):
         return None
+    if first.date() != second.date():
+        return None  # Year, month or day missing, e.g. "May 12" or "2023"
+    return _to_utc(first)
+
 
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(date_string: str) -> Optional[datetime]:
+    return _parse_uncached(date_string)
 
-def is_within_72_hours(publication_date: datetime) -> bool:
+
+def parse_article_date(date_string: str, source: str = "") -> Optional[datetime]:
+    """
+    Parse publication date from article content according to source-specific formats
+
+    Args:
+        date_string (str): Raw date string, e.g. "2025-11-03T10:15:00Z" or "Updated 10:32 AM EST, Mon November 3, 2025"
+        source (str): Source website identifier ("cnn" or "cnbc"); both share one set of formats
+
+    Returns:
+        datetime: UTC-aware datetime, or None if the string is not a complete date
+    """
+    if not date_string or not isinstance(date_string, str):
+        return None
+    return _parse_cached(date_string.strip())
+
+
+def is_within_72_hours(publication_date: datetime, as_of: Optional[datetime] = None) -> bool:
     """
     Check if an article's publication date is within the last 72 hours (3 days)
+
+    Kept for existing callers; the check itself is the one time-window engine in utils.date_filter.
     """
-    if not publication_date:
-        return False
-        
-    # Ensure dates are timezone-aware for comparison
-    if publication_date.tzinfo is None:
-        publication_date = publication_date.replace(tzinfo=timezone.utc)
-    
-    now = datetime.now(timezone.utc)
-    time_diff = now - publication_date
-    
-    # Check if the difference is less than or equal to 72 hours
-    return time_diff <= timedelta(hours=72)
+    # Imported here because utils.date_filter imports parse_article_date from this module
+    from utils.date_filter import is_within_72_hours as within_window
+    return within_window(publication_date, as_of)
 
 
 def format_date_for_output(date_obj: datetime) -> str:
@@ -91,9 +184,4 @@ def validate_date_format(date_string: str) -> bool:
     if not date_string:
         return False
     
-    try:
-        # Try to parse the date string to validate it
-        parsed_date = parser.parse(date_string)
-        return True
-    except (ValueError, TypeError, parser.ParserError):
-        return False
\ No newline at end of file
+    return parse_article_date(date_string) is not None
\ No newline at end of file
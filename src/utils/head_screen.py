@@ -0,0 +1,122 @@
+"""
+Early accept/reject decision for an article from the first bytes of its page
+"""
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Set
+from urllib.parse import urljoin
+from pathlib import Path
+
+# Add the src directory to Python path for absolute imports
+src_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(src_dir))
+
+from utils.date_filter import parse_article_date
+from utils.html_parsing import make_soup
+from utils.structured_data import extract_structured_fields
+from utils.url_utils import canonicalize_url
+
+
+# Points in a page after which a decision may be possible: the end of the head, a closed
+# <time> element, or a closed JSON-LD block
+DECISION_MARKERS = re.compile(rb'</head\s*>|</time\s*>|ld\+json.*?</script\s*>', re.IGNORECASE | re.DOTALL)
+
+# Stop screening and download the page normally once this much of it gave no answer
+DEFAULT_MAX_SCREEN_BYTES = 256 * 1024
+
+# Reasons a transfer was cancelled
+REASON_TOO_OLD = "too old"
+REASON_SEEN = "already seen"
+
+
+class HeadScreen:
+    """
+    Fed the chunks of an article download, decides as early as possible whether the rest is needed
+
+    Each time a chunk completes the head, a <time> element or a JSON-LD block, the bytes received
+    since the previous such point are parsed for the canonical URL and the publication date
+    (JSON-LD and meta tags first, then the first <time> element, the same order the parsers use).
+    Every byte is parsed once, so screening stays linear in the bytes read. The transfer is cancelled
+    when the canonical URL belongs to another link already taken this run, or when the date is
+    older than the time window. Articles inside the window stream on without further checks.
+    """
+
+    def __init__(self, url: str, source: str, seen_urls: Optional[Set[str]] = None, window_hours: int = 72,
+                 as_of: Optional[datetime] = None, max_screen_bytes: int = DEFAULT_MAX_SCREEN_BYTES):
+        self.url = url
+        self.source = source
+        self.seen_urls = seen_urls
+        self.window_hours = window_hours
+        self.as_of = as_of
+        self.max_screen_bytes = max_screen_bytes
+        self.reason: Optional[str] = None
+        # Bytes received after the last decision point, not parsed yet
+        self.buffer = bytearray()
+        self.screened_bytes = 0
+
+    def feed(self, chunk: bytes, encoding: Optional[str] = None) -> Optional[bool]:
+        """
+        Add the next chunk of the page
+
+        Args:
+            chunk (bytes): Decoded response bytes following the previous chunk
+            encoding (str): Charset declared by the response
+
+        Returns:
+            bool: True to download the rest without further screening, False to cancel the
+            transfer (reason says why), or None to keep screening
+        """
+        self.buffer.extend(chunk)
+        self.screened_bytes += len(chunk)
+        end = None
+        for match in DECISION_MARKERS.finditer(self.buffer):
+            end = match.end()
+        if end is not None:
+            # Markers end in '>', so the cut never splits a multi-byte character
+            segment = bytes(self.buffer[:end])
+            del self.buffer[:end]
+            decision = self.decide(segment, encoding)
+            if decision is not None:
+                return decision
+        if self.screened_bytes >= self.max_screen_bytes:
+            return True
+        return None
+
+    def decide(self, prefix: bytes, encoding: Optional[str] = None) -> Optional[bool]:
+        """
+        Decide from a part of a page whether the article is wanted
+
+        Args:
+            prefix (bytes): The first bytes of the page, or the next part of it after an earlier
+                decision point
+            encoding (str): Charset declared by the response
+
+        Returns:
+            bool: True if the article is inside the window, False if it should be dropped,
+            or None if the prefix does not tell yet
+        """
+        soup = make_soup(prefix, encoding=encoding)
+
+        if self.seen_urls:
+            canonical = soup.find('link', rel='canonical', href=True)
+            if canonical is not None:
+                canonical_url = canonicalize_url(urljoin(self.url, canonical['href']))
+                if canonical_url and canonical_url != canonicalize_url(self.url) and canonical_url in self.seen_urls:
+                    self.reason = REASON_SEEN
+                    return False
+
+        date_string = extract_structured_fields(soup).get('publication_date')
+        if not date_string:
+            time_element = soup.find('time')
+            if time_element is not None:
+                date_string = time_element.get('datetime') or time_element.get_text(strip=True)
+        publication_date = parse_article_date(date_string, self.source) if date_string else None
+        if publication_date is None:
+            return None
+
+        as_of = self.as_of or datetime.now(timezone.utc)
+        if publication_date < as_of - timedelta(hours=self.window_hours):
+            self.reason = REASON_TOO_OLD
+            return False
+        return True
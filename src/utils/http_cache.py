@@ -0,0 +1,256 @@
+"""
+Persistent HTTP response cache with conditional revalidation and size-bounded LRU eviction
+"""
+import hashlib
+import json
+import os
+import sys
+import time
+import zlib
+from collections import Counter
+from typing import Dict, Any, Optional
+from pathlib import Path
+
+# Add the src directory to Python path for absolute imports
+src_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(src_dir))
+
+from utils.helpers import log_info, log_warning
+from utils.performance_optimizer import PerformanceOptimizer, get_performance_optimizer
+
+
+DEFAULT_CACHE_DIR = ".scraper_cache/http"
+DEFAULT_MAX_CACHE_BYTES = 100 * 1024 * 1024  # 100 MB of compressed bodies
+
+
+class ResponseCache:
+    """
+    Two-tier response cache. The PerformanceOptimizer in-memory dict is the front tier and serves
+    repeat requests within a run without touching the network. Behind it is an on-disk store
+    whose bodies are zlib-compressed and addressed by the SHA-256 of their content, with an
+    index recording each URL's ETag/Last-Modified so later runs can revalidate with a
+    conditional request instead of downloading the page again.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+                 optimizer: Optional[PerformanceOptimizer] = None, memory_ttl: int = 3600):
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_path = self.cache_dir / "index.json"
+        self.max_bytes = max_bytes
+        self.memory_ttl = memory_ttl
+        self.optimizer = optimizer or get_performance_optimizer()
+        self.index: Dict[str, Dict[str, Any]] = self._load_index()
+        self._sweep_objects()
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the URL index from disk, starting empty if it is missing or unreadable
+        """
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            log_warning(f"Ignoring unreadable cache index {self.index_path}: {str(e)}", "http_cache")
+            return {}
+
+    def _sweep_objects(self) -> int:
+        """
+        Bring the object store and the index back in line before the cache is used
+
+        A lost or unreadable index, or a run interrupted mid-write, leaves bodies and .tmp files
+        that total_size and evict would never see, so object files the index does not refer to
+        are deleted. Index entries whose body is gone are dropped, so the sizes in the index are
+        those of the files on disk.
+
+        Returns: Number of files deleted
+        """
+        referenced = {entry['digest'] for entry in self.index.values()}
+        present = set()
+        removed = 0
+        if self.objects_dir.exists():
+            for path in self.objects_dir.rglob('*'):
+                if not path.is_file():
+                    continue
+                if path.suffix == '.zz' and path.stem in referenced:
+                    present.add(path.stem)
+                    continue
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        for url in [url for url, entry in self.index.items() if entry['digest'] not in present]:
+            del self.index[url]
+        if removed:
+            log_info(f"Removed {removed} cache objects missing from the index", "http_cache")
+        return removed
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.zz"
+
+    def get_fresh(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look the URL up in the in-memory front tier; a hit needs no network round trip
+
+        Returns: Dictionary with 'body' and 'headers', or None on a miss
+        """
+        self.optimizer.increment_cache_lookups()
+        cached = self.optimizer.get_cached_content(url, ttl=self.memory_ttl)
+        if cached is not None:
+            self.optimizer.increment_cache_hits()
+        return cached
+
+    def get_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the on-disk index entry for a URL if its body is still present
+        """
+        entry = self.index.get(url)
+        if entry is None:
+            return None
+        if not self._object_path(entry['digest']).exists():
+            del self.index[url]
+            return None
+        return entry
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Build If-None-Match/If-Modified-Since headers for revalidating a cached entry
+        """
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def revalidated(self, url: str, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Serve a cached body after the server answered 304 Not Modified
+
+        Returns: Dictionary with 'body' and 'headers', or None if the stored body is unreadable
+        """
+        try:
+            with open(self._object_path(entry['digest']), 'rb') as f:
+                body = zlib.decompress(f.read())
+        except (OSError, zlib.error) as e:
+            log_warning(f"Dropping unreadable cache object for {url}: {str(e)}", "http_cache")
+            self.index.pop(url, None)
+            return None
+
+        entry['last_access'] = time.time()
+        self.optimizer.increment_cache_hits()
+        self.optimizer.increment_cache_revalidations()
+
+        cached = {'body': body, 'headers': entry.get('headers', {})}
+        self.optimizer.cache_content(url, cached)
+        return cached
+
+    def store(self, url: str, body: bytes, headers) -> None:
+        """
+        Store a 200 response body in both tiers; only responses carrying a validator go to disk
+        """
+        stored_headers = {}
+        if headers.get('content-type'):
+            stored_headers['content-type'] = headers['content-type']
+        self.optimizer.cache_content(url, {'body': body, 'headers': stored_headers})
+
+        etag = headers.get('etag')
+        last_modified = headers.get('last-modified')
+        if not etag and not last_modified:
+            return
+
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = self._object_path(digest)
+        try:
+            if not object_path.exists():
+                object_path.parent.mkdir(parents=True, exist_ok=True)
+                compressed = zlib.compress(body, 6)
+                tmp_path = object_path.with_suffix('.tmp')
+                with open(tmp_path, 'wb') as f:
+                    f.write(compressed)
+                os.replace(tmp_path, object_path)
+            size = object_path.stat().st_size
+        except OSError as e:
+            log_warning(f"Failed to write cache object for {url}: {str(e)}", "http_cache")
+            return
+
+        previous = self.index.get(url)
+        self.index[url] = {
+            'digest': digest,
+            'etag': etag,
+            'last_modified': last_modified,
+            'headers': stored_headers,
+            'size': size,
+            'last_access': time.time()
+        }
+        # A changed body replaces the URL's old object unless another URL still shares it
+        if previous is not None and previous['digest'] != digest:
+            self._delete_if_unreferenced(previous['digest'])
+        self.evict()
+
+    def _delete_if_unreferenced(self, digest: str) -> None:
+        """
+        Delete a stored body once no index entry refers to it
+        """
+        if any(entry['digest'] == digest for entry in self.index.values()):
+            return
+        try:
+            self._object_path(digest).unlink()
+        except OSError:
+            pass
+
+    def total_size(self) -> int:
+        """
+        Total compressed size of distinct bodies referenced by the index
+        """
+        sizes = {entry['digest']: entry.get('size', 0) for entry in self.index.values()}
+        return sum(sizes.values())
+
+    def evict(self) -> int:
+        """
+        Evict least recently used entries until the store fits within max_bytes
+
+        Returns: Number of entries evicted
+        """
+        evicted = 0
+        total = self.total_size()
+        if total <= self.max_bytes:
+            return evicted
+
+        # Bodies are shared between URLs with identical content, so only delete unreferenced ones
+        references = Counter(entry['digest'] for entry in self.index.values())
+        for url, entry in sorted(self.index.items(), key=lambda item: item[1].get('last_access', 0)):
+            if total <= self.max_bytes:
+                break
+            del self.index[url]
+            evicted += 1
+            self.optimizer.increment_cache_evictions()
+
+            references[entry['digest']] -= 1
+            if not references[entry['digest']]:
+                total -= entry.get('size', 0)
+                try:
+                    self._object_path(entry['digest']).unlink()
+                except OSError:
+                    pass
+
+        if evicted:
+            log_info(f"Evicted {evicted} cached responses, cache size now {total} bytes", "http_cache")
+        return evicted
+
+    def save(self) -> None:
+        """
+        Persist the URL index atomically so an interrupted run cannot corrupt it
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            log_warning(f"Failed to save cache index {self.index_path}: {str(e)}", "http_cache")
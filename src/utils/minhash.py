@@ -0,0 +1,195 @@
+"""
+MinHash signatures and a locality-sensitive hashing index for near-duplicate article detection
+"""
+import zlib
+from typing import Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+
+DEFAULT_NUM_PERM = 128
+DEFAULT_SHINGLE_SIZE = 3
+# Shingle Jaccard of a copy with about one word in ten changed; unrelated stories score near 0
+DEFAULT_THRESHOLD = 0.5
+
+# Shingle hashes are 32-bit; densified slots can exceed that slightly, so a slot is stored in 9 hex digits
+_HASH_RANGE = 1 << 32
+
+
+def shingle_hashes(text: str, shingle_size: int = DEFAULT_SHINGLE_SIZE) -> Set[int]:
+    """
+    Hash the overlapping word n-grams of a text
+
+    Words are lowercased and split on whitespace, so reflowed or recased copies produce the same
+    shingles. A text shorter than one shingle is hashed as a single shingle. CRC-32 is used
+    rather than hash() so signatures are the same in every process and run.
+
+    Args:
+        text (str): Article body
+        shingle_size (int): Words per shingle
+
+    Returns:
+        Set[int]: 32-bit shingle hashes; empty for an empty text
+    """
+    words = text.lower().split()
+    if not words:
+        return set()
+    if len(words) <= shingle_size:
+        return {zlib.crc32(' '.join(words).encode('utf-8'))}
+    return {
+        zlib.crc32(' '.join(words[i:i + shingle_size]).encode('utf-8'))
+        for i in range(len(words) - shingle_size + 1)
+    }
+
+
+def minhash_signature(text: str, num_perm: int = DEFAULT_NUM_PERM,
+                      shingle_size: int = DEFAULT_SHINGLE_SIZE) -> Optional[Tuple[int, ...]]:
+    """
+    Compute a MinHash signature with one-permutation hashing
+
+    Instead of num_perm hash functions per shingle, each shingle hash is hashed once: it picks
+    one of num_perm bins and competes for that bin's minimum. Empty bins borrow the value of the
+    next non-empty bin, offset by the distance, so two signatures still agree in a slot with
+    probability equal to the Jaccard similarity of the shingle sets. Cost is one pass over the
+    shingles, independent of num_perm.
+
+    Args:
+        text (str): Article body
+        num_perm (int): Signature length
+        shingle_size (int): Words per shingle
+
+    Returns:
+        Tuple[int, ...]: num_perm slot values, or None for an empty text
+    """
+    hashes = shingle_hashes(text, shingle_size)
+    if not hashes:
+        return None
+
+    bins: List[Optional[int]] = [None] * num_perm
+    for value in hashes:
+        index, rank = value % num_perm, value // num_perm
+        current = bins[index]
+        if current is None or rank < current:
+            bins[index] = rank
+
+    # Densify: borrow from the nearest non-empty bin to the right, shifted out of the range of real values
+    offset = _HASH_RANGE // num_perm + 1
+    signature = list(bins)
+    for index in range(num_perm):
+        if bins[index] is None:
+            distance = 1
+            while bins[(index + distance) % num_perm] is None:
+                distance += 1
+            signature[index] = bins[(index + distance) % num_perm] + distance * offset
+    return tuple(signature)
+
+
+def estimate_jaccard(signature_a: Sequence[int], signature_b: Sequence[int]) -> float:
+    """
+    Estimate the Jaccard similarity of two texts from their signatures
+    """
+    if not signature_a or len(signature_a) != len(signature_b):
+        return 0.0
+    return sum(1 for a, b in zip(signature_a, signature_b) if a == b) / len(signature_a)
+
+
+def signature_to_hex(signature: Sequence[int]) -> str:
+    """
+    Encode a signature for EnhancedNewsArticle.similarity_hash (9 hex digits per slot)
+    """
+    return ''.join(f'{value:09x}' for value in signature)
+
+
+def signature_from_hex(encoded: str) -> Tuple[int, ...]:
+    """
+    Decode a signature stored by signature_to_hex
+    """
+    return tuple(int(encoded[i:i + 9], 16) for i in range(0, len(encoded), 9))
+
+
+def _probability_of_candidate(similarity: float, bands: int, rows: int) -> float:
+    return 1.0 - (1.0 - similarity ** rows) ** bands
+
+
+def lsh_params(num_perm: int = DEFAULT_NUM_PERM, threshold: float = DEFAULT_THRESHOLD,
+               false_positive_weight: float = 0.5) -> Tuple[int, int]:
+    """
+    Choose the number of bands and rows per band for a similarity threshold
+
+    Minimizes the weighted area of false positives (pairs below the threshold that become
+    candidates) and false negatives (pairs above it that do not). Candidates are verified
+    against the threshold afterwards, so false positives only cost time.
+
+    Args:
+        num_perm (int): Signature length
+        threshold (float): Jaccard similarity at which texts count as near-duplicates
+        false_positive_weight (float): Weight of false positives against false negatives
+
+    Returns:
+        Tuple[int, int]: (bands, rows) with bands * rows <= num_perm
+    """
+    steps = 100
+
+    def area(start: float, end: float, probability) -> float:
+        width = (end - start) / steps
+        return sum(probability(start + (i + 0.5) * width) for i in range(steps)) * width
+
+    best, best_error = (num_perm, 1), None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        false_positives = area(0.0, threshold, lambda s: _probability_of_candidate(s, bands, rows))
+        false_negatives = area(threshold, 1.0, lambda s: 1.0 - _probability_of_candidate(s, bands, rows))
+        error = false_positive_weight * false_positives + (1.0 - false_positive_weight) * false_negatives
+        if best_error is None or error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHashLSHIndex:
+    """
+    Finds stored texts whose estimated Jaccard similarity to a query reaches a threshold
+
+    Each signature is cut into bands, and each band is hashed into its own table; texts that share
+    any band become candidates, and only candidates are compared slot by slot. Inserting and
+    querying cost one signature plus a few dictionary lookups, so deduplicating n articles is
+    roughly linear instead of comparing every pair.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM,
+                 shingle_size: int = DEFAULT_SHINGLE_SIZE):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = lsh_params(num_perm, threshold)
+        self.tables: List[Dict[Tuple[int, ...], List[Hashable]]] = [{} for _ in range(self.bands)]
+        self.signatures: Dict[Hashable, Tuple[int, ...]] = {}
+
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """
+        Compute a text's signature with this index's settings
+        """
+        return minhash_signature(text, self.num_perm, self.shingle_size)
+
+    def _band_keys(self, signature: Sequence[int]):
+        for band in range(self.bands):
+            yield band, tuple(signature[band * self.rows:(band + 1) * self.rows])
+
+    def query(self, signature: Sequence[int]) -> List[Hashable]:
+        """
+        Keys of stored signatures at or above the threshold, most similar first
+        """
+        candidates = set()
+        for band, key in self._band_keys(signature):
+            candidates.update(self.tables[band].get(key, ()))
+        scored = [(estimate_jaccard(signature, self.signatures[candidate]), candidate) for candidate in candidates]
+        return [candidate for score, candidate in sorted(scored, key=lambda item: -item[0]) if score >= self.threshold]
+
+    def insert(self, key: Hashable, signature: Sequence[int]) -> None:
+        """
+        Store a signature under a key, e.g. an article id
+        """
+        signature = tuple(signature)
+        self.signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self.tables[band].setdefault(band_key, []).append(key)
+
+    def __len__(self) -> int:
+        return len(self.signatures)
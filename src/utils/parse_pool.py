@@ -0,0 +1,98 @@
+"""
+Optional process pool that runs the pure page-parsing functions off the event loop
+"""
+import asyncio
+import functools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+from pathlib import Path
+
+# Add the src directory to Python path for absolute imports
+src_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(src_dir))
+
+from utils.helpers import log_info
+from utils.html_parsing import set_parser_backend, get_parser_backend
+
+
+# Pool used by run_parser for the current run; None parses inline in the calling coroutine
+_active_pool: Optional[ProcessPoolExecutor] = None
+
+
+def resolve_worker_count(workers: Optional[int]) -> int:
+    """
+    Turn the configured worker count into a process count
+
+    None means one worker per CPU core; 0 or less disables the pool.
+    """
+    if workers is None:
+        return os.cpu_count() or 1
+    return max(0, workers)
+
+
+def _init_worker(src_path: str, backend: str) -> None:
+    """
+    Prepare a worker process: make the parser modules importable and use the run's parser backend
+    """
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
+    set_parser_backend(backend)
+
+
+def start_parse_pool(workers: Optional[int]) -> Optional[ProcessPoolExecutor]:
+    """
+    Start the parse pool for a run
+
+    Args:
+        workers (int): Number of worker processes; None for one per CPU core, 0 to parse inline
+
+    Returns:
+        ProcessPoolExecutor: The started pool, or None when parsing stays inline
+    """
+    global _active_pool
+    shutdown_parse_pool()
+
+    count = resolve_worker_count(workers)
+    if count == 0:
+        return None
+
+    _active_pool = ProcessPoolExecutor(
+        max_workers=count,
+        initializer=_init_worker,
+        initargs=(str(src_dir), get_parser_backend())
+    )
+    log_info(f"Parsing pages in a pool of {count} worker processes", "parse_pool")
+    return _active_pool
+
+
+def shutdown_parse_pool() -> None:
+    """
+    Stop the parse pool, if one is running
+    """
+    global _active_pool
+    if _active_pool is not None:
+        _active_pool.shutdown(wait=True)
+        _active_pool = None
+
+
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the parse pool in use, if any
+    """
+    return _active_pool
+
+
+async def run_parser(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a pure parse function in the parse pool, or inline when no pool is running
+
+    The function and its arguments are pickled to a worker process, so they must be module-level
+    functions and plain data; only the small result dictionary comes back. While a worker parses,
+    the event loop keeps serving other requests and rate-limiter timers.
+    """
+    if _active_pool is None:
+        return func(*args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_active_pool, functools.partial(func, *args, **kwargs))
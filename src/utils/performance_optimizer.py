@@ -2,10 +2,17 @@
 Performance optimization with connection pooling and caching
 """
 import asyncio
+import sys
 from typing import Dict, Any, Optional
 import time
-from .models.metrics import PerformanceMetrics
-from .utils.helpers import log_info, log_warning
+from pathlib import Path
+
+# Add the src directory to Python path for absolute imports
+src_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(src_dir))
+
+from models.metrics import PerformanceMetrics
+from utils.helpers import log_info, log_warning
 
 
 class PerformanceOptimizer:
@@ -14,42 +21,76 @@ class PerformanceOptimizer:
     and limit memory usage to under 500MB during normal operation
     """
     
-    def __init__(self, max_connections: int = 10, max_memory_mb: float = 500.0):
+    def __init__(self, max_connections: int = 10, max_memory_mb: float = 500.0,
+                 max_keepalive_connections: int = 5, keepalive_expiry: float = 30.0,
+                 max_cache_entries: int = 256):
         self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
         self.max_memory_mb = max_memory_mb
         self.connection_pool = {}
+        # Least recently used first; the oldest entries are dropped past max_cache_entries
         self.cache = {}
+        self.max_cache_entries = max_cache_entries
         self.start_time = None
         self.active_requests = 0
         self.request_times = []
         self.rate_limit_delays = 0
         self.deduplication_savings = 0
+        self.cache_lookups = 0
+        self.cache_hits = 0
+        self.cache_revalidations = 0
+        self.cache_evictions = 0
+        self.incremental_skips = 0
+        self.listing_title_skips = 0
+        self.prescreen_hits = 0
+        self.prescreen_misses = 0
+        self.head_first_cancels = 0
+        self.head_first_bytes_saved = 0
+        self.extraction_paths: Dict[str, Dict[str, int]] = {}
+        self.selector_results: Dict[str, Dict[str, Dict[str, int]]] = {}
         
-    async def setup_connection_pool(self):
+    async def setup_connection_pool(self, host: Optional[str] = None, headers: Optional[Dict[str, str]] = None):
         """
         Set up connection pooling to reduce overhead of repeated HTTP requests
+        
+        When a host is given the client is registered in the connection pool under that host,
+        so every request to the same host reuses its keep-alive connections.
         """
         import httpx
         
         # Create a shared client with connection pooling
         self.client = httpx.AsyncClient(
-            limits=httpx.Limits(max_connections=self.max_connections),
-            timeout=30.0
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry
+            ),
+            timeout=30.0,
+            headers=headers,
+            follow_redirects=True
         )
         
-        log_info(f"Connection pool initialized with max {self.max_connections} connections", "PerformanceOptimizer")
+        if host:
+            self.connection_pool[host] = self.client
+        
+        log_info(f"Connection pool initialized for {host or 'default'} with max {self.max_connections} connections", "PerformanceOptimizer")
         return self.client
         
     def cache_content(self, key: str, content: Any) -> None:
         """
         Cache parsed content to avoid redundant processing of identical articles
+
+        Holds at most max_cache_entries items, forgetting the least recently used ones first.
         """
+        self.cache.pop(key, None)
         self.cache[key] = {
             'content': content,
             'timestamp': time.time(),
             'access_count': 0
         }
-        log_info(f"Cached content with key: {key}, cache size: {len(self.cache)}", "PerformanceOptimizer")
+        while len(self.cache) > self.max_cache_entries:
+            del self.cache[next(iter(self.cache))]
         
     def get_cached_content(self, key: str, ttl: int = 3600) -> Optional[Any]:
         """
@@ -61,7 +102,8 @@ class PerformanceOptimizer:
             
             if age < ttl:  # Still valid
                 cached_item['access_count'] += 1
-                log_info(f"Retrieved cached content with key: {key}, accessed {cached_item['access_count']} times", "PerformanceOptimizer")
+                # Move to the most recently used end
+                self.cache[key] = self.cache.pop(key)
                 return cached_item['content']
             else:
                 # Expired, remove from cache
@@ -106,10 +148,23 @@ class PerformanceOptimizer:
             average_request_time_ms=avg_request_time,
             cpu_usage_percent=None,  # Would need psutil or similar to track
             connection_pool_size=self.max_connections,
-            cache_hit_rate=float(len(self.cache)) / max(len(self.request_times), 1) if self.request_times else 0,
+            cache_hit_rate=self.cache_hits / self.cache_lookups if self.cache_lookups else 0,
             active_coroutines=self.active_requests,
             rate_limit_delays=self.rate_limit_delays,
-            deduplication_savings=self.deduplication_savings
+            deduplication_savings=self.deduplication_savings,
+            cache_revalidations=self.cache_revalidations,
+            cache_evictions=self.cache_evictions,
+            incremental_skips=self.incremental_skips,
+            listing_title_skips=self.listing_title_skips,
+            prescreen_hits=self.prescreen_hits,
+            prescreen_misses=self.prescreen_misses,
+            head_first_cancels=self.head_first_cancels,
+            head_first_bytes_saved=self.head_first_bytes_saved,
+            extraction_paths={source: dict(paths) for source, paths in self.extraction_paths.items()},
+            selector_hit_rates={
+                source: {field: counts['hits'] / counts['pages'] for field, counts in fields.items() if counts['pages']}
+                for source, fields in self.selector_results.items()
+            }
         )
         
     def track_request_time(self, start_time: float, end_time: float) -> None:
@@ -144,6 +199,77 @@ class PerformanceOptimizer:
         Track when an article is skipped due to deduplication
         """
         self.deduplication_savings += 1
+        
+    def increment_cache_lookups(self) -> None:
+        """
+        Track a response cache lookup
+        """
+        self.cache_lookups += 1
+        
+    def increment_cache_hits(self) -> None:
+        """
+        Track a response served from cache, either from memory or after a 304 revalidation
+        """
+        self.cache_hits += 1
+        
+    def increment_cache_revalidations(self) -> None:
+        """
+        Track a cached response confirmed unchanged by a 304 Not Modified
+        """
+        self.cache_revalidations += 1
+        
+    def increment_cache_evictions(self) -> None:
+        """
+        Track a response evicted from the on-disk cache
+        """
+        self.cache_evictions += 1
+        
+    def increment_incremental_skips(self) -> None:
+        """
+        Track a listing link skipped because an earlier run already processed it unchanged
+        """
+        self.incremental_skips += 1
+        
+    def increment_listing_title_skips(self) -> None:
+        """
+        Track a listing link skipped before fetching because its headline was already taken
+        """
+        self.listing_title_skips += 1
+        
+    def record_prescreen_result(self, dropped: bool) -> None:
+        """
+        Track a pre-fetch date screening: a hit drops a link before it costs a rate-limited request,
+        a miss means the link still has to be fetched
+        """
+        if dropped:
+            self.prescreen_hits += 1
+        else:
+            self.prescreen_misses += 1
+            
+    def record_head_first_cancel(self, bytes_saved: Optional[int]) -> None:
+        """
+        Track an article download stopped after its head; bytes_saved is None when the response
+        did not announce its length
+        """
+        self.head_first_cancels += 1
+        if bytes_saved:
+            self.head_first_bytes_saved += bytes_saved
+            
+    def record_extraction_path(self, source: str, path: str) -> None:
+        """
+        Track which extraction path an article took: structured data only, mixed, or selector cascades
+        """
+        source_paths = self.extraction_paths.setdefault(source, {})
+        source_paths[path] = source_paths.get(path, 0) + 1
+        
+    def record_selector_result(self, source: str, field: str, hit: bool) -> None:
+        """
+        Track whether a title, date or content selector cascade found a value on a page
+        """
+        counts = self.selector_results.setdefault(source, {}).setdefault(field, {'pages': 0, 'hits': 0})
+        counts['pages'] += 1
+        if hit:
+            counts['hits'] += 1
 
 
 # Global performance optimizer instance
@@ -206,6 +332,13 @@ def register_rate_limit_delay() -> None:
     performance_optimizer.increment_rate_limit_delays()
 
 
+def register_prescreen_result(dropped: bool) -> None:
+    """
+    Register the outcome of pre-fetch date screening for a listing link
+    """
+    performance_optimizer.record_prescreen_result(dropped)
+
+
 def register_deduplication_saving() -> None:
     """
     Register when an article is skipped due to deduplication
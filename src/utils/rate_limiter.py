@@ -3,7 +3,10 @@ Rate limiting module with 3-5 second delays between requests to avoid being bloc
 """
 import asyncio
 import random
+import time
 from datetime import datetime
+from typing import Dict
+from urllib.parse import urlparse
 
 
 class RateLimiter:
@@ -35,6 +38,92 @@ class RateLimiter:
         self.last_request_time = datetime.now()
 
 
+class TokenBucket:
+    """
+    Token bucket for a single host whose refill interval is re-drawn between min_delay and
+    max_delay for every token, so consecutive requests keep the 3-5 second politeness spacing
+    """
+    
+    def __init__(self, min_delay: float = 3.0, max_delay: float = 5.0, capacity: int = 1):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.capacity = capacity
+        # The bucket starts full so the first request to a host goes out immediately
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.next_interval = random.uniform(min_delay, max_delay)
+        self._lock = asyncio.Lock()
+        
+    def _refill(self, now: float) -> None:
+        """
+        Add one token for every full interval that elapsed since the last refill
+        """
+        while self.tokens < self.capacity and now - self.last_refill >= self.next_interval:
+            self.last_refill += self.next_interval
+            self.tokens += 1
+            self.next_interval = random.uniform(self.min_delay, self.max_delay)
+        
+        if self.tokens >= self.capacity:
+            # A full bucket does not bank idle time
+            self.last_refill = now
+            
+    async def acquire(self) -> float:
+        """
+        Take one token, sleeping until one is available
+        
+        Returns: Number of seconds spent waiting
+        """
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                
+                delay = self.last_refill + self.next_interval - now
+                await asyncio.sleep(delay)
+                waited += delay
+
+
+class HostRateLimiter:
+    """
+    Keeps an independent token bucket per host so that CNN and CNBC requests never wait on each other
+    while each host still sees at most one request every 3-5 seconds
+    """
+    
+    def __init__(self, min_delay: float = 3.0, max_delay: float = 5.0, capacity: int = 1):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.capacity = capacity
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.delays_applied = 0
+        
+    def get_bucket(self, host: str) -> TokenBucket:
+        """
+        Get the token bucket for a host, creating a full one on first use
+        """
+        host = host.lower()
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.min_delay, self.max_delay, self.capacity)
+            self.buckets[host] = bucket
+        return bucket
+        
+    async def wait_for_host(self, url_or_host: str) -> float:
+        """
+        Wait until the host of the given URL (or the host itself) has budget for another request
+        
+        Returns: Number of seconds spent waiting
+        """
+        host = urlparse(url_or_host).netloc if '://' in url_or_host else url_or_host
+        waited = await self.get_bucket(host).acquire()
+        if waited > 0:
+            self.delays_applied += 1
+        return waited
+
+
 # Create default rate limiter instance
 default_rate_limiter = RateLimiter()
 
@@ -0,0 +1,106 @@
+"""
+Single-pass matching of many CSS selectors against a parsed page
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+import soupsieve
+from bs4 import Tag
+
+
+# tag, .class, #id, [attr] and [attr="value"] in any simple combination, e.g. div[data-module="ArticleBody"]
+_SIMPLE_SELECTOR = re.compile(
+    r'^(?P<name>[a-zA-Z][\w-]*)?'
+    r'(?:\.(?P<cls>[\w-]+)|#(?P<id>[\w-]+)|\[(?P<attr>[\w-]+)(?:[~|^$*]?=(?P<value>"[^"]*"|\'[^\']*\'|[\w-]+))?\])?$'
+)
+
+
+def _prefilter_key(selector: str) -> Optional[Tuple[str, str]]:
+    """
+    Derive the cheapest necessary condition for a selector to match a tag
+
+    Returns a (kind, value) pair: a required class, id, attribute name or tag name, checked
+    before the full soupsieve match. Selectors with combinators or pseudo-classes return None
+    and are matched against every tag.
+    """
+    match = _SIMPLE_SELECTOR.match(selector.strip())
+    if not match:
+        return None
+    if match.group('cls'):
+        return ('class', match.group('cls'))
+    if match.group('id'):
+        return ('id', match.group('id'))
+    if match.group('attr'):
+        return ('attr', match.group('attr').lower())
+    if match.group('name'):
+        return ('name', match.group('name').lower())
+    return None
+
+
+class SelectorMatcher:
+    """
+    Matches a fixed list of CSS selectors in one walk over the tree
+
+    Running soup.select() once per selector walks the whole document each time. This walks it
+    once: every tag is looked up in small indexes built from each selector's required class, id,
+    attribute or tag name, and only the selectors that pass that prefilter are confirmed with
+    their precompiled soupsieve pattern. Matches are kept per selector in document order, the
+    same order soup.select() returns them in, so callers can keep their priority logic unchanged.
+    """
+
+    def __init__(self, selectors: List[str]):
+        self.selectors = list(dict.fromkeys(selectors))
+        self._compiled = {selector: soupsieve.compile(selector) for selector in self.selectors}
+        self._by_class: Dict[str, List[str]] = {}
+        self._by_id: Dict[str, List[str]] = {}
+        self._by_attr: Dict[str, List[str]] = {}
+        self._by_name: Dict[str, List[str]] = {}
+        self._unfiltered: List[str] = []
+
+        indexes = {'class': self._by_class, 'id': self._by_id, 'attr': self._by_attr, 'name': self._by_name}
+        for selector in self.selectors:
+            key = _prefilter_key(selector)
+            if key is None:
+                self._unfiltered.append(selector)
+            else:
+                indexes[key[0]].setdefault(key[1], []).append(selector)
+
+    def _candidates(self, tag: Tag) -> List[str]:
+        """
+        Selectors whose prefilter this tag passes
+        """
+        candidates = list(self._unfiltered)
+        candidates.extend(self._by_name.get(tag.name, ()))
+        attrs = tag.attrs
+        if attrs:
+            for attribute in attrs:
+                candidates.extend(self._by_attr.get(attribute, ()))
+            element_id = attrs.get('id')
+            if element_id and self._by_id:
+                candidates.extend(self._by_id.get(element_id, ()))
+            classes = attrs.get('class')
+            if classes and self._by_class:
+                for class_name in classes if isinstance(classes, list) else classes.split():
+                    candidates.extend(self._by_class.get(class_name, ()))
+        return candidates
+
+    def match(self, root) -> Dict[str, List[Tag]]:
+        """
+        Find every tag under root matched by each selector
+
+        Args:
+            root: BeautifulSoup document or tag to search below
+
+        Returns:
+            dict: Selector to list of matching tags in document order (the same as root.select(selector))
+        """
+        matches: Dict[str, List[Tag]] = {selector: [] for selector in self.selectors}
+        for element in root.descendants:
+            if not isinstance(element, Tag):
+                continue
+            candidates = self._candidates(element)
+            if not candidates:
+                continue
+            for selector in dict.fromkeys(candidates):
+                if self._compiled[selector].match(element):
+                    matches[selector].append(element)
+        return matches
@@ -0,0 +1,166 @@
+"""
+Persistent per-source selector hit statistics used to try the most successful selectors first
+"""
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+from pathlib import Path
+
+# Add the src directory to Python path for absolute imports
+src_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(src_dir))
+
+from utils.helpers import log_info, log_warning
+
+
+DEFAULT_STATS_PATH = ".scraper_cache/selector_stats.json"
+
+
+class SelectorStats:
+    """
+    Counts, per source and field (title, date, content), how many pages ran the selector cascade
+    and which selector produced the value. Once a field has seen warmup_pages pages, its selectors
+    are tried in order of hits, with never-hit selectors kept in their static order at the end.
+    Counts are halved once a field passes max_pages so the order follows site redesigns. A field
+    whose hit rate in this run falls well below its recorded rate is reported with a warning.
+    """
+
+    def __init__(self, path: str = DEFAULT_STATS_PATH, optimizer=None, warmup_pages: int = 10,
+                 max_pages: int = 1000, drop_warning_threshold: float = 0.25):
+        self.path = Path(path)
+        self.optimizer = optimizer
+        self.warmup_pages = warmup_pages
+        self.max_pages = max_pages
+        self.drop_warning_threshold = drop_warning_threshold
+        self.stats: Dict[str, Dict[str, Dict]] = self._load()
+        # Hit rates recorded before this run, compared against this run's rates at the end
+        self.baseline_rates = {source: self._rates(fields) for source, fields in self.stats.items()}
+        self.run_stats: Dict[str, Dict[str, Dict]] = {}
+
+    def _load(self) -> Dict[str, Dict[str, Dict]]:
+        """
+        Load recorded statistics, starting empty if the file is missing or unreadable
+        """
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            log_warning(f"Ignoring unreadable selector statistics {self.path}: {str(e)}", "selector_stats")
+            return {}
+
+    @staticmethod
+    def _rates(fields: Dict[str, Dict]) -> Dict[str, float]:
+        return {
+            field: sum(entry['hits'].values()) / entry['pages']
+            for field, entry in fields.items() if entry.get('pages')
+        }
+
+    def ordered_selectors(self, source: str, field: str, selectors: List[str]) -> List[str]:
+        """
+        Order a field's selectors by recorded hits once the warm-up period is over
+
+        Args:
+            source (str): Source name, e.g. "CNN"
+            field (str): "title", "date" or "content"
+            selectors (List[str]): Static priority order
+
+        Returns:
+            List[str]: Selectors in the order they should be tried
+        """
+        entry = self.stats.get(source, {}).get(field)
+        if not entry or entry['pages'] < self.warmup_pages:
+            return list(selectors)
+        hits = entry['hits']
+        # sorted() is stable, so ties keep their static order
+        return sorted(selectors, key=lambda selector: -hits.get(selector, 0))
+
+    def ordered_groups(self, source: str, groups: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """
+        Order every field's selectors for a source
+        """
+        return {field: self.ordered_selectors(source, field, selectors) for field, selectors in groups.items()}
+
+    def record(self, source: str, matched_selectors: Dict[str, Optional[str]]) -> None:
+        """
+        Record which selector produced each field of one page; None marks a field no selector found
+
+        Fields filled from structured data are left out of matched_selectors and not counted.
+        """
+        for field, selector in matched_selectors.items():
+            for stats in (self.stats, self.run_stats):
+                entry = stats.setdefault(source, {}).setdefault(field, {'pages': 0, 'hits': {}})
+                entry['pages'] += 1
+                if selector:
+                    entry['hits'][selector] = entry['hits'].get(selector, 0) + 1
+
+            entry = self.stats[source][field]
+            if entry['pages'] > self.max_pages:
+                entry['pages'] //= 2
+                entry['hits'] = {key: count // 2 for key, count in entry['hits'].items() if count // 2}
+
+            if self.optimizer is not None:
+                self.optimizer.record_selector_result(source, field, bool(selector))
+
+    def run_hit_rates(self) -> Dict[str, Dict[str, float]]:
+        """
+        Hit rate of each source's fields over the pages recorded in this run
+        """
+        return {source: self._rates(fields) for source, fields in self.run_stats.items()}
+
+    def check_hit_rates(self, min_pages: int = 3) -> List[str]:
+        """
+        Warn about fields whose hit rate in this run fell well below the rate recorded before it
+
+        A sudden drop usually means a site redesign broke the selectors.
+
+        Returns: Warning messages, one per affected source and field
+        """
+        warnings = []
+        for source, fields in self.run_stats.items():
+            run_rates = self._rates(fields)
+            for field, rate in run_rates.items():
+                baseline = self.baseline_rates.get(source, {}).get(field)
+                if baseline is None or fields[field]['pages'] < min_pages:
+                    continue
+                if baseline - rate >= self.drop_warning_threshold:
+                    message = (f"{source} {field} selector hit rate dropped to {rate:.0%} "
+                               f"from {baseline:.0%}; the page layout may have changed")
+                    log_warning(message, "selector_stats")
+                    warnings.append(message)
+        return warnings
+
+    def save(self) -> None:
+        """
+        Persist the statistics atomically
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.stats, f)
+            os.replace(tmp_path, self.path)
+            log_info(f"Saved selector statistics to {self.path}", "selector_stats")
+        except OSError as e:
+            log_warning(f"Failed to save selector statistics {self.path}: {str(e)}", "selector_stats")
+
+
+# Statistics used by the parsers for the current run; None keeps the static selector order
+_active_stats: Optional[SelectorStats] = None
+
+
+def set_selector_stats(stats: Optional[SelectorStats]) -> None:
+    """
+    Set the selector statistics the parsers consult and update, or None to disable adaptive ordering
+    """
+    global _active_stats
+    _active_stats = stats
+
+
+def get_selector_stats() -> Optional[SelectorStats]:
+    """
+    Get the selector statistics in use, if adaptive ordering is enabled
+    """
+    return _active_stats
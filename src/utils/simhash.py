@@ -0,0 +1,197 @@
+"""
+64-bit SimHash fingerprints and a persistent index for finding fingerprints within a few bits
+"""
+import hashlib
+import math
+import sys
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from pathlib import Path
+
+# Add the src directory to Python path for absolute imports
+src_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(src_dir))
+
+from utils.url_utils import generate_article_id
+from utils.article_store import JsonEntryStore
+
+
+FINGERPRINT_BITS = 64
+# Lightly rewritten or updated bodies land within about 6 bits; unrelated articles are 8+ apart
+DEFAULT_MAX_DISTANCE = 6
+DEFAULT_FINGERPRINT_STORE_PATH = ".scraper_cache/fingerprints.json"
+
+
+# For each bit of a byte, the byte values that have it set
+_BYTE_VALUES_WITH_BIT = [[value for value in range(256) if value >> bit & 1] for bit in range(8)]
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def simhash(text: str) -> Optional[int]:
+    """
+    Compute the 64-bit SimHash fingerprint of a text
+
+    Features are the lowercased words, weighted 1 + log(count) so repeated common words do not
+    dominate. Each bit of the fingerprint is the sign of the weighted vote of the feature hashes
+    on that bit, so texts sharing most of their words differ in only a few bits. Votes are
+    tallied per byte value (8 additions per feature instead of 64) and split into bits once.
+
+    Args:
+        text (str): Article body
+
+    Returns:
+        int: Fingerprint, or None for an empty text
+    """
+    counts = Counter(text.lower().split())
+    if not counts:
+        return None
+
+    byte_weights = [[0.0] * 256 for _ in range(FINGERPRINT_BITS // 8)]
+    total = 0.0
+    for feature, count in counts.items():
+        weight = 1.0 + math.log(count)
+        total += weight
+        value = _feature_hash(feature)
+        for weights in byte_weights:
+            weights[value & 0xFF] += weight
+            value >>= 8
+
+    fingerprint = 0
+    for position, weights in enumerate(byte_weights):
+        for bit, values in enumerate(_BYTE_VALUES_WITH_BIT):
+            # Features with the bit set vote for it, the rest against
+            if 2 * sum(map(weights.__getitem__, values)) > total:
+                fingerprint |= 1 << (position * 8 + bit)
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """
+    Number of bits in which two fingerprints differ
+    """
+    return bin(a ^ b).count('1')
+
+
+def fingerprint_to_hex(fingerprint: int) -> str:
+    """
+    Encode a fingerprint for EnhancedNewsArticle.content_fingerprint (16 hex digits)
+    """
+    return f'{fingerprint:016x}'
+
+
+class SimHashIndex:
+    """
+    Finds stored fingerprints within max_distance bits of a query
+
+    The 64 bits are cut into max_distance + 1 blocks. Two fingerprints differing in at most
+    max_distance bits agree exactly on at least one block, so each block gets its own table
+    (equivalent to one permuted copy of the fingerprints with that block in front) and only
+    fingerprints sharing a block with the query are compared bit by bit.
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.max_distance = max_distance
+        blocks = max_distance + 1
+        # Block boundaries, the first ones one bit wider when 64 does not divide evenly
+        widths = [FINGERPRINT_BITS // blocks + (1 if i < FINGERPRINT_BITS % blocks else 0) for i in range(blocks)]
+        self.blocks: List[Tuple[int, int]] = []
+        shift = 0
+        for width in widths:
+            self.blocks.append((shift, (1 << width) - 1))
+            shift += width
+        self.tables: List[Dict[int, List[Hashable]]] = [{} for _ in self.blocks]
+        self.fingerprints: Dict[Hashable, int] = {}
+
+    def query(self, fingerprint: int) -> List[Tuple[Hashable, int]]:
+        """
+        Keys and distances of stored fingerprints within max_distance bits, closest first
+        """
+        candidates = set()
+        for table, (shift, mask) in zip(self.tables, self.blocks):
+            candidates.update(table.get(fingerprint >> shift & mask, ()))
+        matches = [(key, hamming_distance(fingerprint, self.fingerprints[key])) for key in candidates]
+        return sorted((match for match in matches if match[1] <= self.max_distance), key=lambda match: match[1])
+
+    def insert(self, key: Hashable, fingerprint: int) -> None:
+        """
+        Store a fingerprint under a key, replacing any earlier fingerprint for that key
+        """
+        self.remove(key)
+        self.fingerprints[key] = fingerprint
+        for table, (shift, mask) in zip(self.tables, self.blocks):
+            table.setdefault(fingerprint >> shift & mask, []).append(key)
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Drop a stored fingerprint, if present
+        """
+        fingerprint = self.fingerprints.pop(key, None)
+        if fingerprint is None:
+            return
+        for table, (shift, mask) in zip(self.tables, self.blocks):
+            bucket = table.get(fingerprint >> shift & mask)
+            if bucket and key in bucket:
+                bucket.remove(key)
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+
+class FingerprintStore(JsonEntryStore):
+    """
+    Persistent SimHash fingerprints of the articles emitted in earlier runs, keyed by article ID,
+    with an in-memory SimHashIndex rebuilt on load. Entries expire like those of SeenArticleStore,
+    once both their publication date and the last time a copy was seen fall outside the window.
+    """
+
+    description = "fingerprint store"
+    component = "fingerprint_store"
+
+    def __init__(self, path: str = DEFAULT_FINGERPRINT_STORE_PATH, max_distance: int = DEFAULT_MAX_DISTANCE,
+                 window_hours: int = 72):
+        super().__init__(path, window_hours)
+        self.index = SimHashIndex(max_distance)
+        for key, entry in self.entries.items():
+            self.index.insert(key, int(entry['fingerprint'], 16))
+
+    def _check_entries(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        super()._check_entries(entries)
+        for entry in entries.values():
+            int(entry['fingerprint'], 16)
+
+    def _forget(self, keys: List[str]) -> None:
+        super()._forget(keys)
+        for key in keys:
+            self.index.remove(key)
+
+    def find(self, fingerprint: int) -> Optional[Dict[str, Any]]:
+        """
+        Find the closest stored article within the index's distance of a fingerprint
+
+        The matched entry's last-seen time is refreshed so a story that keeps being republished
+        does not expire while copies still appear.
+        """
+        matches = self.index.query(fingerprint)
+        if not matches:
+            return None
+        key, distance = matches[0]
+        entry = self.entries[key]
+        entry['last_seen'] = datetime.now(timezone.utc).isoformat()
+        return dict(entry, distance=distance)
+
+    def record(self, url: str, fingerprint: int, publication_date: Optional[datetime]) -> None:
+        """
+        Record the fingerprint of an emitted article
+        """
+        key = generate_article_id(url)
+        self.entries[key] = {
+            'url': url,
+            'fingerprint': fingerprint_to_hex(fingerprint),
+            'publication_date': publication_date.isoformat() if publication_date else None,
+            'last_seen': datetime.now(timezone.utc).isoformat()
+        }
+        self.index.insert(key, fingerprint)
@@ -0,0 +1,143 @@
+"""
+Structured-data extraction from JSON-LD NewsArticle blocks and Open Graph / article meta tags
+"""
+import json
+from typing import Dict, Any, Optional
+
+
+# schema.org types that describe a single news story
+NEWS_ARTICLE_TYPES = {
+    'NewsArticle', 'Article', 'ReportageNewsArticle', 'AnalysisNewsArticle',
+    'BackgroundNewsArticle', 'OpinionNewsArticle', 'ReviewNewsArticle', 'BlogPosting'
+}
+
+# Meta tags carrying each field, in order of preference
+META_TITLE_KEYS = ['og:title', 'twitter:title']
+META_DATE_KEYS = ['article:published_time', 'og:article:published_time', 'pubdate', 'publishdate']
+
+STRUCTURED_FIELDS = ('title', 'publication_date', 'content')
+
+# Extraction paths reported per article
+PATH_STRUCTURED = "structured"  # Every field came from structured data, no selector cascade ran
+PATH_MIXED = "mixed"  # Some fields came from structured data, the rest from selector cascades
+PATH_SELECTORS = "selectors"  # No structured data, every field came from selector cascades
+
+
+def _iter_json_ld_objects(data: Any):
+    """
+    Yield every JSON-LD object in a parsed block, flattening lists and @graph containers
+    """
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_json_ld_objects(item)
+    elif isinstance(data, dict):
+        yield data
+        if '@graph' in data:
+            yield from _iter_json_ld_objects(data['@graph'])
+
+
+def _is_news_article(obj: Dict[str, Any]) -> bool:
+    types = obj.get('@type')
+    if isinstance(types, str):
+        types = [types]
+    return bool(types) and any(t in NEWS_ARTICLE_TYPES for t in types if isinstance(t, str))
+
+
+def _first_text(value: Any) -> str:
+    """
+    Reduce a JSON-LD property value to a single stripped string
+    """
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    return ' '.join(value.split()) if isinstance(value, str) else ""
+
+
+def find_news_article_json_ld(soup) -> Optional[Dict[str, Any]]:
+    """
+    Find the first NewsArticle object among the page's application/ld+json blocks
+
+    Args:
+        soup: Parsed article page
+
+    Returns:
+        dict: The JSON-LD object, or None if the page has no parseable NewsArticle block
+    """
+    for script in soup.find_all('script', type='application/ld+json'):
+        raw = script.string or script.get_text()
+        if not raw or not raw.strip():
+            continue
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            continue
+        for obj in _iter_json_ld_objects(data):
+            if _is_news_article(obj):
+                return obj
+    return None
+
+
+def _meta_values(soup) -> Dict[str, str]:
+    """
+    Collect meta tag values keyed by their property or name attribute
+    """
+    values = {}
+    scope = soup.head or soup
+    for meta in scope.find_all('meta', content=True):
+        key = (meta.get('property') or meta.get('name') or '').lower()
+        if key and key not in values:
+            values[key] = meta['content'].strip()
+    return values
+
+
+def extract_structured_fields(soup) -> Dict[str, str]:
+    """
+    Read title, publication date and body from structured data embedded in an article page
+
+    JSON-LD NewsArticle values (headline, datePublished, articleBody) take precedence over
+    og:title and article:published_time meta tags. Fields that are not present are left out,
+    so callers can fall back to their selector cascades for just those fields.
+
+    Args:
+        soup: Parsed article page
+
+    Returns:
+        dict: Subset of title, publication_date and content that structured data provided
+    """
+    fields = {}
+
+    article = find_news_article_json_ld(soup)
+    if article:
+        headline = _first_text(article.get('headline'))
+        date_published = _first_text(article.get('datePublished'))
+        body = _first_text(article.get('articleBody'))
+        if headline:
+            fields['title'] = headline
+        if date_published:
+            fields['publication_date'] = date_published
+        if body:
+            fields['content'] = body
+
+    if 'title' not in fields or 'publication_date' not in fields:
+        meta = _meta_values(soup)
+        if 'title' not in fields:
+            title = next((meta[key] for key in META_TITLE_KEYS if meta.get(key)), "")
+            if title:
+                fields['title'] = title
+        if 'publication_date' not in fields:
+            published = next((meta[key] for key in META_DATE_KEYS if meta.get(key)), "")
+            if published:
+                fields['publication_date'] = published
+
+    return fields
+
+
+def classify_extraction_path(structured_fields: Dict[str, str]) -> str:
+    """
+    Name the extraction path an article took from the fields structured data provided
+    """
+    found = sum(1 for field in STRUCTURED_FIELDS if structured_fields.get(field))
+    if found == len(STRUCTURED_FIELDS):
+        return PATH_STRUCTURED
+    if found:
+        return PATH_MIXED
+    return PATH_SELECTORS
@@ -0,0 +1,117 @@
+"""
+Compiled single-pass classification of landing-page links as article URLs
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional, Set
+
+
+# Dated article paths such as /2025/11/03/
+DATE_PATH_PATTERN = r'/\d{4}/\d{2}/\d{2}/'
+
+# Prefixes of hrefs that point into the site: absolute URLs, root-relative and relative paths
+URL_PREFIXES = ('http', '/', '../', './')
+
+
+def trie_alternation(words: Iterable[str]) -> str:
+    """
+    Build a regex alternation of literal words, factored into a prefix trie
+
+    The regex engine tries every branch of a flat alternation at each position; the factored form
+    branches on one character at a time, so a position is rejected after a single comparison.
+
+    Args:
+        words (Iterable[str]): Literal strings to match
+
+    Returns:
+        str: Regular expression source matching any of the words
+    """
+    trie: Dict[str, Dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node: Dict[str, Dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 and '' not in node else f"(?:{'|'.join(branches)})"
+        return f'{body}?' if '' in node else body
+
+    return emit(trie)
+
+
+def window_years(as_of: datetime, window_hours: int = 72) -> Set[int]:
+    """
+    Years an article inside the time window can be filed under
+
+    Covers the whole window plus one day ahead, since URL dates follow the newsroom's local
+    calendar rather than UTC.
+    """
+    return {
+        (as_of - timedelta(hours=window_hours)).year,
+        as_of.year,
+        (as_of + timedelta(days=1)).year
+    }
+
+
+class UrlClassifier:
+    """
+    Decides whether a landing-page href is an article link with one precompiled regular expression
+
+    A link is an article when it starts like a site URL, contains none of the exclude patterns,
+    and contains an include pattern, a /yyyy/ segment for a year inside the time window, or a
+    /yyyy/mm/dd/ date path. Include and exclude patterns are matched against the lowercased href
+    by a single expression with one lookahead for each rule. The year segments are derived from
+    the run instant and window (the current date and the default window unless given), and the
+    expression is rebuilt when either changes, so they never go stale.
+    """
+
+    def __init__(self, include_patterns: Iterable[str], exclude_patterns: Iterable[str],
+                 window_hours: int = 72, as_of: Optional[datetime] = None):
+        self.include_patterns = list(include_patterns)
+        self.exclude_patterns = list(exclude_patterns)
+        self.window_hours = window_hours
+        self.fixed_as_of = as_of
+        self._built_for = None
+        self._build(as_of or datetime.now(timezone.utc), window_hours)
+
+    def _build(self, as_of: datetime, window_hours: int) -> None:
+        """
+        Compile the combined expression for the years of the window ending at as_of
+        """
+        self.years = sorted(window_years(as_of, window_hours))
+        include = trie_alternation(
+            [pattern.lower() for pattern in self.include_patterns] + [f'/{year}/' for year in self.years]
+        )
+        # (?!) never matches, so an empty exclude list excludes nothing
+        exclude = trie_alternation(pattern.lower() for pattern in self.exclude_patterns) or '(?!)'
+
+        # Both lookaheads start at the beginning of the href, so each rule sees the whole string
+        self.regex = re.compile(rf'(?s)(?!.*?{exclude})(?=.*?(?:{include}|{DATE_PATH_PATTERN}))')
+        self._built_for = (as_of.date(), window_hours)
+
+    def _match(self, url: str) -> bool:
+        return url.startswith(URL_PREFIXES) and self.regex.match(url.lower()) is not None
+
+    def is_article_url(self, url: str, as_of: Optional[datetime] = None, window_hours: Optional[int] = None) -> bool:
+        """
+        Check if an href is an article link
+
+        Args:
+            url (str): href as found on the landing page
+            as_of (datetime): Run instant the window ends at; defaults to the fixed instant or now
+            window_hours (int): Size of the time window in hours; defaults to the classifier's
+
+        Returns:
+            bool: True if the link should be followed as an article
+        """
+        if not url:
+            return False
+        as_of = as_of or self.fixed_as_of or datetime.now(timezone.utc)
+        window_hours = self.window_hours if window_hours is None else window_hours
+        if (as_of.date(), window_hours) != self._built_for:
+            self._build(as_of, window_hours)
+        return self._match(url)
@@ -0,0 +1,69 @@
+"""
+URL canonicalization and stable article ID generation
+"""
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+
+# Query keys that only track where a click came from and never change the article
+TRACKING_QUERY_KEYS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid',
+    'cmpid', 'cid', 'iid', 'ref', '__source', 'taid', 'par'
+}
+
+
+def _is_tracking_key(key: str) -> bool:
+    key = key.lower()
+    return key.startswith('utm_') or key in TRACKING_QUERY_KEYS
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Reduce an absolute URL to a canonical form so the same article always yields the same string
+
+    Lowercases the scheme and host, drops default ports, the fragment and tracking query keys
+    (utm_* and similar), sorts the remaining query parameters, and removes a trailing slash
+    from non-root paths.
+
+    Args:
+        url (str): Absolute article URL
+
+    Returns:
+        str: Canonical URL
+    """
+    if not url:
+        return ""
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+
+    port = parts.port
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f"{host}:{port}"
+
+    path = parts.path or '/'
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/') or '/'
+
+    query_params = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking_key(key)]
+    query = urlencode(sorted(query_params))
+
+    return urlunsplit((scheme, host, path, query, ''))
+
+
+def generate_article_id(url: str) -> str:
+    """
+    Generate a stable article ID from the canonical form of its URL
+
+    Unlike the built-in hash(), which is salted per process, this yields the same ID on every run,
+    so it can key caches, dedup stores and indexes across runs.
+
+    Args:
+        url (str): Article URL
+
+    Returns:
+        str: 16-character hexadecimal BLAKE2b digest of the canonical URL
+    """
+    canonical = canonicalize_url(url)
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=8).hexdigest()
@@ -4,6 +4,7 @@ Data validation and default value assignment module
 from typing import Any, Dict, Optional
 from datetime import datetime
 from .logger import log_warning, log_error
+from .url_utils import generate_article_id
 
 
 def validate_article_data(data: Dict[str, Any]) -> bool:
@@ -61,7 +62,7 @@ def assign_default_values(data: Dict[str, Any]) -> Dict[str, Any]:
         Dict[str, Any]: Data with default values assigned where needed
     """
     defaults = {
-        'id': f"article_{hash(data.get('url', ''))}_{int(datetime.now().timestamp())}",
+        'id': generate_article_id(data['url']) if data.get('url') else f"article_{int(datetime.now().timestamp())}",
         'scraped_at': datetime.now(),
         'status': 'processed',
         'quality_score': 0.5,  # Default medium quality score
@@ -0,0 +1,70 @@
+"""
+Unit tests for the persistent seen-article store used for incremental crawling
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from src.utils.article_store import SeenArticleStore
+
+
+def test_record_and_skip_unchanged_link(tmp_path):
+    """Test that a recorded link with the same listing title is reported unchanged after reload"""
+    path = str(tmp_path / "seen.json")
+    store = SeenArticleStore(path)
+    url = "https://www.cnn.com/2025/11/03/business/story/index.html"
+
+    assert store.is_unchanged(url, "Markets rally on Monday") is False
+
+    store.record(url, "Markets rally on Monday", "hash-1", datetime.now(timezone.utc))
+    store.save()
+
+    reloaded = SeenArticleStore(path)
+    assert reloaded.is_unchanged(url, "  markets RALLY on monday ") is True
+    assert reloaded.has_same_content(url, "hash-1") is True
+    assert reloaded.has_same_content(url, "hash-2") is False
+
+
+def test_changed_listing_title_is_refetched(tmp_path):
+    """Test that an updated headline makes the link eligible for fetching again"""
+    store = SeenArticleStore(str(tmp_path / "seen.json"))
+    url = "https://www.cnbc.com/2025/11/03/story.html"
+    store.record(url, "Stocks open lower", "hash-1", datetime.now(timezone.utc))
+
+    assert store.is_unchanged(url, "Stocks close higher after late rally") is False
+
+
+def test_prune_removes_entries_outside_window(tmp_path):
+    """Test that entries whose publication date and last sighting are both too old are pruned"""
+    store = SeenArticleStore(str(tmp_path / "seen.json"), window_hours=72)
+    now = datetime.now(timezone.utc)
+
+    store.record("https://www.cnn.com/fresh", "Fresh story headline", "h1", now - timedelta(hours=10))
+    store.record("https://www.cnn.com/stale", "Stale story headline", "h2", now - timedelta(hours=100))
+    store.get("https://www.cnn.com/stale")['last_seen'] = (now - timedelta(hours=100)).isoformat()
+
+    removed = store.prune(now)
+
+    assert removed == 1
+    assert store.get("https://www.cnn.com/fresh") is not None
+    assert store.get("https://www.cnn.com/stale") is None
+
+
+def test_recirculated_headline_under_new_url_is_found(tmp_path):
+    """Test cross-run headline matches across URLs, limited to the same URL date and long headlines"""
+    path = str(tmp_path / "seen.json")
+    store = SeenArticleStore(path)
+    store.record("https://www.cnn.com/2025/11/03/business/fed-rates/index.html", "Fed holds rates steady again",
+                 "h1", datetime.now(timezone.utc))
+    store.record("https://www.cnbc.com/2025/11/03/watch.html", "Watch live", "h2", datetime.now(timezone.utc))
+    store.save()
+    reloaded = SeenArticleStore(path)
+
+    match = reloaded.find_recirculated("https://www.cnbc.com/2025/11/03/fed-holds.html", "FED holds rates  steady again")
+    assert match['url'] == "https://www.cnn.com/2025/11/03/business/fed-rates/index.html"
+    assert reloaded.find_recirculated("https://www.cnn.com/2025/11/03/business/fed-rates/index.html",
+                                      "Fed holds rates steady again") is None
+    assert reloaded.find_recirculated("https://www.cnbc.com/2025/11/04/fed-holds.html", "Fed holds rates steady again") is None
+    assert reloaded.find_recirculated("https://www.cnn.com/2025/11/03/watch.html", "Watch live") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -2,8 +2,8 @@
 Additional unit tests for date parsing functionality
 """
 import pytest
-from datetime import datetime
-from src.utils.date_parser import parse_article_date
+from datetime import datetime, timezone
+from src.utils.date_parser import parse_article_date, _parse_cached
 
 
 def test_parse_cnn_date_formats():
@@ -72,5 +72,38 @@ def test_parse_date_case_insensitive():
         assert result.day == 12
 
 
+def test_eastern_time_zones_convert_to_utc():
+    """Test that ET follows daylight saving time and EST/EDT are fixed offsets"""
+    cases = {
+        "Updated 10:32 AM EDT, Mon November 3, 2025": datetime(2025, 11, 3, 14, 32, tzinfo=timezone.utc),
+        "Published 6:00 AM EST, Tue November 4, 2025": datetime(2025, 11, 4, 11, 0, tzinfo=timezone.utc),
+        "Updated 12:05 PM ET, Mon July 7, 2025": datetime(2025, 7, 7, 16, 5, tzinfo=timezone.utc),
+        "5:30 PM ET Jan 12, 2025": datetime(2025, 1, 12, 22, 30, tzinfo=timezone.utc),
+        "Published Mon, Nov 3 2025 10:15 AM EST": datetime(2025, 11, 3, 15, 15, tzinfo=timezone.utc),
+        "12:00 AM EST, Mon November 3, 2025": datetime(2025, 11, 3, 5, 0, tzinfo=timezone.utc),
+        "Published: October 31, 2025 10:15 AM EST": datetime(2025, 10, 31, 15, 15, tzinfo=timezone.utc),
+    }
+
+    for date_str, expected in cases.items():
+        assert parse_article_date(date_str, "cnbc") == expected, date_str
+
+
+def test_iso_dates_are_returned_in_utc():
+    """Test the ISO-8601 fast path, including naive values read as UTC"""
+    assert parse_article_date("2025-11-03T10:15:00-05:00", "cnn") == datetime(2025, 11, 3, 15, 15, tzinfo=timezone.utc)
+    assert parse_article_date("2025-11-03T10:15:00.000Z", "cnn") == datetime(2025, 11, 3, 10, 15, tzinfo=timezone.utc)
+    assert parse_article_date("2025-11-03", "cnn") == datetime(2025, 11, 3, tzinfo=timezone.utc)
+
+
+def test_results_are_memoized():
+    """Test that repeated strings are answered from the memo"""
+    _parse_cached.cache_clear()
+    for _ in range(3):
+        parse_article_date("  2025-11-03T10:15:00Z ", "cnn")
+    info = _parse_cached.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -239,5 +239,50 @@ def test_normalized_title_handling():
     assert result2 is False  # Should be a duplicate after normalization
 
 
+def test_deduplicator_memory_is_bounded():
+    """Test that only the newest max_entries titles and content hashes are remembered"""
+    deduper = Deduplicator(max_entries=2)
+    
+    for index in range(3):
+        deduper.add_article(EnhancedNewsArticle(
+            id=str(index), title=f"Title {index}", content=f"Content {index}",
+            url=f"https://example.com/{index}", publication_date=datetime.now(), source="CNN"
+        ))
+    
+    assert list(deduper.unique_titles) == ["title 1", "title 2"]
+    assert len(deduper.content_hashes) == 2
+    assert not deduper.is_duplicate_title("Title 0")
+    assert deduper.is_duplicate_title("TITLE 2")
+
+
+def test_claim_listing_title_before_fetch():
+    """Test that a second link with a claimed or accepted headline is reported before it is fetched"""
+    deduper = Deduplicator()
+    
+    assert deduper.claim_listing_title("Fed holds rates steady", "https://www.cnn.com/a") is True
+    assert deduper.claim_listing_title("Fed holds rates steady", "https://www.cnn.com/a") is True
+    assert deduper.claim_listing_title("  FED holds rates steady ", "https://www.cnbc.com/b") is False
+    assert deduper.claim_listing_title("Watch live", "https://www.cnn.com/c") is True
+    assert deduper.claim_listing_title("Watch live", "https://www.cnbc.com/d") is True
+    
+    deduper.add_article(EnhancedNewsArticle(
+        id="1", title="Oil prices jump on supply fears", content="Body",
+        url="https://www.cnn.com/e", publication_date=datetime.now(), source="CNN"
+    ))
+    assert deduper.claim_listing_title("Oil prices jump on supply fears", "https://www.cnbc.com/f") is False
+
+
+def test_release_listing_title_frees_only_own_claim():
+    """Test that a released headline can be claimed by another link, but only its owner releases it"""
+    deduper = Deduplicator()
+    deduper.claim_listing_title("Fed holds rates steady", "https://www.cnn.com/a")
+    
+    deduper.release_listing_title("Fed holds rates steady", "https://www.cnbc.com/b")
+    assert deduper.claim_listing_title("Fed holds rates steady", "https://www.cnbc.com/b") is False
+    
+    deduper.release_listing_title("Fed holds rates steady", "https://www.cnn.com/a")
+    assert deduper.claim_listing_title("Fed holds rates steady", "https://www.cnbc.com/b") is True
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
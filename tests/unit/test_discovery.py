@@ -0,0 +1,94 @@
+"""
+Unit tests for landing-page link discovery shared by the CNN and CNBC parsers
+"""
+import pytest
+import httpx
+from datetime import datetime, timedelta, timezone
+from src.cnn_parser import get_cnn_articles
+from src.cnbc_parser import get_cnbc_articles
+
+
+class FakeFetcher:
+    """Serves fixed HTML for every URL without touching the network"""
+
+    def __init__(self, html):
+        self.html = html
+        self.requested = []
+
+    async def fetch(self, url):
+        self.requested.append(url)
+        return httpx.Response(200, text=self.html, request=httpx.Request('GET', url))
+
+
+TODAY = datetime.now(timezone.utc).strftime('%Y/%m/%d')
+
+CNN_LANDING = f"""
+<html><body>
+  <a href="/{TODAY}/business/markets-rally/index.html?utm_source=homepage">Markets rally as investors cheer earnings</a>
+  <a href="https://www.cnn.com/{TODAY}/business/markets-rally/index.html#comments">Markets rally as investors cheer earnings</a>
+  <a href="/{TODAY}/business/markets-rally/index.html">Read more about the markets rally today</a>
+  <a href="/{TODAY}/business/oil-prices/index.html">Oil prices slide on supply worries</a>
+  <a href="/video/some-clip">Watch this video clip right now please</a>
+</body></html>
+"""
+
+
+@pytest.mark.asyncio
+async def test_discovery_dedupes_canonical_urls():
+    """Test that tracking parameters, fragments and relative forms of one story are queued once"""
+    links = await get_cnn_articles(FakeFetcher(CNN_LANDING), set())
+
+    assert [link['url'] for link in links] == [
+        f"https://www.cnn.com/{TODAY}/business/markets-rally/index.html",
+        f"https://www.cnn.com/{TODAY}/business/oil-prices/index.html",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_discovery_shares_seen_urls_across_sources():
+    """Test that a URL already queued by one source is not queued again by another"""
+    seen_urls = {f"https://www.cnbc.com/{TODAY}/shared-story.html"}
+    html = f'<a href="https://www.cnbc.com/{TODAY}/shared-story.html?__source=x">Shared story headline for both</a>'
+
+    links = await get_cnbc_articles(FakeFetcher(html), seen_urls)
+
+    assert links == []
+
+
+
+@pytest.mark.asyncio
+async def test_discovery_prescreens_old_links():
+    """Test that links dated outside the window by URL or card timestamp are never queued"""
+    old_epoch_ms = int((datetime.now(timezone.utc) - timedelta(days=10)).timestamp() * 1000)
+    html = f"""
+    <a href="https://www.cnbc.com/2019/01/02/old-story.html">An old story from years ago headline</a>
+    <div data-last-updated="{old_epoch_ms}"><a href="https://www.cnbc.com/some-undated-story.html">Undated story with an old card timestamp</a></div>
+    <a href="https://www.cnbc.com/{TODAY}/fresh-story.html">A fresh story published today headline</a>
+    """
+
+    links = await get_cnbc_articles(FakeFetcher(html), set())
+
+    assert [link['url'] for link in links] == [f"https://www.cnbc.com/{TODAY}/fresh-story.html"]
+
+
+@pytest.mark.asyncio
+async def test_discovery_uses_run_instant_and_window():
+    """Test that the URL year segments and the prescreen follow the given run instant and window"""
+    as_of = datetime(2026, 1, 2, 12, tzinfo=timezone.utc)
+    html = """
+    <a href="/2025/12/29/business/late-december-story/index.html">A story from late December headline</a>
+    <a href="/2025/year-end-markets-wrap">Year end markets wrap headline text</a>
+    """
+
+    links = await get_cnn_articles(FakeFetcher(html), set(), as_of=as_of, window_hours=120)
+    assert [link['url'] for link in links] == [
+        "https://www.cnn.com/2025/12/29/business/late-december-story/index.html",
+        "https://www.cnn.com/2025/year-end-markets-wrap",
+    ]
+
+    links = await get_cnn_articles(FakeFetcher(html), set(), as_of=as_of, window_hours=24)
+    assert links == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,158 @@
+"""
+Unit tests for the head-first screening of article downloads
+"""
+import pytest
+import httpx
+from datetime import datetime, timedelta, timezone
+from src.utils.head_screen import HeadScreen, REASON_TOO_OLD, REASON_SEEN
+from src.utils.performance_optimizer import PerformanceOptimizer
+from src.utils.rate_limiter import HostRateLimiter
+from src.fetcher import Fetcher
+
+
+URL = "https://www.cnn.com/2025/11/03/business/story/index.html"
+AS_OF = datetime(2025, 11, 4, 12, 0, tzinfo=timezone.utc)
+
+
+def _page(published: datetime, canonical: str = URL, body_paragraphs: int = 200) -> bytes:
+    head = f"""<html><head><title>Story</title><link rel="canonical" href="{canonical}">
+<meta property="article:published_time" content="{published.isoformat()}"></head>"""
+    body = "<body><h1>Story</h1>" + "<p>Paragraph of the article body text.</p>" * body_paragraphs + "</body></html>"
+    return (head + body).encode("utf-8")
+
+
+def _feed_all(screen, page, chunk_size=64):
+    for start in range(0, len(page), chunk_size):
+        decision = screen.feed(page[start:start + chunk_size])
+        if decision is not None:
+            return decision, start + chunk_size
+    return None, len(page)
+
+
+def test_old_article_is_rejected_at_end_of_head():
+    """Test that a date outside the window rejects the page as soon as the head is complete"""
+    page = _page(AS_OF - timedelta(days=5))
+    decision, consumed = _feed_all(HeadScreen(URL, "cnn", as_of=AS_OF), page)
+
+    assert decision is False
+    assert consumed <= page.index(b"</head>") + 64 + len(b"</head>")
+
+
+def test_recent_article_is_accepted():
+    """Test that a date inside the window stops screening and keeps downloading"""
+    screen = HeadScreen(URL, "cnn", as_of=AS_OF)
+    decision, _ = _feed_all(screen, _page(AS_OF - timedelta(hours=2)))
+
+    assert decision is True
+    assert screen.reason is None
+
+
+def test_canonical_url_taken_by_another_link_is_rejected():
+    """Test that a page whose canonical URL is another link already taken this run is dropped"""
+    other = "https://www.cnn.com/2025/11/03/business/original-story/index.html"
+    screen = HeadScreen(URL, "cnn", seen_urls={URL, other}, as_of=AS_OF)
+
+    assert screen.decide(_page(AS_OF, canonical=other)) is False
+    assert screen.reason == REASON_SEEN
+    # A page that is its own canonical URL is not a duplicate of itself
+    assert HeadScreen(URL, "cnn", seen_urls={URL}, as_of=AS_OF).decide(_page(AS_OF)) is True
+
+
+def test_time_element_in_body_decides_when_head_has_no_date():
+    """Test that the first <time> element is used when the head carries no date"""
+    page = (b"<html><head><title>Story</title></head><body><h1>Story</h1>"
+            b"<time datetime=\"2025-10-01T10:00:00Z\">Oct 1</time>" + b"<p>text</p>" * 500 + b"</body></html>")
+    screen = HeadScreen(URL, "cnn", as_of=AS_OF)
+
+    assert screen.decide(page[:page.index(b"</head>") + 7]) is None
+    assert _feed_all(screen, page)[0] is False
+    assert screen.reason == REASON_TOO_OLD
+
+
+def test_undated_page_is_downloaded_after_screen_limit():
+    """Test that screening gives up and keeps downloading once the limit is reached"""
+    page = b"<html><head></head><body>" + b"<p>text</p>" * 1000 + b"</body></html>"
+    decision, consumed = _feed_all(HeadScreen(URL, "cnn", as_of=AS_OF, max_screen_bytes=4096), page)
+
+    assert decision is True
+    assert consumed == 4096
+
+
+def test_each_byte_is_parsed_once():
+    """Test that later decision points parse only the bytes received since the previous one"""
+    page = b"<html><head></head><body>" + b"<p>text</p><time>undated</time>" * 200 + b"</body></html>"
+    screen = HeadScreen(URL, "cnn", as_of=AS_OF)
+    parsed = []
+    decide = screen.decide
+    screen.decide = lambda prefix, encoding=None: parsed.append(len(prefix)) or decide(prefix, encoding)
+
+    assert _feed_all(screen, page)[0] is None
+    assert len(parsed) > 1
+    assert sum(parsed) == page.rindex(b"</time>") + len(b"</time>")
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    """Response body sent in chunks, counting how many were requested"""
+
+    def __init__(self, body: bytes, chunk_size: int = 512):
+        self.chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+        self.sent = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+
+async def _fetch_screened(page: bytes, screen: HeadScreen):
+    stream = _CountingStream(page)
+
+    def handler(request):
+        return httpx.Response(200, stream=stream, headers={'content-type': 'text/html; charset=utf-8',
+                                                           'content-length': str(len(page))})
+
+    original_client = httpx.AsyncClient
+
+    class MockClient(original_client):
+        def __init__(self, *args, **kwargs):
+            kwargs['transport'] = httpx.MockTransport(handler)
+            super().__init__(*args, **kwargs)
+
+    httpx.AsyncClient = MockClient
+    optimizer = PerformanceOptimizer()
+    try:
+        async with Fetcher(optimizer=optimizer, rate_limiter=HostRateLimiter(0, 0)) as fetcher:
+            response = await fetcher.fetch(URL, screen=screen)
+    finally:
+        httpx.AsyncClient = original_client
+    return response, stream, optimizer
+
+
+@pytest.mark.asyncio
+async def test_fetcher_cancels_old_article_after_head():
+    """Test that the streamed transfer stops after the head and the skipped bytes are reported"""
+    page = _page(datetime.now(timezone.utc) - timedelta(days=10))
+    response, stream, optimizer = await _fetch_screened(page, HeadScreen(URL, "cnn"))
+
+    assert response is None
+    assert stream.sent < len(stream.chunks)
+    assert optimizer.head_first_cancels == 1
+    assert 0 < optimizer.head_first_bytes_saved < len(page)
+    assert optimizer.get_performance_metrics().head_first_bytes_saved == optimizer.head_first_bytes_saved
+
+
+@pytest.mark.asyncio
+async def test_fetcher_streams_wanted_article_in_full():
+    """Test that an article inside the window is downloaded completely and unchanged"""
+    page = _page(datetime.now(timezone.utc) - timedelta(hours=1))
+    response, stream, optimizer = await _fetch_screened(page, HeadScreen(URL, "cnn"))
+
+    assert response.status_code == 200
+    assert response.content == page
+    assert response.charset_encoding == 'utf-8'
+    assert stream.sent == len(stream.chunks)
+    assert optimizer.head_first_cancels == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,100 @@
+"""
+Unit tests for parser backend selection and extraction parity across backends
+"""
+import json
+import pytest
+from pathlib import Path
+from src.utils.html_parsing import resolve_parser_backend, is_backend_available, make_soup, LISTING_LINK_FILTER
+from src.cnn_parser import parse_cnn_listing, parse_cnn_article
+from src.cnbc_parser import parse_cnbc_listing, parse_cnbc_article
+
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+BACKENDS = [name for name in ('html.parser', 'lxml') if is_backend_available(name)]
+
+ARTICLE_CASES = [
+    ('cnn_article', parse_cnn_article),
+    ('cnn_article_legacy', parse_cnn_article),
+    ('cnbc_article', parse_cnbc_article),
+    ('cnbc_article_fallback', parse_cnbc_article),
+]
+LISTING_CASES = [
+    ('cnn_landing', parse_cnn_listing),
+    ('cnbc_landing', parse_cnbc_listing),
+]
+
+
+def _load(name, expected_name=None):
+    html = (FIXTURES_DIR / "html" / f"{name}.html").read_text(encoding="utf-8")
+    expected = json.loads((FIXTURES_DIR / "expected" / f"{expected_name or name}.json").read_text(encoding="utf-8"))
+    return html, expected
+
+
+def test_auto_backend_prefers_lxml():
+    """Test that auto selection uses lxml when it is installed"""
+    expected = 'lxml' if is_backend_available('lxml') else 'html.parser'
+    assert resolve_parser_backend(None) == expected
+    assert resolve_parser_backend('html.parser') == 'html.parser'
+
+
+def test_unknown_backend_is_rejected():
+    """Test that an unsupported backend name raises instead of silently falling back"""
+    with pytest.raises(ValueError):
+        make_soup("<p>text</p>", backend="not-a-parser")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_listing_filter_builds_only_links_and_timestamped_cards(backend):
+    """Test that the landing-page filter skips page chrome but keeps the card around a link"""
+    html, _ = _load('cnbc_landing')
+    soup = make_soup(html, backend, parse_only=LISTING_LINK_FILTER)
+
+    assert soup.find('script') is None and soup.find('nav') is None
+    assert {tag.name for tag in soup.find_all(True)} <= {'a', 'div'}
+    card_link = soup.find('a', href="https://www.cnbc.com/2025/11/03/nvidia-shares-record-ai-spending.html")
+    assert card_link.parent['data-timestamp'] == "1762184521000"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("name,parse", ARTICLE_CASES)
+def test_article_extraction_matches_fixture(backend, name, parse):
+    """Test that article extraction output is identical to the saved fixture for every backend"""
+    html, expected = _load(name)
+    assert parse(html, expected['url'], backend) == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("name,parse", ARTICLE_CASES)
+def test_selector_cascade_matches_fixture(backend, name, parse):
+    """Test that the selector cascades alone still produce the saved fixture output"""
+    html, expected = _load(name, f"{name}.selectors")
+    assert parse(html, expected['url'], backend, structured_data=False) == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("name,parse", ARTICLE_CASES)
+def test_article_extraction_from_response_bytes(backend, name, parse):
+    """Test that parsing raw bytes with the declared charset matches parsing decoded text"""
+    html, expected = _load(name)
+    assert parse(html.encode('utf-8'), expected['url'], backend, encoding='utf-8') == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_declared_charset_is_used_for_byte_markup(backend):
+    """Test that a non-UTF-8 declared charset decodes the page correctly"""
+    markup = "<html><body><h1>Caf\u00e9 chain profits surge in Q3</h1><main><p>" + "Revenue climbed sharply for the caf\u00e9 chain. " * 3 + "</p></main></body></html>"
+    result = parse_cnn_article(markup.encode('cp1252'), "https://www.cnn.com/a", backend, encoding='cp1252')
+
+    assert result['title'] == "Caf\u00e9 chain profits surge in Q3"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("name,parse", LISTING_CASES)
+def test_listing_discovery_matches_fixture(backend, name, parse):
+    """Test that landing-page link discovery is identical to the saved fixture for every backend"""
+    html, expected = _load(name)
+    assert parse(html, backend) == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
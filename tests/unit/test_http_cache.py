@@ -0,0 +1,170 @@
+"""
+Unit tests for the persistent HTTP response cache and its use by the fetch layer
+"""
+import pytest
+import httpx
+from src.utils.http_cache import ResponseCache
+from src.utils.performance_optimizer import PerformanceOptimizer
+from src.utils.rate_limiter import HostRateLimiter
+from src.fetcher import Fetcher
+
+
+def test_store_and_conditional_headers(tmp_path):
+    """Test that responses with validators are stored and produce conditional headers"""
+    cache = ResponseCache(str(tmp_path), optimizer=PerformanceOptimizer())
+    url = "https://www.cnn.com/article"
+
+    cache.store(url, b"<html>body</html>", httpx.Headers({'etag': '"abc"', 'last-modified': 'Mon, 03 Nov 2025 10:00:00 GMT'}))
+    cache.save()
+
+    reloaded = ResponseCache(str(tmp_path), optimizer=PerformanceOptimizer())
+    entry = reloaded.get_entry(url)
+
+    assert entry is not None
+    assert reloaded.conditional_headers(entry) == {
+        'If-None-Match': '"abc"',
+        'If-Modified-Since': 'Mon, 03 Nov 2025 10:00:00 GMT'
+    }
+    assert reloaded.revalidated(url, entry)['body'] == b"<html>body</html>"
+
+
+def test_responses_without_validators_stay_in_memory(tmp_path):
+    """Test that responses without ETag/Last-Modified are only kept in the memory tier"""
+    optimizer = PerformanceOptimizer()
+    cache = ResponseCache(str(tmp_path), optimizer=optimizer)
+    url = "https://www.cnn.com/no-validators"
+
+    cache.store(url, b"body", httpx.Headers({}))
+
+    assert cache.get_entry(url) is None
+    assert cache.get_fresh(url)['body'] == b"body"
+    assert optimizer.cache_hits == 1
+
+
+def test_identical_bodies_share_one_object(tmp_path):
+    """Test that bodies are content-addressed so identical pages are stored once"""
+    cache = ResponseCache(str(tmp_path), optimizer=PerformanceOptimizer())
+    headers = httpx.Headers({'etag': '"same"'})
+
+    cache.store("https://www.cnn.com/a", b"same body", headers)
+    cache.store("https://www.cnn.com/b", b"same body", headers)
+
+    assert cache.index["https://www.cnn.com/a"]['digest'] == cache.index["https://www.cnn.com/b"]['digest']
+    assert len(list((tmp_path / "objects").rglob("*.zz"))) == 1
+
+
+def test_changed_body_replaces_the_old_object(tmp_path):
+    """Test that storing a new body for a URL deletes the object of the old one"""
+    cache = ResponseCache(str(tmp_path), optimizer=PerformanceOptimizer())
+    url = "https://www.cnn.com/article"
+
+    cache.store(url, b"first version", httpx.Headers({'etag': '"1"'}))
+    cache.store(url, b"second version", httpx.Headers({'etag': '"2"'}))
+
+    objects = list(cache.objects_dir.rglob("*.zz"))
+    assert len(objects) == 1
+    assert objects[0].stat().st_size == cache.total_size()
+
+
+def test_changed_body_keeps_an_object_still_shared(tmp_path):
+    """Test that the old body stays on disk while another URL still refers to it"""
+    cache = ResponseCache(str(tmp_path), optimizer=PerformanceOptimizer())
+    cache.store("https://www.cnn.com/a", b"shared body", httpx.Headers({'etag': '"1"'}))
+    cache.store("https://www.cnn.com/b", b"shared body", httpx.Headers({'etag': '"1"'}))
+
+    cache.store("https://www.cnn.com/a", b"new body", httpx.Headers({'etag': '"2"'}))
+
+    assert len(list(cache.objects_dir.rglob("*.zz"))) == 2
+    assert cache.revalidated("https://www.cnn.com/b", cache.get_entry("https://www.cnn.com/b"))['body'] == b"shared body"
+
+
+def test_objects_missing_from_the_index_are_swept_on_load(tmp_path):
+    """Test that bodies left behind by a lost index or an interrupted write are deleted"""
+    cache = ResponseCache(str(tmp_path), optimizer=PerformanceOptimizer())
+    cache.store("https://www.cnn.com/kept", b"kept body", httpx.Headers({'etag': '"1"'}))
+    cache.store("https://www.cnn.com/lost", b"lost body", httpx.Headers({'etag': '"2"'}))
+    del cache.index["https://www.cnn.com/lost"]
+    cache.index["https://www.cnn.com/gone"] = dict(cache.index["https://www.cnn.com/kept"], digest="0" * 64)
+    cache.save()
+    (cache.objects_dir / "ab").mkdir(exist_ok=True)
+    (cache.objects_dir / "ab" / "abcdef.tmp").write_bytes(b"partial")
+
+    reloaded = ResponseCache(str(tmp_path), optimizer=PerformanceOptimizer())
+
+    objects = [path for path in reloaded.objects_dir.rglob("*") if path.is_file()]
+    assert [path.stem for path in objects] == [reloaded.index["https://www.cnn.com/kept"]['digest']]
+    assert objects[0].stat().st_size == reloaded.total_size()
+    assert list(reloaded.index) == ["https://www.cnn.com/kept"]
+
+
+def test_lru_eviction(tmp_path):
+    """Test that the least recently used entries are evicted when the size bound is exceeded"""
+    optimizer = PerformanceOptimizer()
+    cache = ResponseCache(str(tmp_path), max_bytes=1, optimizer=optimizer)
+
+    cache.store("https://www.cnn.com/old", b"old body", httpx.Headers({'etag': '"1"'}))
+    cache.store("https://www.cnn.com/new", b"new body", httpx.Headers({'etag': '"2"'}))
+
+    assert "https://www.cnn.com/old" not in cache.index
+    assert optimizer.cache_evictions >= 1
+
+
+def test_eviction_keeps_bodies_still_referenced(tmp_path):
+    """Test that evicting one of two URLs sharing a body keeps the body for the other"""
+    cache = ResponseCache(str(tmp_path), optimizer=PerformanceOptimizer())
+    cache.store("https://www.cnn.com/a", b"shared body", httpx.Headers({'etag': '"1"'}))
+    cache.store("https://www.cnn.com/b", b"shared body", httpx.Headers({'etag': '"2"'}))
+    cache.store("https://www.cnn.com/c", b"other body", httpx.Headers({'etag': '"3"'}))
+    for last_access, url in enumerate(["https://www.cnn.com/a", "https://www.cnn.com/c", "https://www.cnn.com/b"]):
+        cache.index[url]['last_access'] = last_access
+    cache.max_bytes = cache.total_size() - 1
+
+    assert cache.evict() == 2
+    assert list(cache.index) == ["https://www.cnn.com/b"]
+    assert cache.get_entry("https://www.cnn.com/b") is not None
+
+
+@pytest.mark.asyncio
+async def test_fetcher_revalidates_with_conditional_request(tmp_path):
+    """Test that a cached page is revalidated and served from disk on 304 Not Modified"""
+    url = "https://www.cnn.com/article"
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(dict(request.headers))
+        if request.headers.get('if-none-match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"<html>cached page</html>", headers={'etag': '"v1"', 'content-type': 'text/html'})
+
+    original_client = httpx.AsyncClient
+
+    class MockClient(original_client):
+        def __init__(self, *args, **kwargs):
+            kwargs['transport'] = httpx.MockTransport(handler)
+            super().__init__(*args, **kwargs)
+
+    httpx.AsyncClient = MockClient
+    try:
+        # First run downloads the page
+        async with Fetcher(optimizer=PerformanceOptimizer(), rate_limiter=HostRateLimiter(0, 0),
+                           cache=ResponseCache(str(tmp_path), optimizer=PerformanceOptimizer())) as fetcher:
+            first = await fetcher.fetch(url)
+
+        # Second run revalidates instead of downloading again
+        optimizer = PerformanceOptimizer()
+        async with Fetcher(optimizer=optimizer, rate_limiter=HostRateLimiter(0, 0),
+                           cache=ResponseCache(str(tmp_path), optimizer=optimizer)) as fetcher:
+            second = await fetcher.fetch(url)
+            third = await fetcher.fetch(url)
+    finally:
+        httpx.AsyncClient = original_client
+
+    assert first.text == second.text == third.text == "<html>cached page</html>"
+    assert seen_headers[1]['if-none-match'] == '"v1"'
+    assert len(seen_headers) == 2  # Third fetch was served from the memory tier
+    assert optimizer.cache_revalidations == 1
+    assert optimizer.get_performance_metrics().cache_hit_rate == 1.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,97 @@
+"""
+Unit tests for MinHash signatures, the LSH index and near-duplicate removal
+"""
+import random
+import pytest
+from datetime import datetime, timezone
+from src.utils.minhash import (
+    shingle_hashes, minhash_signature, estimate_jaccard, signature_to_hex, signature_from_hex,
+    lsh_params, MinHashLSHIndex
+)
+from src.deduplication import remove_near_duplicates
+from src.models.article import EnhancedNewsArticle
+
+
+VOCABULARY = [f"word{i}" for i in range(3000)]
+
+
+def _text(rng, words=300):
+    return ' '.join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def _rewrite(rng, text, fraction):
+    words = text.split()
+    for position in rng.sample(range(len(words)), int(len(words) * fraction)):
+        words[position] = rng.choice(VOCABULARY)
+    return ' '.join(words)
+
+
+def _article(index, content, source="CNN"):
+    return EnhancedNewsArticle(
+        id=str(index), title=f"Article {index}", content=content, url=f"https://example.com/{index}",
+        publication_date=datetime.now(timezone.utc), source=source
+    )
+
+
+def test_signature_estimates_shingle_jaccard():
+    """Test that the one-permutation signature tracks the exact shingle Jaccard similarity"""
+    rng = random.Random(3)
+    base = _text(rng)
+    for fraction in (0.02, 0.1, 0.3):
+        copy = _rewrite(rng, base, fraction)
+        exact_a, exact_b = shingle_hashes(base), shingle_hashes(copy)
+        exact = len(exact_a & exact_b) / len(exact_a | exact_b)
+        assert abs(estimate_jaccard(minhash_signature(base), minhash_signature(copy)) - exact) < 0.12
+
+
+def test_signature_is_stable_and_normalized():
+    """Test that case and whitespace do not change the signature and that it round-trips through hex"""
+    signature = minhash_signature("Stocks  rallied\non Monday after the Fed decision")
+
+    assert signature == minhash_signature("stocks rallied on monday after the fed decision")
+    assert signature_from_hex(signature_to_hex(signature)) == signature
+    assert minhash_signature("   ") is None
+
+
+def test_lsh_params_follow_threshold():
+    """Test that a higher threshold uses fewer, longer bands"""
+    low_bands, low_rows = lsh_params(128, 0.3)
+    high_bands, high_rows = lsh_params(128, 0.9)
+
+    assert low_bands * low_rows <= 128 and high_bands * high_rows <= 128
+    assert high_rows > low_rows
+
+
+def test_index_returns_only_matches_above_threshold():
+    """Test that the index finds a light rewrite and ignores unrelated texts"""
+    rng = random.Random(5)
+    index = MinHashLSHIndex(threshold=0.5)
+    originals = [_text(rng) for _ in range(50)]
+    for key, text in enumerate(originals):
+        index.insert(key, index.signature(text))
+
+    assert index.query(index.signature(_rewrite(rng, originals[17], 0.05))) == [17]
+    assert index.query(index.signature(_text(rng))) == []
+    assert len(index) == 50
+
+
+def test_remove_near_duplicates_keeps_first_copy_and_fills_similarity_hash():
+    """Test that a rewritten copy on the other source is dropped and signatures are stored"""
+    rng = random.Random(7)
+    story = _text(rng)
+    articles = [
+        _article(1, story),
+        _article(2, _text(rng)),
+        _article(3, _rewrite(rng, story, 0.05), source="CNBC"),
+        _article(4, ""),
+    ]
+
+    unique = remove_near_duplicates(articles)
+
+    assert [article.id for article in unique] == ["1", "2", "4"]
+    assert signature_from_hex(articles[0].similarity_hash) == minhash_signature(story)
+    assert articles[3].similarity_hash is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
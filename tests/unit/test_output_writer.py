@@ -4,13 +4,18 @@ Unit tests for output writer functionality
 import pytest
 import os
 import tempfile
+import gzip
+import json
 from datetime import datetime
-from unittest.mock import patch, mock_open
+from unittest.mock import patch
 from src.output_writer import (
     generate_filename,
     format_article_markdown,
     write_to_markdown,
-    validate_output_requirements
+    validate_output_requirements,
+    MarkdownStreamWriter,
+    JsonlStreamWriter,
+    write_to_jsonl
 )
 from src.models.article import EnhancedNewsArticle
 
@@ -72,9 +77,7 @@ def test_format_article_markdown_empty_article():
     assert "**URL**" in formatted_content
 
 
-@patch('builtins.open', new_callable=mock_open)
-@patch('os.makedirs')
-def test_write_to_markdown_creates_file(mock_makedirs, mock_file):
+def test_write_to_markdown_creates_file(tmp_path):
     """Test that write_to_markdown creates a properly formatted Markdown file"""
     test_articles = [
         EnhancedNewsArticle(
@@ -94,16 +97,19 @@ def test_write_to_markdown_creates_file(mock_makedirs, mock_file):
             source="CNBC"
         )
     ]
+    output_file = str(tmp_path / "reports" / "test_output.md")
     
     # Test that the function creates a file with the correct content
-    result_path = write_to_markdown(test_articles, "test_output.md")
+    result_path = write_to_markdown(test_articles, output_file)
     
-    # Verify the file was opened for writing
-    mock_file.assert_called_once_with("test_output.md", 'w', encoding='utf-8')
+    # Verify the file was moved into place and no temporary file is left behind
+    assert result_path == os.path.abspath(output_file)
+    assert os.listdir(tmp_path / "reports") == ["test_output.md"]
     
     # Verify content was written
-    written_content = ''.join(call.args[0] for call in mock_file().write.call_args_list)
-    assert "# US Financial News Summary" in written_content
+    with open(output_file, encoding='utf-8') as f:
+        written_content = f.read()
+    assert written_content.count("# US Financial News Summary") == 1
     assert "Generated on:" in written_content
     assert "First Test Article" in written_content
     assert "Second Test Article" in written_content
@@ -111,6 +117,41 @@ def test_write_to_markdown_creates_file(mock_makedirs, mock_file):
     assert "CNBC" in written_content
 
 
+def test_stream_writer_renames_into_place_on_close(tmp_path):
+    """Test that articles stream into a temporary file that only replaces the output on close"""
+    output_file = tmp_path / "US_News_test.md"
+    output_file.write_text("previous run", encoding='utf-8')
+    writer = MarkdownStreamWriter(str(output_file))
+    
+    for index in range(3):
+        writer.write_article(EnhancedNewsArticle(
+            id=str(index), title=f"Streamed Article {index}", content="Body", url=f"https://example.com/{index}",
+            publication_date=datetime(2025, 11, 3, 8, 0, 0), source="CNN"
+        ))
+    
+    assert output_file.read_text(encoding='utf-8') == "previous run"
+    assert writer.close() == str(output_file.resolve())
+    content = output_file.read_text(encoding='utf-8')
+    assert content.index("Streamed Article 0") < content.index("Streamed Article 2")
+    assert writer.articles_written == 3
+    assert not os.path.exists(writer.tmp_path)
+
+
+def test_stream_writer_without_articles_or_aborted_leaves_no_file(tmp_path):
+    """Test that an empty writer creates nothing and an aborted one removes its temporary file"""
+    assert MarkdownStreamWriter(str(tmp_path / "empty.md")).close() == ""
+    
+    with pytest.raises(RuntimeError):
+        with MarkdownStreamWriter(str(tmp_path / "aborted.md")) as writer:
+            writer.write_article(EnhancedNewsArticle(
+                id="1", title="Aborted", content="Body", url="https://example.com/1",
+                publication_date=datetime(2025, 11, 3, 8, 0, 0), source="CNN"
+            ))
+            raise RuntimeError("scrape failed")
+    
+    assert os.listdir(tmp_path) == []
+
+
 def test_write_to_markdown_with_no_articles():
     """Test that write_to_markdown handles empty article list gracefully"""
     with patch('src.utils.logger.log_info') as mock_log:
@@ -143,6 +184,44 @@ def test_write_to_markdown_with_custom_filename():
         assert os.path.exists(custom_filename)
 
 
+def test_write_to_jsonl_writes_one_compact_record_per_article(tmp_path):
+    """Test the JSON Lines record fields and that a plain file is renamed into place"""
+    article = EnhancedNewsArticle(
+        id="abc", title="Fed holds rates", content="  Rates   unchanged. ", url="https://example.com/fed",
+        publication_date=datetime(2025, 11, 3, 14, 0, 0), source="CNBC",
+        scraped_at=datetime(2025, 11, 3, 15, 0, 0), quality_score=0.75
+    )
+    output_file = tmp_path / "news.jsonl"
+    
+    assert write_to_jsonl([article, article], str(output_file)) == str(output_file.resolve())
+    
+    lines = output_file.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 2 and ": " not in lines[0]
+    record = json.loads(lines[0])
+    assert record['id'] == "abc" and record['source'] == "CNBC" and record['url'] == "https://example.com/fed"
+    assert record['publication_date'] == "2025-11-03T14:00:00"
+    assert record['scraped_at'] == "2025-11-03T15:00:00"
+    assert record['quality_score'] == 0.75
+    assert len(record['content_hash']) == 64
+    assert os.listdir(tmp_path) == ["news.jsonl"]
+
+
+def test_jsonl_writer_appends_gzip_members(tmp_path):
+    """Test that appended gzip output reads back as one stream and unknown codecs are rejected"""
+    output_file = str(tmp_path / "news.jsonl.gz")
+    for run in range(2):
+        with JsonlStreamWriter(output_file, append=True, compression='gzip') as writer:
+            writer.write_article(EnhancedNewsArticle(
+                id=f"run-{run}", title="Title", content="Body", url="https://example.com/",
+                publication_date=datetime(2025, 11, 3, 8, 0, 0), source="CNN"
+            ))
+    
+    with gzip.open(output_file, 'rt', encoding='utf-8') as f:
+        assert [json.loads(line)['id'] for line in f] == ["run-0", "run-1"]
+    with pytest.raises(ValueError):
+        JsonlStreamWriter(output_file, compression='brotli')
+
+
 def test_validate_output_requirements_valid_articles():
     """Test that validate_output_requirements returns True for valid articles"""
     valid_articles = [
@@ -0,0 +1,45 @@
+"""
+Unit tests for running the pure parse functions in a process pool
+"""
+import json
+import pytest
+from pathlib import Path
+from src.utils.parse_pool import start_parse_pool, shutdown_parse_pool, run_parser, resolve_worker_count
+from src.cnn_parser import parse_cnn_article, parse_cnn_listing
+from src.cnbc_parser import parse_cnbc_article
+
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+def _load(name):
+    html = (FIXTURES_DIR / "html" / f"{name}.html").read_text(encoding="utf-8")
+    expected = json.loads((FIXTURES_DIR / "expected" / f"{name}.json").read_text(encoding="utf-8"))
+    return html, expected
+
+
+def test_worker_count_resolution():
+    """Test that None scales with the CPU count and 0 keeps parsing inline"""
+    assert resolve_worker_count(None) >= 1
+    assert resolve_worker_count(0) == 0
+    assert resolve_worker_count(3) == 3
+    assert start_parse_pool(0) is None
+
+
+@pytest.mark.asyncio
+async def test_pool_returns_the_same_results_as_inline_parsing():
+    """Test that pages parsed in worker processes match the saved fixture output"""
+    assert start_parse_pool(2) is not None
+    try:
+        for name, parse in (('cnn_article', parse_cnn_article), ('cnbc_article', parse_cnbc_article)):
+            html, expected = _load(name)
+            assert await run_parser(parse, html, expected['url']) == expected
+
+        html, expected = _load('cnn_landing')
+        assert await run_parser(parse_cnn_listing, html) == expected
+    finally:
+        shutdown_parse_pool()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -26,6 +26,7 @@ def test_performance_optimizer_initialization():
     assert optimizer.active_requests == 0
     assert optimizer.rate_limit_delays == 0
     assert optimizer.deduplication_savings == 0
+    assert optimizer.listing_title_skips == 0
 
 
 def test_estimate_memory_usage():
@@ -76,6 +77,18 @@ def test_cache_ttl_expiry():
     assert url not in optimizer.cache  # Expired item should be removed
 
 
+def test_cache_is_bounded_least_recently_used_first():
+    """Test that the in-memory cache forgets the least recently used entries past its bound"""
+    optimizer = PerformanceOptimizer(max_cache_entries=2)
+    
+    optimizer.cache_content("a", "content a")
+    optimizer.cache_content("b", "content b")
+    assert optimizer.get_cached_content("a") == "content a"
+    optimizer.cache_content("c", "content c")
+    
+    assert list(optimizer.cache) == ["a", "c"]
+
+
 def test_memory_usage_check():
     """Test memory usage check functionality"""
     optimizer = PerformanceOptimizer()
@@ -4,7 +4,7 @@ Unit tests for rate limiter functionality
 import pytest
 import asyncio
 import time
-from src.utils.rate_limiter import RateLimiter, rate_limit, get_rate_limiter
+from src.utils.rate_limiter import RateLimiter, HostRateLimiter, rate_limit, get_rate_limiter
 
 
 @pytest.mark.asyncio
@@ -86,5 +86,52 @@ async def test_rate_limiter_delay_range():
     assert elapsed >= 0.1
 
 
+@pytest.mark.asyncio
+async def test_host_rate_limiter_first_request_immediate():
+    """Test that the first request to each host does not wait"""
+    limiter = HostRateLimiter(min_delay=1.0, max_delay=1.5)
+    
+    start_time = time.time()
+    await limiter.wait_for_host("https://www.cnn.com/business")
+    await limiter.wait_for_host("https://www.cnbc.com/business/")
+    elapsed = time.time() - start_time
+    
+    assert elapsed < 0.1
+    assert limiter.delays_applied == 0
+
+
+@pytest.mark.asyncio
+async def test_host_rate_limiter_enforces_delay_per_host():
+    """Test that a second request to the same host waits for the next token"""
+    limiter = HostRateLimiter(min_delay=0.1, max_delay=0.15)
+    
+    await limiter.wait_for_host("https://www.cnn.com/a")
+    
+    start_time = time.time()
+    waited = await limiter.wait_for_host("https://www.cnn.com/b")
+    elapsed = time.time() - start_time
+    
+    assert elapsed >= 0.09
+    assert waited > 0
+    assert limiter.delays_applied == 1
+
+
+@pytest.mark.asyncio
+async def test_host_rate_limiter_hosts_run_in_parallel():
+    """Test that different hosts do not block each other"""
+    limiter = HostRateLimiter(min_delay=0.2, max_delay=0.2)
+    
+    async def two_requests(host):
+        await limiter.wait_for_host(host)
+        await limiter.wait_for_host(host)
+    
+    start_time = time.time()
+    await asyncio.gather(two_requests("www.cnn.com"), two_requests("www.cnbc.com"))
+    elapsed = time.time() - start_time
+    
+    # Each host waits one interval; serialised hosts would take twice as long
+    assert 0.19 <= elapsed < 0.35
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,225 @@
+"""
+Unit tests for the per-source scraping pipeline
+"""
+import pytest
+import asyncio
+import functools
+from datetime import datetime, timedelta, timezone
+from src import scraper
+from src.scraper import _scrape_source, scrape_news_sources
+from src.models.config import ScraperConfig
+from src.deduplication import Deduplicator
+from src.utils.article_store import SeenArticleStore
+
+
+def _make_links(count):
+    return [{'title': f"Listing headline number {i}", 'url': f"https://www.cnn.com/article-{i}"} for i in range(count)]
+
+
+def _make_extractor(delays, in_flight_log):
+    in_flight = {'count': 0}
+
+    async def extract_content(url, fetcher=None, screen=None):
+        index = int(url.rsplit('-', 1)[1])
+        in_flight['count'] += 1
+        in_flight_log.append(in_flight['count'])
+        await asyncio.sleep(delays[index])
+        in_flight['count'] -= 1
+        return {
+            'title': f"Article {index}",
+            'content': f"Content of article {index}",
+            'publication_date': datetime.now(timezone.utc).isoformat(),
+            'url': url,
+            'source': 'CNN'
+        }
+
+    return extract_content
+
+
+@pytest.mark.asyncio
+async def test_scrape_source_keeps_listing_order():
+    """Test that articles come back in listing order even when later ones finish first"""
+    links = _make_links(5)
+    delays = [0.05, 0.04, 0.03, 0.02, 0.01]
+
+    async def get_links(fetcher=None, seen_urls=None, as_of=None, window_hours=None):
+        return links
+
+    articles = await _scrape_source("CNN", get_links, _make_extractor(delays, []), None, ScraperConfig(max_concurrency=5))
+
+    assert [article.title for article in articles] == [f"Article {i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_scrape_source_respects_concurrency_limit():
+    """Test that no more than max_concurrency articles are in flight at once"""
+    links = _make_links(6)
+    in_flight_log = []
+
+    async def get_links(fetcher=None, seen_urls=None, as_of=None, window_hours=None):
+        return links
+
+    await _scrape_source("CNN", get_links, _make_extractor([0.01] * 6, in_flight_log), None, ScraperConfig(max_concurrency=2))
+
+    assert max(in_flight_log) == 2
+
+
+@pytest.mark.asyncio
+async def test_sources_share_a_streaming_deduplicator():
+    """Test that a second source drops articles whose title or body the first source already produced"""
+    deduplicator = Deduplicator()
+
+    async def get_links(fetcher=None, seen_urls=None, as_of=None, window_hours=None):
+        return _make_links(3)
+
+    await _scrape_source("CNN", get_links, _make_extractor([0, 0, 0], []), None, ScraperConfig(), deduplicator=deduplicator)
+
+    async def extract_cnbc(url, fetcher=None, screen=None):
+        index = int(url.rsplit('-', 1)[1])
+        return {
+            'title': ["  ARTICLE 0 ", "Rewritten headline", "New story"][index],
+            'content': ["Other body", "Content of article 1", "Fresh body"][index],
+            'publication_date': datetime.now(timezone.utc).isoformat(),
+            'url': url.replace("cnn", "cnbc"),
+            'source': 'CNBC'
+        }
+
+    articles = await _scrape_source("CNBC", get_links, extract_cnbc, None, ScraperConfig(), deduplicator=deduplicator)
+
+    assert [article.title for article in articles] == ["New story"]
+    assert deduplicator.is_duplicate_title("new  STORY")
+
+
+@pytest.mark.asyncio
+async def test_cross_posted_headline_is_not_fetched_twice():
+    """Test that a link whose listing headline another source already claimed is skipped before fetching"""
+    deduplicator = Deduplicator()
+    fetched = []
+
+    async def extract_content(url, fetcher=None, screen=None):
+        fetched.append(url)
+        return {
+            'title': url, 'content': f"Body of {url}", 'publication_date': datetime.now(timezone.utc).isoformat(),
+            'url': url, 'source': 'CNBC' if 'cnbc' in url else 'CNN'
+        }
+
+    async def cnn_links(fetcher=None, seen_urls=None, as_of=None, window_hours=None):
+        return [{'title': "Oil prices jump on supply fears", 'url': "https://www.cnn.com/oil"}]
+
+    async def cnbc_links(fetcher=None, seen_urls=None, as_of=None, window_hours=None):
+        return [{'title': "Oil prices JUMP on supply fears", 'url': "https://www.cnbc.com/oil"},
+                {'title': "Tech stocks slide", 'url': "https://www.cnbc.com/tech"}]
+
+    await _scrape_source("CNN", cnn_links, extract_content, None, ScraperConfig(), deduplicator=deduplicator)
+    articles = await _scrape_source("CNBC", cnbc_links, extract_content, None, ScraperConfig(), deduplicator=deduplicator)
+
+    assert fetched == ["https://www.cnn.com/oil", "https://www.cnbc.com/tech"]
+    assert [article.url for article in articles] == ["https://www.cnbc.com/tech"]
+
+
+@pytest.mark.asyncio
+async def test_scrape_source_releases_finished_prefix_in_listing_order():
+    """Test that articles reach the accept stage in listing order without waiting for slower later links"""
+    released = []
+
+    async def get_links(fetcher=None, seen_urls=None, as_of=None, window_hours=None):
+        return _make_links(4)
+
+    def accept(articles):
+        released.append([article.title for article in articles])
+        # The accept stage decides what the source returns
+        return [article for article in articles if article.title != "Article 0"]
+
+    articles = await _scrape_source("CNN", get_links, _make_extractor([0.02, 0.01, 0.01, 0.2], []), None,
+                                    ScraperConfig(max_concurrency=4), accept=accept)
+
+    assert released == [["Article 0", "Article 1", "Article 2"], ["Article 3"]]
+    assert [article.title for article in articles] == ["Article 1", "Article 2", "Article 3"]
+
+
+@pytest.mark.asyncio
+async def test_failed_link_releases_its_listing_headline():
+    """Test that a headline claimed by a link that fails to fetch does not block a later link"""
+    deduplicator = Deduplicator()
+
+    async def extract_content(url, fetcher=None, screen=None):
+        if 'cnn' in url:
+            return None
+        return {
+            'title': "Oil prices jump on supply fears", 'content': f"Body of {url}",
+            'publication_date': datetime.now(timezone.utc).isoformat(), 'url': url, 'source': 'CNBC'
+        }
+
+    async def cnn_links(fetcher=None, seen_urls=None, as_of=None, window_hours=None):
+        return [{'title': "Oil prices jump on supply fears", 'url': "https://www.cnn.com/oil"}]
+
+    async def cnbc_links(fetcher=None, seen_urls=None, as_of=None, window_hours=None):
+        return [{'title': "Oil prices jump on supply fears", 'url': "https://www.cnbc.com/oil"}]
+
+    assert await _scrape_source("CNN", cnn_links, extract_content, None, ScraperConfig(), deduplicator=deduplicator) == []
+    articles = await _scrape_source("CNBC", cnbc_links, extract_content, None, ScraperConfig(), deduplicator=deduplicator)
+
+    assert [article.url for article in articles] == ["https://www.cnbc.com/oil"]
+
+
+@pytest.mark.asyncio
+async def test_only_accepted_articles_are_recorded_as_seen(tmp_path):
+    """Test that links whose article was dropped or rejected stay eligible for later runs"""
+    seen_store = SeenArticleStore(str(tmp_path / "seen.json"))
+    ages = {'fresh': 1, 'old': 100, 'rejected': 1}
+
+    async def get_links(fetcher=None, seen_urls=None, as_of=None, window_hours=None):
+        return [{'title': f"Listing headline for {name}", 'url': f"https://www.cnn.com/{name}"} for name in ages]
+
+    async def extract_content(url, fetcher=None, screen=None):
+        name = url.rsplit('/', 1)[1]
+        return {
+            'title': f"Article {name}", 'content': f"Content of {name}", 'url': url, 'source': 'CNN',
+            'publication_date': (datetime.now(timezone.utc) - timedelta(hours=ages[name])).isoformat()
+        }
+
+    def accept(articles):
+        return [article for article in articles if not article.url.endswith('rejected')]
+
+    await _scrape_source("CNN", get_links, extract_content, None, ScraperConfig(head_first_fetch=False),
+                         seen_store=seen_store, accept=accept)
+
+    assert seen_store.is_unchanged("https://www.cnn.com/fresh", "Listing headline for fresh")
+    assert not seen_store.is_unchanged("https://www.cnn.com/old", "Listing headline for old")
+    assert not seen_store.is_unchanged("https://www.cnn.com/rejected", "Listing headline for rejected")
+
+
+@pytest.mark.asyncio
+async def test_scrape_news_sources_returns_cnn_then_cnbc(monkeypatch):
+    """Test that the result lists CNN articles before CNBC ones even when CNBC finishes first"""
+    async def links(fetcher=None, seen_urls=None, as_of=None, window_hours=None, site='cnn'):
+        return [{'title': f"{site} listing headline {i}", 'url': f"https://www.{site}.com/story-{i}"} for i in range(2)]
+
+    def extractor(delay, source):
+        async def extract_content(url, fetcher=None, screen=None):
+            await asyncio.sleep(delay)
+            return {
+                'title': f"{source} {url}", 'content': f"Distinct body of {url}",
+                'publication_date': datetime.now(timezone.utc).isoformat(), 'url': url, 'source': source
+            }
+        return extract_content
+
+    monkeypatch.setattr(scraper, "get_cnn_articles", links)
+    monkeypatch.setattr(scraper, "get_cnbc_articles", functools.partial(links, site='cnbc'))
+    monkeypatch.setattr(scraper, "extract_cnn_content", extractor(0.05, 'CNN'))
+    monkeypatch.setattr(scraper, "extract_cnbc_content", extractor(0, 'CNBC'))
+    config = ScraperConfig(cache_enabled=False, incremental=False, adaptive_selectors=False, head_first_fetch=False,
+                           near_duplicate_threshold=None, fingerprint_max_distance=None)
+    streamed = []
+
+    result = await scrape_news_sources(config, sink=streamed.append)
+
+    assert [article.source for article in streamed] == ['CNBC', 'CNBC', 'CNN', 'CNN']
+    assert [article.url for article in result.articles] == [
+        "https://www.cnn.com/story-0", "https://www.cnn.com/story-1",
+        "https://www.cnbc.com/story-0", "https://www.cnbc.com/story-1",
+    ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,43 @@
+"""
+Unit tests for the single-pass multi-selector matcher
+"""
+import pytest
+from pathlib import Path
+from bs4 import BeautifulSoup
+from src.utils.selector_matcher import SelectorMatcher
+from src.utils.html_parsing import is_backend_available
+from src.cnn_parser import CNN_CONTENT_SELECTORS, CNN_MAIN_CONTENT_SELECTORS
+from src.cnbc_parser import CNBC_CONTENT_SELECTORS, CNBC_MAIN_CONTENT_SELECTORS
+
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "html"
+BACKENDS = [name for name in ('html.parser', 'lxml') if is_backend_available(name)]
+ALL_SELECTORS = CNN_CONTENT_SELECTORS + CNN_MAIN_CONTENT_SELECTORS + CNBC_CONTENT_SELECTORS + CNBC_MAIN_CONTENT_SELECTORS
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("page", sorted(path.name for path in FIXTURES_DIR.glob("*.html")))
+def test_matches_equal_select_on_fixture_corpus(backend, page):
+    """Test that one walk finds exactly what soup.select finds for every selector, in the same order"""
+    soup = BeautifulSoup((FIXTURES_DIR / page).read_text(encoding="utf-8"), backend)
+    matched = SelectorMatcher(ALL_SELECTORS).match(soup)
+
+    for selector in ALL_SELECTORS:
+        assert matched[selector] == soup.select(selector), selector
+
+
+def test_nested_and_compound_selectors_keep_document_order():
+    """Test nested matches, compound selectors and selectors the prefilter cannot index"""
+    soup = BeautifulSoup("""
+    <main id="content"><div class="Body a" data-module="ArticleBody"><p class="x">one</p>
+    <div class="Body"><p>two</p></div></div><section><p class="x">three</p></section></main>
+    """, 'html.parser')
+    selectors = ['div[data-module="ArticleBody"]', '.Body', '#content', 'p', 'section > p.x', 'div p:first-child']
+    matched = SelectorMatcher(selectors).match(soup)
+
+    for selector in selectors:
+        assert matched[selector] == soup.select(selector), selector
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,71 @@
+"""
+Unit tests for persistent selector hit statistics and adaptive selector ordering
+"""
+import json
+import pytest
+from src.utils.selector_stats import SelectorStats
+from src.utils.performance_optimizer import PerformanceOptimizer
+from src.cnn_parser import parse_cnn_article, CNN_CONTENT_SELECTORS
+
+
+def test_order_is_static_until_warm_up_then_follows_hits(tmp_path):
+    """Test that selectors are reordered by hits only after the warm-up period"""
+    stats = SelectorStats(str(tmp_path / "stats.json"), warmup_pages=3)
+    selectors = ['.legacy', '.current', 'article']
+
+    for _ in range(2):
+        stats.record("CNN", {'content': '.current'})
+    assert stats.ordered_selectors("CNN", 'content', selectors) == selectors
+
+    stats.record("CNN", {'content': '.current'})
+    assert stats.ordered_selectors("CNN", 'content', selectors) == ['.current', '.legacy', 'article']
+
+
+def test_stats_persist_and_feed_run_metrics(tmp_path):
+    """Test that counts survive a reload and hit rates reach the performance metrics"""
+    path = str(tmp_path / "stats.json")
+    optimizer = PerformanceOptimizer()
+    stats = SelectorStats(path, optimizer=optimizer)
+    stats.record("CNBC", {'title': 'h1', 'date': None})
+    stats.record("CNBC", {'title': 'h1', 'date': 'time'})
+    stats.save()
+
+    reloaded = SelectorStats(path)
+
+    assert reloaded.stats["CNBC"]['title'] == {'pages': 2, 'hits': {'h1': 2}}
+    assert optimizer.get_performance_metrics().selector_hit_rates == {"CNBC": {'title': 1.0, 'date': 0.5}}
+
+
+def test_hit_rate_drop_is_reported(tmp_path):
+    """Test that a field whose hit rate collapses in this run triggers a warning"""
+    path = tmp_path / "stats.json"
+    path.write_text(json.dumps({"CNN": {'content': {'pages': 20, 'hits': {'.article__content': 19}}}}))
+    stats = SelectorStats(str(path))
+
+    for _ in range(4):
+        stats.record("CNN", {'content': None})
+
+    warnings = stats.check_hit_rates()
+    assert len(warnings) == 1 and "CNN content" in warnings[0]
+
+
+def test_learned_order_changes_which_selector_wins():
+    """Test that the parser tries selectors in the order it is given"""
+    html = """
+    <html><body><h1>Markets rally on rate hopes</h1>
+    <div class="zn-body__paragraph">Legacy body paragraph that is long enough to keep.</div>
+    <div class="article__content"><p>Current body paragraph that is long enough to keep.</p></div>
+    </body></html>
+    """
+    order = {'content': ['.zn-body__paragraph'] + [s for s in CNN_CONTENT_SELECTORS if s != '.zn-body__paragraph']}
+
+    static = parse_cnn_article(html, "https://www.cnn.com/a", structured_data=False)
+    learned = parse_cnn_article(html, "https://www.cnn.com/a", structured_data=False, selector_order=order)
+
+    assert static['content'].startswith("Current")
+    assert learned['content'].startswith("Legacy")
+    assert learned['matched_selectors']['content'] == '.zn-body__paragraph'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
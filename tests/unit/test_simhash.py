@@ -0,0 +1,96 @@
+"""
+Unit tests for SimHash fingerprints, the permuted-table index and the persistent fingerprint store
+"""
+import random
+import pytest
+from datetime import datetime, timezone, timedelta
+from src.utils.simhash import simhash, hamming_distance, fingerprint_to_hex, SimHashIndex, FingerprintStore
+from src.deduplication import remove_seen_rewrites
+from src.models.article import EnhancedNewsArticle
+
+
+VOCABULARY = [f"word{i}" for i in range(3000)]
+
+
+def _text(rng, words=400):
+    return ' '.join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def _rewrite(rng, text, fraction):
+    words = text.split()
+    for position in rng.sample(range(len(words)), int(len(words) * fraction)):
+        words[position] = rng.choice(VOCABULARY)
+    return ' '.join(words)
+
+
+def _article(index, content, url=None):
+    return EnhancedNewsArticle(
+        id=str(index), title=f"Article {index}", content=content, url=url or f"https://www.cnn.com/{index}",
+        publication_date=datetime.now(timezone.utc), source="CNN"
+    )
+
+
+def test_fingerprint_distance_separates_rewrites_from_unrelated_texts():
+    """Test that light rewrites stay within a few bits while unrelated bodies do not"""
+    rng = random.Random(2)
+    base = _text(rng)
+
+    assert simhash(base) == simhash(base.upper().replace(' ', '\n'))
+    assert hamming_distance(simhash(base), simhash(_rewrite(rng, base, 0.01))) <= 6
+    assert hamming_distance(simhash(base), simhash(_text(rng))) > 6
+    assert len(fingerprint_to_hex(simhash(base))) == 16
+    assert simhash("  ") is None
+
+
+def test_index_finds_every_fingerprint_within_distance():
+    """Test that the block tables return exactly the stored fingerprints within max_distance bits"""
+    rng = random.Random(4)
+    index = SimHashIndex(max_distance=3)
+    query = rng.getrandbits(64)
+    for key, flips in enumerate([0, 1, 3, 4, 10]):
+        fingerprint = query
+        for bit in rng.sample(range(64), flips):
+            fingerprint ^= 1 << bit
+        index.insert(key, fingerprint)
+
+    assert index.query(query) == [(0, 0), (1, 1), (2, 3)]
+
+    index.remove(1)
+    assert [key for key, distance in index.query(query)] == [0, 2]
+    assert len(index) == 4
+
+
+def test_store_suppresses_rewrites_from_an_earlier_run(tmp_path):
+    """Test that fingerprints persist between runs and updated copies are skipped"""
+    rng = random.Random(6)
+    story, other = _text(rng), _text(rng)
+    path = tmp_path / "fingerprints.json"
+
+    first_run = FingerprintStore(str(path))
+    kept = remove_seen_rewrites([_article(1, story)], first_run)
+    first_run.save()
+    assert kept[0].content_fingerprint == fingerprint_to_hex(simhash(story))
+
+    second_run = FingerprintStore(str(path))
+    articles = [_article(2, _rewrite(rng, story, 0.01), url="https://www.cnbc.com/2"), _article(3, other)]
+    assert [article.id for article in remove_seen_rewrites(articles, second_run)] == ["3"]
+    assert len(second_run.entries) == 2
+
+
+def test_store_prunes_old_entries_and_ignores_corrupt_files(tmp_path):
+    """Test expiry by publication date and last-seen time, and recovery from an unreadable file"""
+    path = tmp_path / "fingerprints.json"
+    store = FingerprintStore(str(path))
+    store.record("https://www.cnn.com/old", 1, datetime.now(timezone.utc) - timedelta(days=10))
+    store.entries[next(iter(store.entries))]['last_seen'] = (datetime.now(timezone.utc) - timedelta(days=10)).isoformat()
+    store.record("https://www.cnn.com/new", (1 << 64) - 2, datetime.now(timezone.utc))
+
+    assert store.prune() == 1
+    assert store.index.query(1) == [] and len(store.index) == 1
+
+    path.write_text("{not json", encoding='utf-8')
+    assert FingerprintStore(str(path)).entries == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,61 @@
+"""
+Unit tests for JSON-LD and meta-tag extraction
+"""
+import pytest
+from bs4 import BeautifulSoup
+from src.utils.structured_data import extract_structured_fields, classify_extraction_path
+
+
+def _soup(html):
+    return BeautifulSoup(html, 'html.parser')
+
+
+def test_json_ld_graph_takes_precedence_over_meta_tags():
+    """Test that a NewsArticle inside an @graph wins over og: and article: meta tags"""
+    soup = _soup("""
+    <html><head>
+    <meta property="og:title" content="Meta title">
+    <meta property="article:published_time" content="2025-11-01T00:00:00Z">
+    <script type="application/ld+json">{"@graph": [{"@type": "WebPage"},
+        {"@type": ["NewsArticle"], "headline": "JSON-LD  title", "datePublished": "2025-11-03T10:00:00Z",
+         "articleBody": "Body text"}]}</script>
+    </head><body></body></html>
+    """)
+
+    fields = extract_structured_fields(soup)
+
+    assert fields == {'title': "JSON-LD title", 'publication_date': "2025-11-03T10:00:00Z", 'content': "Body text"}
+    assert classify_extraction_path(fields) == "structured"
+
+
+def test_meta_tags_fill_missing_fields_and_bad_json_is_ignored():
+    """Test that meta tags fill in for missing JSON-LD and malformed blocks are skipped"""
+    soup = _soup("""
+    <html><head>
+    <script type="application/ld+json">{not json</script>
+    <meta property="og:title" content="Meta title">
+    <meta property="article:published_time" content="2025-11-01T00:00:00Z">
+    </head><body></body></html>
+    """)
+
+    fields = extract_structured_fields(soup)
+
+    assert fields == {'title': "Meta title", 'publication_date': "2025-11-01T00:00:00Z"}
+    assert classify_extraction_path(fields) == "mixed"
+    assert classify_extraction_path({}) == "selectors"
+
+
+def test_first_meta_tag_wins_regardless_of_case():
+    """Test that a later meta tag differing only in attribute case does not override the first"""
+    soup = _soup("""
+    <html><head>
+    <meta property="og:title" content="First title">
+    <meta property="OG:Title" content="Second title">
+    </head><body></body></html>
+    """)
+
+    assert extract_structured_fields(soup) == {'title': "First title"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,98 @@
+"""
+Unit tests for batch time-window filtering against a run-level cutoff
+"""
+import math
+import pytest
+import asyncio
+from datetime import datetime, timedelta, timezone
+from src.utils.date_filter import (
+    to_epoch_array, window_mask, filter_within_window, is_within_72_hours, DEFAULT_WINDOW_HOURS
+)
+from src.utils import date_parser
+from src.models.article import EnhancedNewsArticle
+from src.models.config import ScraperConfig
+from src.scraper import _scrape_source
+
+
+AS_OF = datetime(2025, 11, 4, 12, 0, tzinfo=timezone.utc)
+
+
+def _article(index, publication_date):
+    return EnhancedNewsArticle(
+        id=str(index), title=f"Article {index}", content="Content", url=f"https://www.cnn.com/article-{index}",
+        publication_date=publication_date, source="CNN"
+    )
+
+
+def test_mask_uses_one_cutoff_for_the_batch():
+    """Test the window boundaries, naive values read as UTC, other offsets and missing dates"""
+    dates = [
+        AS_OF - timedelta(hours=DEFAULT_WINDOW_HOURS),  # Exactly on the cutoff
+        AS_OF - timedelta(hours=DEFAULT_WINDOW_HOURS, seconds=1),
+        (AS_OF - timedelta(hours=1)).replace(tzinfo=None),
+        (AS_OF - timedelta(hours=80)).astimezone(timezone(timedelta(hours=-5))),
+        AS_OF + timedelta(hours=1),  # Clock skew on the source side still counts as recent
+        None,
+    ]
+    epochs = to_epoch_array(dates)
+
+    assert epochs.typecode == 'd'
+    assert math.isnan(epochs[-1])
+    assert window_mask(epochs, AS_OF) == [True, False, True, False, True, False]
+    assert window_mask(epochs, AS_OF, window_hours=100) == [True, True, True, True, True, False]
+
+
+def test_filter_within_window_keeps_order():
+    """Test that articles inside the window are kept in their original order"""
+    articles = [_article(i, AS_OF - timedelta(hours=hours)) for i, hours in enumerate([1, 100, 30, 73, 0])]
+
+    kept = filter_within_window(articles, AS_OF)
+
+    assert [article.id for article in kept] == ['0', '2', '4']
+
+
+def test_is_within_72_hours_accepts_run_instant():
+    """Test that the single-date check agrees with the batch filter for a given run instant"""
+    assert is_within_72_hours(AS_OF - timedelta(hours=72), as_of=AS_OF) is True
+    assert is_within_72_hours(AS_OF - timedelta(hours=73), as_of=AS_OF) is False
+    assert is_within_72_hours(None, as_of=AS_OF) is False
+
+
+def test_date_parser_window_check_is_the_same_engine():
+    """Test that the date_parser entry point agrees with the batch filter at the window boundary"""
+    for hours in (71, 72, 73):
+        pub_date = AS_OF - timedelta(hours=hours)
+        expected = window_mask(to_epoch_array([pub_date]), AS_OF)[0]
+        assert date_parser.is_within_72_hours(pub_date, as_of=AS_OF) is expected
+
+
+@pytest.mark.asyncio
+async def test_scrape_source_judges_articles_against_run_instant():
+    """Test that the scraper filters with the as_of instant of the run and the configured window"""
+    ages = [1, 50, 80]
+
+    async def get_links(fetcher=None, seen_urls=None, as_of=None, window_hours=None):
+        return [{'title': f"Listing headline number {i}", 'url': f"https://www.cnn.com/article-{i}"} for i in range(3)]
+
+    async def extract_content(url, fetcher=None, screen=None):
+        index = int(url.rsplit('-', 1)[1])
+        await asyncio.sleep(0)
+        return {
+            'title': f"Article {index}",
+            'content': f"Content of article {index}",
+            'publication_date': (AS_OF - timedelta(hours=ages[index])).isoformat(),
+            'url': url,
+            'source': 'CNN'
+        }
+
+    articles = await _scrape_source("CNN", get_links, extract_content, None,
+                                    ScraperConfig(head_first_fetch=False), as_of=AS_OF)
+    assert [article.title for article in articles] == ["Article 0", "Article 1"]
+
+    articles = await _scrape_source("CNN", get_links, extract_content, None,
+                                    ScraperConfig(head_first_fetch=False, window_hours=24), as_of=AS_OF)
+    assert [article.title for article in articles] == ["Article 0"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
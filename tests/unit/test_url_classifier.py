@@ -0,0 +1,98 @@
+"""
+Unit tests for the compiled article-link classifier
+"""
+import re
+import pytest
+from datetime import datetime, timezone
+from pathlib import Path
+from bs4 import BeautifulSoup
+from src.utils.url_classifier import UrlClassifier, window_years
+from src.cnn_parser import CNN_URL_INCLUDE_PATTERNS, CNN_URL_EXCLUDE_PATTERNS
+from src.cnbc_parser import CNBC_URL_INCLUDE_PATTERNS, CNBC_URL_EXCLUDE_PATTERNS
+
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "html"
+AS_OF = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+RULES = {
+    'cnn': (CNN_URL_INCLUDE_PATTERNS, CNN_URL_EXCLUDE_PATTERNS),
+    'cnbc': (CNBC_URL_INCLUDE_PATTERNS, CNBC_URL_EXCLUDE_PATTERNS),
+}
+EXTRA_HREFS = [
+    "", "/", "#", "mailto:desk@example.com", "javascript:void(0)",
+    "https://www.cnn.com/2025/06/01/business/story/index.html",
+    "https://www.cnn.com/2023/06/01/business/old-story",
+    "https://www.cnn.com/2024/markets-overview",
+    "https://www.cnn.com/2025/markets-overview",
+    "https://www.cnn.com/VIDEOS/business/2025/06/01/clip",
+    "https://www.cnn.com/Business/Story",
+    "HTTPS://www.cnn.com/business/story",
+    "./news/story", "../articles/story", "news/story",
+    "/2025/06/01/markets/story.PDF",
+    "https://www.cnbc.com/2025/06/01/stocks-live-updates.html",
+    "https://www.cnbc.com/quotes/AAPL",
+    "https://www.cnbc.com/id-12345",
+    "/investing/\nline-break",
+]
+
+
+def reference_is_article_url(url, include_patterns, exclude_patterns, years):
+    """The substring rules the classifier replaces, with the year segments passed in"""
+    if not url:
+        return False
+    patterns = [f'/{year}/' for year in years] + include_patterns
+    is_valid_path = any(pattern in url.lower() for pattern in patterns)
+    is_not_excluded = not any(skip_pattern in url.lower() for skip_pattern in exclude_patterns)
+    is_article_url = bool(re.search(r'/\d{4}/\d{2}/\d{2}/', url))
+    return (is_valid_path or is_article_url) and is_not_excluded and url.startswith(('http', '/', '../', './'))
+
+
+def fixture_hrefs():
+    hrefs = []
+    for path in sorted(FIXTURES_DIR.glob("*.html")):
+        soup = BeautifulSoup(path.read_text(encoding="utf-8"), 'html.parser')
+        hrefs.extend(a['href'] for a in soup.find_all('a', href=True))
+    return hrefs
+
+
+@pytest.mark.parametrize("source", sorted(RULES))
+def test_matches_substring_rules(source):
+    """Test that the single regex agrees with the substring rules on every fixture and edge-case href"""
+    include, exclude = RULES[source]
+    classifier = UrlClassifier(include, exclude, as_of=AS_OF)
+
+    for href in fixture_hrefs() + EXTRA_HREFS:
+        expected = reference_is_article_url(href, include, exclude, classifier.years)
+        assert classifier.is_article_url(href) == expected, href
+
+
+def test_year_segments_follow_the_time_window():
+    """Test that /yyyy/ segments come from the date instead of a hardcoded list"""
+    assert window_years(AS_OF) == {2025}
+    assert window_years(datetime(2026, 1, 2, tzinfo=timezone.utc)) == {2025, 2026}
+    assert window_years(datetime(2026, 12, 31, 12, tzinfo=timezone.utc)) == {2026, 2027}
+
+    classifier = UrlClassifier(CNN_URL_INCLUDE_PATTERNS, CNN_URL_EXCLUDE_PATTERNS,
+                               as_of=datetime(2027, 3, 1, tzinfo=timezone.utc))
+    assert classifier.is_article_url("https://www.cnn.com/2027/markets-overview")
+    assert not classifier.is_article_url("https://www.cnn.com/2025/markets-overview")
+
+
+def test_rebuilds_when_the_date_changes():
+    """Test that a long-running classifier picks up the new year after the date changes"""
+    classifier = UrlClassifier(CNN_URL_INCLUDE_PATTERNS, CNN_URL_EXCLUDE_PATTERNS)
+    classifier._build(datetime(2020, 6, 1, tzinfo=timezone.utc), 72)
+    assert classifier.years == [2020]
+
+    classifier.is_article_url("https://www.cnn.com/business/story")
+    assert datetime.now(timezone.utc).year in classifier.years
+
+
+def test_uses_the_given_run_instant_and_window():
+    """Test that an explicit run instant and window override the classifier's own"""
+    classifier = UrlClassifier(CNN_URL_INCLUDE_PATTERNS, CNN_URL_EXCLUDE_PATTERNS, as_of=AS_OF)
+    as_of = datetime(2026, 1, 2, 12, tzinfo=timezone.utc)
+
+    assert classifier.is_article_url("https://www.cnn.com/2025/markets-wrap", as_of, 120)
+    assert classifier.years == [2025, 2026]
+    assert not classifier.is_article_url("https://www.cnn.com/2025/markets-wrap", as_of, 24)
+    assert classifier.years == [2026]
@@ -0,0 +1,42 @@
+"""
+Unit tests for URL canonicalization and stable article IDs
+"""
+import pytest
+from src.utils.url_utils import canonicalize_url, generate_article_id
+
+
+def test_canonicalize_url_normalizes_host_fragment_and_trailing_slash():
+    """Test that cosmetic URL differences collapse to one canonical form"""
+    variants = [
+        "https://www.cnn.com/2025/11/03/business/story/index.html",
+        "HTTPS://WWW.CNN.COM/2025/11/03/business/story/index.html#comments",
+        "https://www.cnn.com:443/2025/11/03/business/story/index.html",
+    ]
+
+    assert {canonicalize_url(url) for url in variants} == {"https://www.cnn.com/2025/11/03/business/story/index.html"}
+    assert canonicalize_url("https://www.cnbc.com/business/") == "https://www.cnbc.com/business"
+
+
+def test_canonicalize_url_drops_tracking_parameters():
+    """Test that utm_* and similar tracking keys are removed while real parameters are kept"""
+    url = "https://www.cnbc.com/2025/11/03/story.html?utm_source=twitter&page=2&__source=newsletter&UTM_medium=x"
+
+    assert canonicalize_url(url) == "https://www.cnbc.com/2025/11/03/story.html?page=2"
+
+
+def test_generate_article_id_is_stable_across_runs():
+    """Test that IDs do not depend on the per-process string hash salt"""
+    url = "https://www.cnn.com/2025/11/03/business/story/index.html"
+
+    # Fixed value: the same ID must come out of every process
+    assert generate_article_id(url) == "1a29bb79953436e9"
+    assert generate_article_id(url + "#top") == generate_article_id(url)
+
+
+def test_generate_article_id_differs_for_different_articles():
+    """Test that different articles get different IDs"""
+    assert generate_article_id("https://www.cnn.com/a") != generate_article_id("https://www.cnn.com/b")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])